@@ -1,5 +1,9 @@
 """
-채용 시장 분석 시스템 - 설정 파일
+채용 시장 분석 시스템 - 레거시 크롤러 설정
+
+crawlers/base.py, crawlers/manager.py 계열(CrawlerManager) 전용 설정.
+config 패키지와 이름이 겹쳐 최상위 config.py로는 import되지 않으므로
+패키지 하위 모듈로 둔다.
 """
 import os
 from dataclasses import dataclass, field
@@ -7,7 +11,7 @@ from typing import List, Dict, Optional
 from pathlib import Path
 
 # 프로젝트 루트 경로
-PROJECT_ROOT = Path(__file__).parent
+PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 LOGS_DIR = PROJECT_ROOT / "logs"
 OUTPUTS_DIR = PROJECT_ROOT / "outputs"
@@ -37,6 +41,8 @@ class CrawlerConfig:
     max_retries: int = 3
     timeout: int = 30
     max_pages: int = 10  # 사이트당 최대 페이지
+    detail_workers: int = 4  # 상세 정보 동시 요청 수 (요청 간격은 request_delay로 유지)
+    detail_cache_ttl: int = 86400  # 상세 조회 캐시 유효 시간 (초, 0이면 캐시 사용 안 함)
     
     # User-Agent
     user_agent: str = (
@@ -4,8 +4,9 @@ Windows/Linux 로컬 및 클라우드 환경 모두 지원
 """
 
 import os
+import logging
 from pathlib import Path
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, replace
 from typing import Optional
 import json
 
@@ -15,6 +16,8 @@ from dotenv import load_dotenv
 # 프로젝트 루트 경로
 PROJECT_ROOT = Path(__file__).parent.parent
 
+logger = logging.getLogger(__name__)
+
 # .env 파일 로드 (프로젝트 루트에서)
 load_dotenv(PROJECT_ROOT / '.env')
 DATA_DIR = PROJECT_ROOT / "data"
@@ -33,6 +36,8 @@ class CrawlerConfig:
     max_retries: int = 3
     timeout: int = 30
     max_pages_per_keyword: int = 10  # 키워드당 최대 크롤링 페이지 수
+    detail_workers: int = 4  # 상세 페이지 동시 요청 수
+    detail_cache_ttl: int = 86400  # 상세 페이지 캐시 유효 시간 (초, 0이면 캐시 사용 안 함)
 
 
 @dataclass
@@ -166,15 +171,28 @@ class NewsConfig:
 
     # 대기 시간 (초)
     page_load_delay: float = float(os.getenv("NEWS_PAGE_LOAD_DELAY", "3.0"))
-    article_delay: float = float(os.getenv("NEWS_ARTICLE_DELAY", "1.0"))
     scroll_delay: float = float(os.getenv("NEWS_SCROLL_DELAY", "0.5"))
 
+    # 요청 속도 제한 (초당 요청 수, 한 번에 몰아서 보낼 수 있는 최대 요청 수)
+    request_rate: float = float(os.getenv("NEWS_REQUEST_RATE", "2.0"))
+    request_burst: int = int(os.getenv("NEWS_REQUEST_BURST", "4"))
+
+    # 기사 상세 페이지 동시 수집 탭 수
+    detail_concurrency: int = int(os.getenv("NEWS_DETAIL_CONCURRENCY", "4"))
+    # 동시에 수집할 회사 수 (1이면 순차 처리)
+    company_concurrency: int = int(os.getenv("NEWS_COMPANY_CONCURRENCY", "3"))
+
     # 스크롤 설정
     scroll_distance: int = int(os.getenv("NEWS_SCROLL_DISTANCE", "200"))  # 픽셀
     scroll_interval: int = int(os.getenv("NEWS_SCROLL_INTERVAL", "300"))  # 밀리초
 
     # 기타 설정
     headless: bool = os.getenv("NEWS_HEADLESS", "true").lower() == "true"
+    block_resources: bool = os.getenv("NEWS_BLOCK_RESOURCES", "true").lower() == "true"  # 이미지/폰트/광고 요청 차단
+
+    # 브라우저 디스크 캐시 (실행 간 사이트 JS/CSS 재사용, 빈 문자열이면 사용 안 함)
+    browser_cache_dir: str = os.getenv("NEWS_BROWSER_CACHE_DIR", str(DATA_DIR / "browser_cache"))
+    browser_cache_size: int = int(os.getenv("NEWS_BROWSER_CACHE_SIZE", str(512 * 1024 * 1024)))  # 바이트
 
 
 @dataclass
@@ -251,6 +269,69 @@ class SearchKeywords:
         return self.get_combined_keywords() if self.combine_all else self.job_keywords
 
 
+# 설정 파일 검증용 스키마 (dataclass 필드 타입에서 한 번만 생성)
+_KEYWORD_KEYS = ('job_keywords', 'experience_keywords', 'location_keywords', 'combine_all', 'sites')
+_TOP_LEVEL_TYPES = {
+    'job_keywords': list,
+    'experience_keywords': list,
+    'location_keywords': list,
+    'keywords': list,
+    'combine_all': bool,
+    'sites': dict,
+    'crawler': dict,
+    'jobplanet': dict,
+}
+_SECTION_FIELD_TYPES = {
+    section: {f.name: f.type for f in fields(config_cls)}
+    for section, config_cls in (('crawler', CrawlerConfig), ('jobplanet', JobplanetConfig))
+}
+
+
+def _check_type(path: str, value, expected: type):
+    """값 타입 확인 (float 필드는 int 허용, int 필드는 bool 불허)"""
+    if expected is float and isinstance(value, int) and not isinstance(value, bool):
+        return
+    if expected is int and isinstance(value, bool):
+        raise ValueError(f"설정 오류: '{path}'는 {expected.__name__} 타입이어야 합니다 (값: {value!r})")
+    if not isinstance(value, expected):
+        raise ValueError(f"설정 오류: '{path}'는 {expected.__name__} 타입이어야 합니다 (값: {value!r})")
+
+
+def _validate_config(config: dict) -> dict:
+    """
+    설정 파일 내용 검증 - 잘못된 타입이면 ValueError, 알 수 없는 키는 경고 후 무시
+
+    Returns:
+        알 수 없는 키를 제외한 설정
+    """
+    if not isinstance(config, dict):
+        raise ValueError("설정 오류: 최상위 값은 객체여야 합니다")
+
+    validated = {}
+    for key, value in config.items():
+        expected = _TOP_LEVEL_TYPES.get(key)
+        if expected is None:
+            logger.warning(f"설정 경고: 알 수 없는 키 '{key}' 무시")
+            continue
+        _check_type(key, value, expected)
+        validated[key] = value
+
+    for section, field_types in _SECTION_FIELD_TYPES.items():
+        if section not in validated:
+            continue
+        section_values = {}
+        for key, value in validated[section].items():
+            expected = field_types.get(key)
+            if expected is None:
+                logger.warning(f"설정 경고: 알 수 없는 키 '{section}.{key}' 무시")
+                continue
+            _check_type(f"{section}.{key}", value, expected)
+            section_values[key] = value
+        validated[section] = section_values
+
+    return validated
+
+
 class Settings:
     """통합 설정 클래스"""
     def __init__(self, config_file: Optional[str] = None):
@@ -268,34 +349,23 @@ class Settings:
             self.load_from_file(config_file)
     
     def load_from_file(self, config_file: str):
-        """JSON 설정 파일에서 로드"""
+        """JSON 설정 파일에서 로드 (형식 검증 후 한 번에 적용)"""
         with open(config_file, 'r', encoding='utf-8') as f:
             config = json.load(f)
 
-        # 새로운 키워드 구조
-        if 'job_keywords' in config:
-            self.search_keywords.job_keywords = config['job_keywords']
-        if 'experience_keywords' in config:
-            self.search_keywords.experience_keywords = config['experience_keywords']
-        if 'location_keywords' in config:
-            self.search_keywords.location_keywords = config['location_keywords']
-        if 'combine_all' in config:
-            self.search_keywords.combine_all = config['combine_all']
-
-        # 하위 호환성: 기존 'keywords' 키 지원
+        config = _validate_config(config)
+
+        # 새로운 키워드 구조 + 하위 호환성: 기존 'keywords' 키 지원
+        keyword_values = {key: config[key] for key in _KEYWORD_KEYS if key in config}
         if 'keywords' in config and 'job_keywords' not in config:
-            self.search_keywords.job_keywords = config['keywords']
+            keyword_values['job_keywords'] = config['keywords']
+        if keyword_values:
+            self.search_keywords = replace(self.search_keywords, **keyword_values)
 
-        if 'sites' in config:
-            self.search_keywords.sites = config['sites']
         if 'crawler' in config:
-            for key, value in config['crawler'].items():
-                if hasattr(self.crawler, key):
-                    setattr(self.crawler, key, value)
+            self.crawler = replace(self.crawler, **config['crawler'])
         if 'jobplanet' in config:
-            for key, value in config['jobplanet'].items():
-                if hasattr(self.jobplanet, key):
-                    setattr(self.jobplanet, key, value)
+            self.jobplanet = replace(self.jobplanet, **config['jobplanet'])
 
     def save_to_file(self, config_file: str):
         """설정을 JSON 파일로 저장"""
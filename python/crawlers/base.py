@@ -2,24 +2,74 @@
 채용 공고 데이터 모델 및 기본 크롤러 클래스
 """
 import hashlib
+import re
 import time
 import logging
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Iterable, Iterator, Callable, Tuple
+import orjson
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
-import sys
-sys.path.append(str(__file__).rsplit('/', 2)[0])
-from config import crawler_config, SKILL_CATEGORIES
+from config.legacy import crawler_config, SKILL_CATEGORIES, DATA_DIR
+from utils.http_cache import ResponseCache
+from utils.helpers import RateLimiter
 
+# 스킬 조회 테이블 (import 시 한 번만 소문자화) - 소문자 표기 → 원래 표기들
+_SKILL_NAMES: Dict[str, List[str]] = {}
+for _skills in SKILL_CATEGORIES.values():
+    for _skill in _skills:
+        _SKILL_NAMES.setdefault(_skill.lower(), []).append(_skill)
 
-@dataclass
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """
+    단어 목록을 접두사 트라이 모양의 정규식으로 변환
+    
+    위치마다 모든 단어를 차례로 대조하는 대신 글자 하나씩 갈라지는 분기만 따라가므로
+    스캔 비용이 단어 수가 아닌 트라이 깊이에 비례 (Aho-Corasick과 같은 역할을 표준 re로 수행).
+    자식 분기를 단어 끝보다 먼저 시도(탐욕적 ?)하므로 각 위치에서 가장 긴 단어가 매치됨.
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = {}  # 단어 끝 표시
+    
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:%s)' % '|'.join(branches)
+        return '(?:%s)?' % body if '' in node else body
+    
+    return build(trie)
+
+
+# 모든 스킬을 한 번의 스캔으로 탐색 - 위치마다 그 위치에서 시작하는 가장 긴 스킬을 찾고
+# (트라이 정규식의 전방 탐색), 그 스킬에 포함된 짧은 스킬은 미리 계산한 목록으로 함께 추가
+_SKILL_SCAN_RE = re.compile('(?=(%s))' % _trie_pattern(_SKILL_NAMES))
+_SKILL_EXPANSION = {
+    longer: tuple(skill for shorter, names in _SKILL_NAMES.items() if shorter in longer for skill in names)
+    for longer in _SKILL_NAMES
+}
+_SOFT_SKILL_KEYWORDS = frozenset(
+    skill.lower() for skill in SKILL_CATEGORIES.get("soft_skills", [])
+)
+
+# 검색 결과 페이지를 미리 요청해 둘 개수 (응답 대기와 파싱을 겹치게 함)
+PAGE_PREFETCH = 3
+
+
+@dataclass(slots=True)
 class JobPosting:
-    """채용 공고 데이터 모델"""
+    """채용 공고 데이터 모델 (공고마다 생성되므로 __dict__ 없이 슬롯으로 저장)"""
     # 기본 정보
     title: str
     company: str
@@ -58,9 +108,7 @@ class JobPosting:
     # 메타 정보
     posted_date: str = ""
     deadline: str = ""
-    crawled_at: str = field(
-        default_factory=lambda: datetime.now().isoformat()
-    )
+    crawled_at: float = field(default_factory=time.time)  # epoch 초
     content_hash: str = ""
     
     def __post_init__(self):
@@ -76,11 +124,9 @@ class JobPosting:
         """스킬을 하드스킬/소프트스킬로 분류"""
         all_skills = set(self.required_skills + self.preferred_skills)
         
-        soft_skill_keywords = SKILL_CATEGORIES.get("soft_skills", [])
-        
         for skill in all_skills:
             skill_lower = skill.lower()
-            is_soft = any(ss in skill_lower for ss in soft_skill_keywords)
+            is_soft = any(ss in skill_lower for ss in _SOFT_SKILL_KEYWORDS)
             
             if is_soft:
                 if skill not in self.soft_skills:
@@ -89,13 +135,23 @@ class JobPosting:
                 if skill not in self.hard_skills:
                     self.hard_skills.append(skill)
     
+    def crawled_at_iso(self) -> str:
+        """수집 시각을 ISO 문자열로 변환"""
+        return datetime.fromtimestamp(self.crawled_at).isoformat()
+    
     def to_dict(self) -> Dict[str, Any]:
-        """딕셔너리로 변환"""
-        return asdict(self)
+        """딕셔너리로 변환 (crawled_at은 ISO 문자열)"""
+        data = asdict(self)
+        data["crawled_at"] = self.crawled_at_iso()
+        return data
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'JobPosting':
-        """딕셔너리에서 생성"""
+        """딕셔너리에서 생성 (ISO 문자열 crawled_at 지원)"""
+        crawled_at = data.get("crawled_at")
+        if isinstance(crawled_at, str):
+            timestamp = datetime.fromisoformat(crawled_at).timestamp() if crawled_at else 0.0
+            data = {**data, "crawled_at": timestamp}
         return cls(**data)
 
 
@@ -107,7 +163,15 @@ class BaseCrawler(ABC):
         self.config = crawler_config
         self.logger = logging.getLogger(f"crawler.{site_name}")
         self.session = self._create_session()
-        self.last_request_time = 0
+        # 여러 스레드에서 요청해도 요청 간격 유지, 서버의 Retry-After/X-RateLimit-* 헤더도 반영
+        self.rate_limiter = RateLimiter(min_interval=self.config.request_delay)
+        
+        # 상세 조회 디스크 캐시 (메인 크롤러와 같은 파일 공유, 키는 URL 기준이라 겹치지 않음)
+        self.detail_cache = None
+        if self.config.detail_cache_ttl > 0:
+            self.detail_cache = ResponseCache(
+                DATA_DIR / "http_cache.db", ttl=self.config.detail_cache_ttl
+            )
     
     def _create_session(self) -> requests.Session:
         """HTTP 세션 생성 (재시도 로직 포함)"""
@@ -119,7 +183,8 @@ class BaseCrawler(ABC):
             status_forcelist=[429, 500, 502, 503, 504]
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # 세션 하나를 크롤러 수명 동안 재사용 - 페이지 미리 요청/상세 조회 스레드가 연결을 버리지 않도록 풀 확장
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=retry_strategy)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
@@ -127,19 +192,45 @@ class BaseCrawler(ABC):
             "User-Agent": self.config.user_agent,
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+            "Connection": "keep-alive",
         })
         
         return session
     
     def _rate_limit(self):
-        """요청 간 대기"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.config.request_delay:
-            time.sleep(self.config.request_delay - elapsed)
-        self.last_request_time = time.time()
-    
-    def _get_page(self, url: str, **kwargs) -> Optional[str]:
-        """페이지 HTML 가져오기"""
+        """요청 간 대기 (스레드 안전 - 요청 간격을 request_delay 이상으로, 서버가 알려준 한도 안에서는 바로 통과)"""
+        self.rate_limiter.acquire()
+    
+    def _iter_pages(self, fetch: Callable[[int], Any], max_pages: int) -> Iterator[Tuple[int, Any]]:
+        """
+        1..max_pages 페이지 응답을 순서대로 반환하되 다음 페이지 몇 개는 스레드 풀에서 미리 요청
+        
+        이전 응답을 파싱하는 동안 다음 응답을 기다리므로 페이지당 대기 시간이
+        (응답 시간 + 파싱 시간) 대신 request_delay 수준으로 줄어듦.
+        호출 측이 순회를 멈추면(break) 아직 시작하지 않은 요청은 취소.
+        
+        Args:
+            fetch: 페이지 번호를 받아 응답을 반환하는 함수
+            max_pages: 최대 페이지
+        """
+        with ThreadPoolExecutor(max_workers=PAGE_PREFETCH) as executor:
+            pending = deque()
+            next_page = 1
+            try:
+                while True:
+                    while next_page <= max_pages and len(pending) < PAGE_PREFETCH:
+                        pending.append((next_page, executor.submit(fetch, next_page)))
+                        next_page += 1
+                    if not pending:
+                        return
+                    page, future = pending.popleft()
+                    yield page, future.result()
+            finally:
+                for _, future in pending:
+                    future.cancel()
+    
+    def _get_page(self, url: str, **kwargs) -> Optional[bytes]:
+        """페이지 HTML 가져오기 (디코딩은 파서가 <meta> charset으로 처리하도록 bytes 그대로 반환)"""
         self._rate_limit()
         
         try:
@@ -148,8 +239,9 @@ class BaseCrawler(ABC):
                 timeout=self.config.timeout,
                 **kwargs
             )
+            self.rate_limiter.update_from_headers(response.headers)
             response.raise_for_status()
-            return response.text
+            return response.content
         except requests.RequestException as e:
             self.logger.error(f"페이지 요청 실패: {url} - {e}")
             return None
@@ -164,30 +256,61 @@ class BaseCrawler(ABC):
                 timeout=self.config.timeout,
                 **kwargs
             )
+            self.rate_limiter.update_from_headers(response.headers)
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            return orjson.loads(response.content)
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             self.logger.error(f"JSON 요청 실패: {url} - {e}")
             return None
     
+    def _get_detail_page(self, url: str) -> Optional[bytes]:
+        """
+        상세 페이지 본문 가져오기 (캐시 우선)
+        
+        캐시가 유효하면 요청하지 않고, 요청이 실패하면 만료된 캐시라도 대신 사용
+        """
+        if self.detail_cache is None:
+            return self._get_page(url)
+        
+        key = f"{self.site_name}:{url}"
+        body = self.detail_cache.get(key)
+        if body is not None:
+            return body
+        
+        body = self._get_page(url)
+        if body is None:
+            return self.detail_cache.get(key, allow_stale=True)
+        
+        self.detail_cache.set(key, body)
+        return body
+    
+    def _get_detail_json(self, url: str) -> Optional[Dict]:
+        """상세 JSON 가져오기 (URL 기준 디스크 캐시 사용)"""
+        body = self._get_detail_page(url)
+        if body is None:
+            return None
+        
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError as e:
+            self.logger.error(f"JSON 파싱 실패: {url} - {e}")
+            return None
+    
     def _extract_skills(self, text: str) -> List[str]:
         """텍스트에서 스킬 추출"""
         if not text:
             return []
         
-        text_lower = text.lower()
-        found_skills = []
-        
-        for category, skills in SKILL_CATEGORIES.items():
-            for skill in skills:
-                if skill.lower() in text_lower:
-                    found_skills.append(skill)
+        matched = {match.group(1) for match in _SKILL_SCAN_RE.finditer(text.lower())}
+        found_skills = set()
+        for skill_lower in matched:
+            found_skills.update(_SKILL_EXPANSION[skill_lower])
         
-        return list(set(found_skills))
+        return list(found_skills)
     
     @abstractmethod
-    def search(self, keyword: str, max_pages: int = None) -> List[JobPosting]:
-        """키워드로 채용 공고 검색"""
+    def search(self, keyword: str, max_pages: int = None) -> Iterable[JobPosting]:
+        """키워드로 채용 공고 검색 (리스트 또는 제너레이터)"""
         pass
     
     @abstractmethod
@@ -195,20 +318,23 @@ class BaseCrawler(ABC):
         """채용 공고 상세 정보 가져오기"""
         pass
     
-    def crawl_all_keywords(self) -> List[JobPosting]:
-        """설정된 모든 키워드로 크롤링"""
-        all_jobs = []
+    def iter_all_keywords(self) -> Iterator[JobPosting]:
+        """설정된 모든 키워드로 크롤링 (중복 제외, 수집되는 대로 yield)"""
         seen_hashes = set()
-        
+
         for keyword in self.config.search_keywords:
             self.logger.info(f"키워드 크롤링: {keyword}")
-            jobs = self.search(keyword, self.config.max_pages)
-            
-            for job in jobs:
-                if job.content_hash not in seen_hashes:
-                    seen_hashes.add(job.content_hash)
-                    all_jobs.append(job)
-            
-            self.logger.info(f"  - {len(jobs)}개 수집 (중복 제외 총 {len(all_jobs)}개)")
-        
-        return all_jobs
+            found = 0
+
+            for job in self.search(keyword, self.config.max_pages):
+                found += 1
+                if job.content_hash in seen_hashes:
+                    continue
+                seen_hashes.add(job.content_hash)
+                yield job
+
+            self.logger.info(f"  - {found}개 수집 (중복 제외 누적 {len(seen_hashes)}개)")
+
+    def crawl_all_keywords(self) -> List[JobPosting]:
+        """설정된 모든 키워드로 크롤링"""
+        return list(self.iter_all_keywords())
@@ -4,21 +4,36 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Generator
+from collections import OrderedDict, deque
+from typing import List, Dict, Any, Optional, Generator, Callable, Iterator, Tuple
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
+import orjson
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from config.settings import settings
+from config.settings import settings, DATA_DIR
 from utils.helpers import (
     setup_logger, retry_on_failure, clean_text, 
     extract_skills_from_text, RateLimiter
 )
+from utils.http_cache import ResponseCache
+
+# HTML 본문 스트리밍 수신 청크 크기 (bytes)
+PAGE_CHUNK_SIZE = 16384
+
+# 검색 결과 페이지를 미리 요청해 둘 개수
+PAGE_PREFETCH = 3
+
+# 상세 조회 결과 메모리 캐시 크기 (키워드가 달라도 같은 공고는 한 번만 조회/파싱)
+DETAIL_MEMO_SIZE = 4096
 
 
 class BaseCrawler(ABC):
@@ -31,6 +46,12 @@ class BaseCrawler(ABC):
         self.rate_limiter = RateLimiter(1.0 / settings.crawler.request_delay)
         
         self.session = requests.Session()
+        
+        # 동시 상세 조회 시 연결이 버려지지 않도록 풀 크기 확장 (재시도는 retry_on_failure가 담당)
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         self.session.headers.update({
             'User-Agent': settings.crawler.user_agent,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -38,28 +59,92 @@ class BaseCrawler(ABC):
             'Accept-Encoding': 'gzip, deflate, br',
             'Connection': 'keep-alive',
         })
+        
+        # 상세 페이지 디스크 캐시 (사이트 간 공유, 재크롤링 시 요청 생략)
+        self.detail_cache = None
+        if settings.crawler.detail_cache_ttl > 0:
+            self.detail_cache = ResponseCache(
+                DATA_DIR / "http_cache.db", ttl=settings.crawler.detail_cache_ttl
+            )
+        
+        # 파싱된 상세 정보 LRU 캐시 (공고 ID → 상세 정보)
+        self._detail_memo: OrderedDict = OrderedDict()
+        self._detail_memo_lock = threading.Lock()
     
     @retry_on_failure(max_retries=3, delay=2.0)
-    def get_page(self, url: str, params: Optional[Dict] = None) -> Optional[BeautifulSoup]:
-        """페이지 가져오기"""
-        self.rate_limiter.wait()
+    def _fetch_body(self, url: str, params: Optional[Dict] = None) -> bytes:
+        """응답 본문(bytes) 가져오기"""
+        self.rate_limiter.acquire()
         
         try:
-            response = self.session.get(
+            # 본문은 청크 단위로 받고, 다 받으면 바로 연결을 풀에 반납
+            with self.session.get(
                 url, 
                 params=params,
-                timeout=settings.crawler.timeout
-            )
-            response.raise_for_status()
-            return BeautifulSoup(response.text, 'html.parser')
+                timeout=settings.crawler.timeout,
+                stream=True
+            ) as response:
+                # 429의 Retry-After도 반영되도록 상태 확인 전에 한도 갱신
+                self.rate_limiter.update_from_headers(response.headers)
+                response.raise_for_status()
+                return b''.join(response.iter_content(chunk_size=PAGE_CHUNK_SIZE))
         except requests.RequestException as e:
             self.logger.error(f"Error fetching {url}: {e}")
             raise
     
+    def get_page(self, url: str, params: Optional[Dict] = None,
+                 parse_only: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
+        """
+        페이지 가져오기
+        
+        Args:
+            url: 요청 URL
+            params: 쿼리 파라미터
+            parse_only: 지정 시 해당 요소만 트리로 생성 (목록 페이지 메모리 절감)
+        """
+        # lxml(C 파서) 사용, 디코딩은 파서에 맡기도록 bytes 전달
+        return BeautifulSoup(self._fetch_body(url, params), 'lxml', parse_only=parse_only)
+    
+    def _get_cached_body(self, url: str, job_id: str, params: Optional[Dict] = None) -> bytes:
+        """
+        상세 페이지 본문 가져오기 (캐시 우선)
+        
+        캐시가 유효하면 요청하지 않고, 요청이 실패하면 만료된 캐시라도 대신 사용
+        """
+        if self.detail_cache is None:
+            return self._fetch_body(url, params)
+        
+        key = f"{self.site_name}:{job_id}"
+        body = self.detail_cache.get(key)
+        if body is not None:
+            return body
+        
+        try:
+            body = self._fetch_body(url, params)
+        except requests.RequestException:
+            body = self.detail_cache.get(key, allow_stale=True)
+            if body is None:
+                raise
+            self.logger.warning(f"Using stale cache for {key}")
+            return body
+        
+        self.detail_cache.set(key, body)
+        return body
+    
+    def get_detail_page(self, url: str, job_id: str,
+                        params: Optional[Dict] = None) -> Optional[BeautifulSoup]:
+        """상세 페이지 가져오기 ((사이트, 공고 ID) 기준 디스크 캐시 사용)"""
+        return BeautifulSoup(self._get_cached_body(url, job_id, params), 'lxml')
+    
+    def get_detail_json(self, url: str, job_id: str,
+                        params: Optional[Dict] = None) -> Optional[Dict]:
+        """상세 JSON 가져오기 ((사이트, 공고 ID) 기준 디스크 캐시 사용)"""
+        return orjson.loads(self._get_cached_body(url, job_id, params))
+    
     @retry_on_failure(max_retries=3, delay=2.0)
     def get_json(self, url: str, params: Optional[Dict] = None) -> Optional[Dict]:
-        """JSON API 호출"""
-        self.rate_limiter.wait()
+        """JSON API 호출 (응답이 작아 스트리밍 없이 한 번에 수신)"""
+        self.rate_limiter.acquire()
         
         try:
             response = self.session.get(
@@ -67,12 +152,39 @@ class BaseCrawler(ABC):
                 params=params,
                 timeout=settings.crawler.timeout
             )
+            self.rate_limiter.update_from_headers(response.headers)
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            return orjson.loads(response.content)
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             self.logger.error(f"Error fetching JSON from {url}: {e}")
             raise
     
+    def iter_pages(self, fetch: Callable[[int], Any], max_pages: int) -> Iterator[Tuple[int, Any]]:
+        """
+        1..max_pages 페이지 응답을 순서대로 반환하되 다음 페이지 몇 개는 스레드 풀에서 미리 요청
+        
+        요청 간격은 rate_limiter가 유지하고, 호출 측이 순회를 멈추면 아직 시작하지 않은 요청은 취소
+        
+        Args:
+            fetch: 페이지 번호를 받아 응답을 반환하는 함수
+            max_pages: 최대 페이지
+        """
+        with ThreadPoolExecutor(max_workers=PAGE_PREFETCH) as executor:
+            pending = deque()
+            next_page = 1
+            try:
+                while True:
+                    while next_page <= max_pages and len(pending) < PAGE_PREFETCH:
+                        pending.append((next_page, executor.submit(fetch, next_page)))
+                        next_page += 1
+                    if not pending:
+                        return
+                    page, future = pending.popleft()
+                    yield page, future.result()
+            finally:
+                for _, future in pending:
+                    future.cancel()
+    
     @abstractmethod
     def search_jobs(self, keyword: str, max_pages: int = 10) -> Generator[Dict[str, Any], None, None]:
         """
@@ -100,6 +212,25 @@ class BaseCrawler(ABC):
         """
         pass
     
+    def get_job_detail_cached(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """상세 정보 조회 (이 크롤러에서 이미 조회한 공고는 메모리 LRU 캐시에서 반환)"""
+        if not job_id:
+            return self.get_job_detail(job_id)
+        
+        with self._detail_memo_lock:
+            detail = self._detail_memo.get(job_id)
+            if detail is not None:
+                self._detail_memo.move_to_end(job_id)
+                return detail
+        
+        detail = self.get_job_detail(job_id)
+        if detail:
+            with self._detail_memo_lock:
+                self._detail_memo[job_id] = detail
+                if len(self._detail_memo) > DETAIL_MEMO_SIZE:
+                    self._detail_memo.popitem(last=False)
+        return detail
+    
     def crawl_keyword(self, keyword: str) -> List[Dict[str, Any]]:
         """
         특정 키워드에 대한 전체 크롤링 실행
@@ -114,19 +245,32 @@ class BaseCrawler(ABC):
         
         jobs = []
         max_pages = settings.crawler.max_pages_per_keyword
+        pending = []  # (요약 정보, 상세 조회 future)
         
-        try:
-            for job_summary in self.search_jobs(keyword, max_pages):
+        # 검색 결과가 나오는 대로 상세 조회를 스레드 풀에 제출 (요청 간격은 rate_limiter가 유지)
+        with ThreadPoolExecutor(max_workers=settings.crawler.detail_workers) as executor:
+            try:
+                for job_summary in self.search_jobs(keyword, max_pages):
+                    future = executor.submit(self.get_job_detail_cached, job_summary.get('job_id'))
+                    pending.append((job_summary, future))
+            except Exception as e:
+                self.logger.error(f"Error during crawl: {e}")
+            
+            for job_summary, future in pending:
                 try:
-                    # 상세 정보 가져오기
-                    job_detail = self.get_job_detail(job_summary.get('job_id'))
+                    job_detail = future.result()
                     
                     if job_detail:
-                        # 요약 정보와 상세 정보 병합
-                        job_data = {**job_summary, **job_detail}
+                        # 요약 정보와 상세 정보 병합 (요약 딕셔너리는 여기서만 쓰므로 제자리 갱신)
+                        job_data = job_summary
+                        job_data.update(job_detail)
                         
                         # 스킬 추출
-                        full_text = f"{job_data.get('description', '')} {job_data.get('requirements', '')} {job_data.get('preferred', '')}"
+                        full_text = ' '.join((
+                            job_data.get('description') or '',
+                            job_data.get('requirements') or '',
+                            job_data.get('preferred') or '',
+                        ))
                         skills = extract_skills_from_text(full_text)
                         job_data['extracted_hard_skills'] = skills['hard_skills']
                         job_data['extracted_soft_skills'] = skills['soft_skills']
@@ -139,13 +283,12 @@ class BaseCrawler(ABC):
                 except Exception as e:
                     self.logger.error(f"Error getting job detail: {e}")
                     jobs.append(job_summary)
-                    
-        except Exception as e:
-            self.logger.error(f"Error during crawl: {e}")
         
         self.logger.info(f"Finished crawling {keyword}: {len(jobs)} jobs found")
         return jobs
     
     def close(self):
-        """세션 종료"""
+        """세션 종료 (마운트된 어댑터의 연결 풀과 캐시 연결도 함께 정리)"""
         self.session.close()
+        if self.detail_cache is not None:
+            self.detail_cache.close()
@@ -6,10 +6,41 @@ https://www.jobkorea.co.kr
 from typing import Generator, Dict, Any, Optional
 import re
 from datetime import datetime
+from bs4 import SoupStrainer
 from .base_crawler import BaseCrawler
 from utils.helpers import clean_text
 
 
+# 채용공고 ID 추출 패턴
+_GNO_RE = re.compile(r'[Gg]no=(\d+)')
+_ID_RE = re.compile(r'/(\d+)\??')
+
+# 검색 결과 페이지에서 채용공고 카드만 파싱
+_LISTING_STRAINER = SoupStrainer(class_=['list-item', 'recruit-info', 'post-list-info'])
+
+# 상세 페이지 정보 행 (헤더와 값이 모두 있는 행만 - 메뉴/푸터의 빈 tr 제외)
+_DETAIL_ROW_SELECTOR = ':is(tr, .tbRow, .detail-row):has(th, .label):has(td, .value)'
+
+# 조건 정보 분류 패턴 (한 번의 스캔으로 모든 분류 토큰 탐색)
+_OPTION_RE = re.compile(
+    '(?P<location>서울|경기|인천|부산|대구|광주|대전|울산|세종|강원|충북|충남|전북|전남|경북|경남|제주)'
+    '|(?P<experience>신입|경력|년|무관)'
+    '|(?P<employment>정규|계약|인턴|파견|프리)'
+    r'|(?P<salary>\d[\d,]*\s*만?\s*원)'  # 숫자+원만 인정 ('지원' 등 오탐 방지)
+)
+# 여러 분류가 함께 나오면 앞선 분류 우선
+_OPTION_PRIORITY = ('location', 'experience', 'employment', 'salary')
+
+
+def _classify_option(text: str) -> Optional[str]:
+    """조건 텍스트의 분류 반환 (location/experience/employment/salary)"""
+    found = {match.lastgroup for match in _OPTION_RE.finditer(text)}
+    for category in _OPTION_PRIORITY:
+        if category in found:
+            return category
+    return None
+
+
 class JobKoreaCrawler(BaseCrawler):
     """잡코리아 채용공고 크롤러"""
     
@@ -39,7 +70,7 @@ class JobKoreaCrawler(BaseCrawler):
                     'Page_No': page,
                 }
                 
-                soup = self.get_page(search_url, params)
+                soup = self.get_page(search_url, params, parse_only=_LISTING_STRAINER)
                 
                 if not soup:
                     break
@@ -90,12 +121,12 @@ class JobKoreaCrawler(BaseCrawler):
             
             # job_id 추출
             job_id = ""
-            job_id_match = re.search(r'[Gg]no=(\d+)', href)
+            job_id_match = _GNO_RE.search(href)
             if job_id_match:
                 job_id = job_id_match.group(1)
             else:
                 # URL에서 ID 추출 시도
-                job_id_match = re.search(r'/(\d+)\??', href)
+                job_id_match = _ID_RE.search(href)
                 if job_id_match:
                     job_id = job_id_match.group(1)
             
@@ -108,22 +139,18 @@ class JobKoreaCrawler(BaseCrawler):
             
             # 조건 정보
             option_elems = elem.select('.chip-information-group .chip, .option span, .info-item')
-            location = ""
-            experience = ""
-            employment_type = ""
-            salary = ""
-            
             option_texts = [clean_text(opt.text) for opt in option_elems]
             
+            options = {}
             for text in option_texts:
-                if any(loc in text for loc in ['서울', '경기', '인천', '부산', '대구', '광주', '대전', '울산', '세종', '강원', '충북', '충남', '전북', '전남', '경북', '경남', '제주']):
-                    location = text
-                elif any(exp in text for exp in ['신입', '경력', '년', '무관']):
-                    experience = text
-                elif any(emp in text for emp in ['정규', '계약', '인턴', '파견', '프리']):
-                    employment_type = text
-                elif '만원' in text or '원' in text:
-                    salary = text
+                category = _classify_option(text)
+                if category:
+                    options[category] = text
+            
+            location = options.get('location', "")
+            experience = options.get('experience', "")
+            employment_type = options.get('employment', "")
+            salary = options.get('salary', "")
             
             # 직무 분야
             sector_elem = elem.select_one('.sector, .job-sector')
@@ -156,7 +183,7 @@ class JobKoreaCrawler(BaseCrawler):
         try:
             detail_url = f"{self.base_url}/Recruit/GI_Read/{job_id}"
             
-            soup = self.get_page(detail_url)
+            soup = self.get_detail_page(detail_url, job_id)
             
             if not soup:
                 return None
@@ -171,20 +198,15 @@ class JobKoreaCrawler(BaseCrawler):
             requirements = ""
             preferred = ""
             
-            # 테이블 형식의 상세 정보
-            info_rows = soup.select('.tbRow, .detail-row, tr')
-            for row in info_rows:
-                header = row.select_one('th, .label')
-                content = row.select_one('td, .value')
+            # 테이블 형식의 상세 정보 (헤더와 값을 모두 가진 행만 선택)
+            for row in soup.select(_DETAIL_ROW_SELECTOR):
+                header_text = clean_text(row.select_one('th, .label').text).lower()
                 
-                if header and content:
-                    header_text = clean_text(header.text).lower()
-                    content_text = clean_text(content.get_text())
-                    
-                    if any(word in header_text for word in ['자격', '필수', '요건']):
-                        requirements += content_text + "\n"
-                    elif any(word in header_text for word in ['우대', '선호']):
-                        preferred += content_text + "\n"
+                # 필요한 항목일 때만 값 텍스트 정리
+                if any(word in header_text for word in ('자격', '필수', '요건')):
+                    requirements += clean_text(row.select_one('td, .value').get_text()) + "\n"
+                elif any(word in header_text for word in ('우대', '선호')):
+                    preferred += clean_text(row.select_one('td, .value').get_text()) + "\n"
             
             # 스킬/기술 태그
             skill_tags = []
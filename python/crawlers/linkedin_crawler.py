@@ -20,6 +20,11 @@ from config.settings import settings
 from utils.helpers import clean_text, extract_skills_from_text, categorize_job_level
 
 
+# 채용공고 ID 추출 패턴
+_URN_RE = re.compile(r'jobPosting:(\d+)')
+_VIEW_RE = re.compile(r'/jobs/view/(\d+)')
+
+
 class LinkedInCrawler(BaseCrawler):
     """LinkedIn 채용공고 크롤러"""
     
@@ -118,7 +123,7 @@ class LinkedInCrawler(BaseCrawler):
         # data-entity-urn에서 추출
         entity_urn = card.get('data-entity-urn', '')
         if entity_urn:
-            match = re.search(r'jobPosting:(\d+)', entity_urn)
+            match = _URN_RE.search(entity_urn)
             if match:
                 job_id = match.group(1)
         
@@ -127,7 +132,7 @@ class LinkedInCrawler(BaseCrawler):
             link = card.select_one('a[href*="/jobs/view/"]')
             if link:
                 href = link.get('href', '')
-                match = re.search(r'/jobs/view/(\d+)', href)
+                match = _VIEW_RE.search(href)
                 if match:
                     job_id = match.group(1)
         
@@ -156,6 +161,9 @@ class LinkedInCrawler(BaseCrawler):
         # URL
         url = f"https://www.linkedin.com/jobs/view/{job_id}"
         
+        # 제목에서 스킬 추출 (상세 페이지 접근이 제한적이므로 카드 파싱 시 함께 처리)
+        skills = extract_skills_from_text(title)
+        
         return {
             'source_site': self.site_name,
             'job_id': job_id,
@@ -163,7 +171,9 @@ class LinkedInCrawler(BaseCrawler):
             'company_name': company_name,
             'location': location,
             'posted_date': posted_date,
-            'url': url
+            'url': url,
+            'required_skills': skills['hard_skills'] + skills['soft_skills'],
+            'position_level': categorize_job_level(title)  # 경력 수준 추정
         }
     
     def get_job_detail(self, job_id: str) -> Optional[Dict]:
@@ -175,7 +185,7 @@ class LinkedInCrawler(BaseCrawler):
         url = f"https://www.linkedin.com/jobs/view/{job_id}"
         
         try:
-            soup = self.get_page(url)
+            soup = self.get_detail_page(url, job_id)
             
             if not soup:
                 return None
@@ -229,25 +239,16 @@ class LinkedInCrawler(BaseCrawler):
         키워드로 전체 크롤링 실행
         
         LinkedIn은 상세 페이지 접근이 제한적이므로
-        검색 결과만 수집하고 스킬은 제목/설명에서 추출
+        검색 결과만 수집하고 스킬은 카드 파싱 시 제목에서 추출
         """
         if max_pages is None:
             max_pages = settings.crawler.max_pages_per_keyword
         
         self.logger.info(f"LinkedIn 크롤링 시작: {keyword}")
         
-        # 검색 결과 수집
+        # 검색 결과 수집 (스킬/경력 수준은 카드 파싱 시 이미 추출됨)
         jobs = self.search_jobs(keyword, max_pages)
         
-        # 제목에서 스킬 추출
-        for job in jobs:
-            if job.get('title'):
-                skills = extract_skills_from_text(job['title'])
-                job['required_skills'] = skills.get('hard_skills', []) + skills.get('soft_skills', [])
-            
-            # 경력 수준 추정
-            job['position_level'] = categorize_job_level(job.get('title', ''))
-        
         self.logger.info(f"LinkedIn 크롤링 완료: {len(jobs)}개 수집")
         
         return jobs
@@ -1,21 +1,22 @@
 """
 크롤러 매니저 - 모든 크롤러 통합 관리
 """
-import json
 import logging
+import mmap
+import sqlite3
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Type, Optional
-from collections import defaultdict
+from typing import List, Dict, Type, Optional, Iterator, Any
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import orjson
 
 from .base import BaseCrawler, JobPosting
 from .wanted import WantedCrawler
 from .saramin import SaraminCrawler
 from .other_sites import JobKoreaCrawler, JumpitCrawler, ProgrammersCrawler
-
-import sys
-sys.path.append(str(__file__).rsplit('/', 2)[0])
-from config import crawler_config, DATA_DIR
+from config.legacy import crawler_config, DATA_DIR
 
 
 # 사용 가능한 크롤러 등록
@@ -27,6 +28,32 @@ AVAILABLE_CRAWLERS: Dict[str, Type[BaseCrawler]] = {
     "programmers": ProgrammersCrawler,
 }
 
+# 마스터 데이터 (SQLite, content_hash 기준 중복 제거)
+MASTER_DB = DATA_DIR / "master_jobs.db"
+MASTER_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS jobs (
+        content_hash TEXT PRIMARY KEY,
+        source TEXT,
+        company TEXT,
+        crawled_at TEXT,
+        payload BLOB
+    )
+"""
+# 이전 형식의 마스터 파일 (DB 최초 생성 시 가져옴)
+LEGACY_MASTER_JSONL = DATA_DIR / "master_jobs.jsonl"
+LEGACY_MASTER_JSON = DATA_DIR / "master_jobs.json"
+
+
+def _hash_key(content_hash: str) -> int:
+    """중복 체크용 키 - content_hash(md5 hex) 앞 64비트를 정수로 사용 (문자열보다 작음)"""
+    return int(content_hash[:16], 16) if content_hash else 0
+
+
+def _run_site(site_name: str) -> List[JobPosting]:
+    """사이트 하나 크롤링 (프로세스 풀 작업용 - 피클 가능하도록 모듈 함수로 둠)"""
+    crawler = AVAILABLE_CRAWLERS[site_name]()
+    return crawler.crawl_all_keywords()
+
 
 class CrawlerManager:
     """크롤러 통합 관리자"""
@@ -34,42 +61,67 @@ class CrawlerManager:
     def __init__(self, enabled_sites: List[str] = None):
         self.logger = logging.getLogger("crawler.manager")
         self.enabled_sites = enabled_sites or crawler_config.enabled_sites
+        # 생성된 크롤러 (세션/캐시 DB 연결을 열므로 이 프로세스에서 쓸 때만 생성)
         self.crawlers: Dict[str, BaseCrawler] = {}
         
-        self._initialize_crawlers()
+        self.site_names = self._resolve_sites()
     
-    def _initialize_crawlers(self):
-        """크롤러 초기화"""
+    def _resolve_sites(self) -> List[str]:
+        """사용할 사이트 목록 (알 수 없는 사이트 제외, 설정 순서 유지)"""
+        sites = []
         for site in self.enabled_sites:
             if site in AVAILABLE_CRAWLERS:
-                self.crawlers[site] = AVAILABLE_CRAWLERS[site]()
-                self.logger.info(f"크롤러 초기화: {site}")
+                sites.append(site)
             else:
                 self.logger.warning(f"알 수 없는 사이트: {site}")
+        return sites
+    
+    def _get_crawler(self, site_name: str) -> BaseCrawler:
+        """사이트 크롤러 반환 (처음 요청 시 초기화)"""
+        crawler = self.crawlers.get(site_name)
+        if crawler is None:
+            crawler = self.crawlers[site_name] = AVAILABLE_CRAWLERS[site_name]()
+            self.logger.info(f"크롤러 초기화: {site_name}")
+        return crawler
     
-    def crawl_all(self) -> List[JobPosting]:
-        """모든 사이트 크롤링"""
+    def crawl_all(self, threads: bool = False) -> List[JobPosting]:
+        """모든 사이트 병렬 크롤링
+        
+        Args:
+            threads: True면 스레드 풀 사용 (기본값: 사이트별 프로세스)
+        """
         all_jobs = []
         seen_hashes = set()
+        executor_cls = ThreadPoolExecutor if threads else ProcessPoolExecutor
         
-        for site_name, crawler in self.crawlers.items():
-            self.logger.info(f"=== {site_name} 크롤링 시작 ===")
+        with executor_cls(max_workers=max(len(self.site_names), 1)) as executor:
+            futures = []
+            for site_name in self.site_names:
+                self.logger.info(f"=== {site_name} 크롤링 시작 ===")
+                if threads:
+                    future = executor.submit(self._get_crawler(site_name).crawl_all_keywords)
+                else:
+                    # 프로세스 모드는 작업 프로세스가 크롤러를 직접 생성
+                    future = executor.submit(_run_site, site_name)
+                futures.append((site_name, future))
             
-            try:
-                jobs = crawler.crawl_all_keywords()
-                
-                # 중복 제거
-                new_jobs = []
-                for job in jobs:
-                    if job.content_hash not in seen_hashes:
-                        seen_hashes.add(job.content_hash)
-                        new_jobs.append(job)
-                
-                all_jobs.extend(new_jobs)
-                self.logger.info(f"{site_name}: {len(new_jobs)}개 수집")
-                
-            except Exception as e:
-                self.logger.error(f"{site_name} 크롤링 실패: {e}")
+            # 설정된 사이트 순서대로 중복 제거 (같은 공고는 항상 앞 순서 사이트의 것을 유지)
+            for site_name, future in futures:
+                try:
+                    jobs = future.result()
+                    
+                    new_jobs = []
+                    for job in jobs:
+                        key = _hash_key(job.content_hash)
+                        if key not in seen_hashes:
+                            seen_hashes.add(key)
+                            new_jobs.append(job)
+                    
+                    all_jobs.extend(new_jobs)
+                    self.logger.info(f"{site_name}: {len(new_jobs)}개 수집")
+                    
+                except Exception as e:
+                    self.logger.error(f"{site_name} 크롤링 실패: {e}")
         
         self.logger.info(f"총 {len(all_jobs)}개 채용 공고 수집 완료")
         
@@ -80,91 +132,139 @@ class CrawlerManager:
     
     def crawl_site(self, site_name: str) -> List[JobPosting]:
         """특정 사이트만 크롤링"""
-        if site_name not in self.crawlers:
+        if site_name not in self.site_names:
             self.logger.error(f"크롤러 없음: {site_name}")
             return []
         
-        crawler = self.crawlers[site_name]
+        crawler = self._get_crawler(site_name)
         return crawler.crawl_all_keywords()
     
     def _save_jobs(self, jobs: List[JobPosting], filename: str = None):
-        """크롤링 데이터 저장"""
+        """크롤링 데이터 저장 (JSONL: 한 줄에 공고 하나)"""
         if not filename:
             date_str = datetime.now().strftime("%Y%m%d")
-            filename = f"jobs_{date_str}.json"
+            filename = f"jobs_{date_str}.jsonl"
         
         filepath = DATA_DIR / filename
         
-        data = {
-            "crawled_at": datetime.now().isoformat(),
-            "total_count": len(jobs),
-            "jobs": [job.to_dict() for job in jobs]
-        }
+        # 딕셔너리 변환은 한 번만 하고 일별 파일과 마스터 DB에서 함께 사용
+        job_dicts = [job.to_dict() for job in jobs]
         
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        with open(filepath, "wb") as f:
+            for job_dict in job_dicts:
+                f.write(orjson.dumps(job_dict, option=orjson.OPT_APPEND_NEWLINE))
         
-        self.logger.info(f"데이터 저장: {filepath}")
+        self.logger.info(f"데이터 저장: {filepath} ({len(job_dicts)}개)")
         
         # 마스터 데이터 업데이트
-        self._update_master_data(jobs)
+        self._update_master_data(job_dicts)
     
-    def _update_master_data(self, new_jobs: List[JobPosting]):
-        """마스터 데이터 업데이트 (기존 데이터와 병합)"""
-        master_file = DATA_DIR / "master_jobs.json"
-        
-        existing_jobs = []
-        existing_hashes = set()
-        
-        if master_file.exists():
-            with open(master_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                for job_dict in data.get("jobs", []):
-                    existing_jobs.append(JobPosting.from_dict(job_dict))
-                    existing_hashes.add(job_dict.get("content_hash", ""))
-        
-        # 새 데이터 추가
-        added_count = 0
-        for job in new_jobs:
-            if job.content_hash not in existing_hashes:
-                existing_jobs.append(job)
-                existing_hashes.add(job.content_hash)
-                added_count += 1
-        
-        # 저장
-        data = {
-            "updated_at": datetime.now().isoformat(),
-            "total_count": len(existing_jobs),
-            "jobs": [job.to_dict() for job in existing_jobs]
-        }
+    def _connect_master(self) -> sqlite3.Connection:
+        """마스터 DB 연결 (최초 생성 시 이전 JSON/JSONL 마스터 파일을 가져옴)"""
+        is_new = not MASTER_DB.exists()
+        
+        conn = sqlite3.connect(MASTER_DB)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(MASTER_SCHEMA)
         
-        with open(master_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        if is_new:
+            imported = self._insert_master_rows(conn, self._iter_legacy_master_dicts())
+            if imported:
+                self.logger.info(f"이전 마스터 데이터 가져오기: {imported}개 -> {MASTER_DB}")
         
-        self.logger.info(f"마스터 데이터 업데이트: +{added_count}개 (총 {len(existing_jobs)}개)")
+        return conn
     
-    def load_data(self, date: str = None, source: str = None) -> List[JobPosting]:
-        """저장된 데이터 로드"""
-        if date:
-            filename = f"jobs_{date.replace('-', '')}.json"
-            filepath = DATA_DIR / filename
-        else:
-            filepath = DATA_DIR / "master_jobs.json"
+    def _iter_legacy_master_dicts(self) -> Iterator[Dict[str, Any]]:
+        """이전 형식(JSONL 또는 JSON 배열) 마스터 파일 읽기"""
+        if LEGACY_MASTER_JSONL.exists():
+            with open(LEGACY_MASTER_JSONL, "rb") as f:
+                for line in f:
+                    if line.strip():
+                        yield orjson.loads(line)
+        elif LEGACY_MASTER_JSON.exists():
+            yield from orjson.loads(LEGACY_MASTER_JSON.read_bytes()).get("jobs", [])
+    
+    @staticmethod
+    def _insert_master_rows(conn: sqlite3.Connection, job_dicts) -> int:
+        """공고 딕셔너리 일괄 삽입 (이미 있는 content_hash는 DB가 무시), 추가된 개수 반환"""
+        rows = (
+            (
+                job_dict.get("content_hash", ""),
+                job_dict.get("source", ""),
+                job_dict.get("company", ""),
+                job_dict.get("crawled_at", ""),
+                orjson.dumps(job_dict),
+            )
+            for job_dict in job_dicts
+        )
         
-        if not filepath.exists():
-            self.logger.warning(f"데이터 파일 없음: {filepath}")
-            return []
+        before = conn.total_changes
+        with conn:
+            conn.executemany("INSERT OR IGNORE INTO jobs VALUES (?, ?, ?, ?, ?)", rows)
+        return conn.total_changes - before
+    
+    def _update_master_data(self, job_dicts: List[Dict[str, Any]]):
+        """마스터 데이터 업데이트 (신규 공고만 추가, 중복 판정은 DB가 content_hash로 처리)"""
+        conn = self._connect_master()
+        try:
+            added_count = self._insert_master_rows(conn, job_dicts)
+            total_count = conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+        finally:
+            conn.close()
         
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        self.logger.info(f"마스터 데이터 업데이트: +{added_count}개 (총 {total_count}개)")
+    
+    def _iter_daily_dicts(self, date: str) -> Iterator[Dict[str, Any]]:
+        """일별 데이터 파일 읽기 (JSONL은 mmap으로 한 줄씩, 이전 JSON 파일도 지원)"""
+        date_str = date.replace('-', '')
+        filepath = DATA_DIR / f"jobs_{date_str}.jsonl"
         
-        jobs = [JobPosting.from_dict(j) for j in data.get("jobs", [])]
+        if filepath.exists():
+            if filepath.stat().st_size == 0:
+                return
+            with open(filepath, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for line in iter(mm.readline, b""):
+                    if line.strip():
+                        yield orjson.loads(line)
+            return
         
-        # 소스 필터링
-        if source:
-            jobs = [j for j in jobs if j.source == source]
+        legacy_path = DATA_DIR / f"jobs_{date_str}.json"
+        if legacy_path.exists():
+            yield from orjson.loads(legacy_path.read_bytes()).get("jobs", [])
+            return
         
-        return jobs
+        self.logger.warning(f"데이터 파일 없음: {filepath}")
+    
+    def iter_data(self, date: str = None, source: str = None) -> Iterator[JobPosting]:
+        """저장된 데이터를 읽는 대로 yield"""
+        if date:
+            for job_dict in self._iter_daily_dicts(date):
+                if not source or job_dict.get("source") == source:
+                    yield JobPosting.from_dict(job_dict)
+            return
+        
+        if not (MASTER_DB.exists() or LEGACY_MASTER_JSONL.exists() or LEGACY_MASTER_JSON.exists()):
+            self.logger.warning(f"데이터 파일 없음: {MASTER_DB}")
+            return
+        
+        conn = self._connect_master()
+        try:
+            # 소스 필터링은 DB에서 처리
+            if source:
+                rows = conn.execute(
+                    "SELECT payload FROM jobs WHERE source = ? ORDER BY rowid", (source,)
+                )
+            else:
+                rows = conn.execute("SELECT payload FROM jobs ORDER BY rowid")
+            for (payload,) in rows:
+                yield JobPosting.from_dict(orjson.loads(payload))
+        finally:
+            conn.close()
+    
+    def load_data(self, date: str = None, source: str = None) -> List[JobPosting]:
+        """저장된 데이터 로드"""
+        return list(self.iter_data(date, source))
     
     def get_statistics(self, jobs: List[JobPosting] = None) -> Dict:
         """데이터 통계"""
@@ -174,27 +274,22 @@ class CrawlerManager:
         if not jobs:
             return {}
         
-        stats = {
-            "total_count": len(jobs),
-            "by_source": defaultdict(int),
-            "by_company": defaultdict(int),
-            "crawled_dates": set(),
-        }
+        by_source = Counter()
+        by_company = Counter()
+        crawled_dates = set()
         
         for job in jobs:
-            stats["by_source"][job.source] += 1
-            stats["by_company"][job.company] += 1
+            by_source[job.source] += 1
+            by_company[job.company] += 1
             if job.crawled_at:
-                date = job.crawled_at[:10]
-                stats["crawled_dates"].add(date)
-        
-        # set을 list로 변환
-        stats["crawled_dates"] = sorted(list(stats["crawled_dates"]))
-        stats["by_source"] = dict(stats["by_source"])
-        stats["by_company"] = dict(sorted(
-            stats["by_company"].items(), 
-            key=lambda x: x[1], 
-            reverse=True
-        )[:20])
+                # 날짜 객체로 모으고 문자열 변환은 고유 날짜에 대해서만
+                crawled_dates.add(datetime.fromtimestamp(job.crawled_at).date())
+        
+        stats = {
+            "total_count": len(jobs),
+            "by_source": dict(by_source),
+            "by_company": dict(by_company.most_common(20)),
+            "crawled_dates": [d.isoformat() for d in sorted(crawled_dates)],
+        }
         
         return stats
@@ -3,25 +3,244 @@
 3차 크롤링: 기업명 기준 뉴스 기사 검색 및 수집
 
 nodriver를 사용하여 동적 렌더링 페이지 크롤링
+(기사 상세는 정적 HTML을 먼저 시도하고 실패 시에만 브라우저 사용)
 """
 
 import asyncio
+import hashlib
+import json
 import logging
 import re
-from typing import Dict, List, Any, Optional
-from urllib.parse import quote
+import time
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
+from urllib.parse import quote, urlencode
+
+import requests
+from bs4 import BeautifulSoup
 
 # nodriver import
 try:
     import nodriver
+    from nodriver import cdp
     NODRIVER_AVAILABLE = True
 except ImportError:
     NODRIVER_AVAILABLE = False
 
 from config.settings import settings
+from utils.helpers import TokenBucket
 
 logger = logging.getLogger('crawler.news')
 
+# 회사명 정리용 패턴
+_BRACKETS_RE = re.compile(r'\([^)]*\)|（[^）]*）|\[[^\]]*\]|【[^】]*】')
+# 한글 범위: 가-힣 (완성형), ㄱ-ㅎ, ㅏ-ㅣ (자모)
+_NON_KOREAN_RE = re.compile(r'[^가-힣ㄱ-ㅎㅏ-ㅣ0-9\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# 기사 본문에서 제외할 문단 (저작권 안내, 제보 안내)
+_CONTENT_EXCLUDE_RE = re.compile('저작권자|무단 전재|제보는 카카오톡')
+_CONTENT_EXCLUDE_CLASSES = frozenset(('txt-copyright', 'txt-desc'))
+# 게시일시 ("송고2026-01-29 17:16" 형태에서 날짜/시간만 추출)
+_TIME_RE = re.compile(r'(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2})')
+
+# 연합뉴스 검색 (제목 검색, 기사만)
+_SEARCH_URL = 'https://www.yna.co.kr/search/index'
+
+# 텍스트 수집에 필요 없는 리소스 (이미지, 폰트, 미디어, 광고/분석 스크립트)
+# 스타일시트는 innerText 결과(숨김 요소 제외)에 영향을 주므로 차단하지 않음
+_BLOCKED_URL_PATTERNS = (
+    '*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.mp4', '*.webm', '*.mp3',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*googletagmanager*', '*googlesyndication*', '*google-analytics*', '*doubleclick*',
+)
+
+# 페이지 스크립트는 모두 고정 소스로 탭에 한 번 등록하고 (새 문서마다 자동 설치)
+# 값은 호출 인자로만 넘김 - 스크립트 재파싱/재컴파일 없이 V8 컴파일 캐시 재사용
+
+# 검색 결과 페이지 처리 - 로딩 대기, 하단 스크롤, 기사 목록 추출을 한 번에 수행
+_SEARCH_HELPER_JS = '''
+    window.__newsCollect = async (keyword, sinceDate, timeoutMs, scrollInterval) => {
+        const deadline = Date.now() + timeoutMs;
+        const sleep = ms => new Promise(r => setTimeout(r, ms));
+        const countItems = () => document.querySelectorAll('.item-box01').length;
+
+        // 기사 수가 250ms 간격으로 두 번 연속 같으면 로딩 완료
+        const waitStable = async () => {
+            let last = -1;
+            let stable = 0;
+            while (Date.now() < deadline) {
+                const count = countItems();
+                if (count > 0 && count === last) {
+                    if (++stable >= 2) return;
+                } else {
+                    stable = 0;
+                    last = count;
+                }
+                await sleep(250);
+            }
+        };
+
+        await waitStable();
+
+        // 스크롤 높이가 늘어나는 동안 하단까지 스크롤 후 추가 로딩 대기
+        const root = document.documentElement;
+        let height = -1;
+        while (root.scrollHeight !== height && Date.now() < deadline) {
+            height = root.scrollHeight;
+            window.scrollTo(0, height);
+            await sleep(scrollInterval);
+        }
+        await waitStable();
+
+        const articles = [];
+        const seenUrls = new Set();
+
+        // section=search 쿼리가 포함된 링크만 선택 (검색 결과 링크)
+        const links = document.querySelectorAll('a[href*="section=search"]');
+
+        links.forEach(function(link) {
+            const href = link.href || '';
+            if (!href.includes('/view/')) return;
+
+            // 부모 item-box01에서 제목 추출
+            const item = link.closest('.item-box01');
+            if (!item) return;
+
+            const titleEl = item.querySelector('.title01');
+            if (!titleEl) return;
+
+            const title = titleEl.innerText.trim();
+
+            // 제목에 검색 키워드가 포함되어 있는지 확인
+            if (!title.includes(keyword)) return;
+
+            // 날짜 추출 및 필터링
+            const timeEl = item.querySelector('.txt-time');
+            const publishedAt = timeEl ? timeEl.innerText.trim() : '';
+
+            // 날짜 필터가 설정되어 있으면 적용 (검색 URL의 기간 조건이 무시되는 경우 대비)
+            if (sinceDate && publishedAt) {
+                // 날짜 형식: "2023-01-09 10:11" -> "2023-01-09"
+                const articleDate = publishedAt.split(' ')[0];
+                if (articleDate < sinceDate) {
+                    return;  // 지정 날짜보다 이전 기사는 스킵
+                }
+            }
+
+            // URL 정리 (쿼리 파라미터 제거)
+            let url = href;
+            try {
+                const urlObj = new URL(href);
+                url = urlObj.origin + urlObj.pathname;
+            } catch(e) {}
+
+            // 중복 체크
+            if (seenUrls.has(url)) return;
+            seenUrls.add(url);
+
+            articles.push({
+                news_url: url,
+                title: title,
+                published_at: publishedAt
+            });
+        });
+
+        return {count: countItems(), articles: articles};
+    };
+'''
+
+# 기사 상세 정보 추출 함수 - 탭마다 한 번 등록해 두면 새 문서마다 자동으로 설치됨
+_DETAIL_HELPER_JS = r'''
+    window.__newsDetail = () => {
+        const data = {
+            title: null,
+            raw_time: null,
+            subtitle: null,
+            reporter_name: null,
+            content_parts: null
+        };
+
+        // 제목: <h1 class="tit01">
+        const titleEl = document.querySelector('h1.tit01');
+        if (titleEl) data.title = titleEl.innerText.trim();
+
+        // 게시일시: <p class="txt-time01"> (날짜/시간 추출은 Python에서 처리)
+        const timeEl = document.querySelector('.txt-time01');
+        if (timeEl) data.raw_time = timeEl.innerText.trim();
+
+        // 기자이름: <strong class="tit-name"> 내 <a>
+        const reporterEl = document.querySelector('.tit-name a');
+        if (reporterEl) data.reporter_name = reporterEl.innerText.trim();
+
+        // 부제목: <div class="tit-sub"> 내 <h2 class="tit01">
+        const subtitleEl = document.querySelector('.tit-sub h2.tit01');
+        if (subtitleEl) data.subtitle = subtitleEl.innerText.trim();
+
+        // 내용: <div class="story-news article"> 내 <p> 태그들
+        // 문단 텍스트만 넘기고 저작권/제보 안내 필터링과 병합은 Python에서 처리
+        const contentArea = document.querySelector('.story-news.article');
+        if (contentArea) {
+            data.content_parts = Array.from(
+                contentArea.querySelectorAll('p:not(.txt-copyright):not(.txt-desc)'),
+                p => p.innerText.trim()
+            );
+        }
+
+        return data;
+    };
+'''
+_DETAIL_CALL_JS = 'window.__newsDetail()'
+
+# 요소 등장 대기 (DOM 변경 시마다 확인, 제한 시간 초과 시 false), 하단까지 천천히 스크롤
+_PAGE_HELPER_JS = '''
+    window.__newsWaitFor = (selector, timeoutMs) => new Promise(resolve => {
+        if (document.querySelector(selector)) {
+            resolve(true);
+            return;
+        }
+        const observer = new MutationObserver(() => {
+            if (document.querySelector(selector)) {
+                observer.disconnect();
+                clearTimeout(timer);
+                resolve(true);
+            }
+        });
+        observer.observe(document.documentElement, {childList: true, subtree: true});
+        const timer = setTimeout(() => {
+            observer.disconnect();
+            resolve(false);
+        }, timeoutMs);
+    });
+
+    window.__newsScroll = async (distance, delay) => {
+        while (document.documentElement.scrollTop + window.innerHeight < document.documentElement.scrollHeight) {
+            window.scrollBy(0, distance);
+            await new Promise(r => setTimeout(r, delay));
+        }
+    };
+'''
+
+
+def _js_call(function_name: str, *args) -> str:
+    """탭에 설치된 함수 호출식 생성 (인자는 JSON 리터럴로 전달)"""
+    return f"window.{function_name}({', '.join(json.dumps(arg) for arg in args)})"
+
+
+def _parse_published_at(raw_time: Optional[str]) -> Optional[str]:
+    """게시일시 텍스트에서 날짜/시간만 추출 ("송고2026-01-29 17:16" -> "2026-01-29 17:16")"""
+    match = _TIME_RE.search(raw_time) if raw_time else None
+    return match.group(1) if match else None
+
+
+def _join_content(paragraphs) -> str:
+    """기사 문단 목록을 본문으로 병합 (빈 문단, 저작권/제보 안내 문단 제외)"""
+    return '\n\n'.join(
+        text for text in paragraphs
+        if text and not _CONTENT_EXCLUDE_RE.search(text)
+    )
+
 
 class NewsCrawler:
     """연합뉴스 크롤러 (nodriver 사용)"""
@@ -30,39 +249,63 @@ class NewsCrawler:
         self.db = db
         self.logger = logger
         self._browser = None
+        self._loop = None  # 동기 호출용 이벤트 루프 (크롤러 수명 동안 유지 - 브라우저 연결 재사용)
         self.since_date = since_date  # YYYY-MM-DD 형식
         # 설정에서 값 로드
         self.max_pages = settings.news.max_pages
         self.page_load_delay = settings.news.page_load_delay
-        self.article_delay = settings.news.article_delay
+        # 사이트 전체 요청 속도 제한 (동시 수집 탭/회사 수와 관계없이 공유)
+        self._bucket = TokenBucket(rate=settings.news.request_rate, capacity=settings.news.request_burst)
+        self.detail_concurrency = settings.news.detail_concurrency
+        self.company_concurrency = settings.news.company_concurrency
         self.scroll_delay = settings.news.scroll_delay
         self.scroll_distance = settings.news.scroll_distance
         self.scroll_interval = settings.news.scroll_interval
         self.headless = settings.news.headless
+        self.block_resources = settings.news.block_resources
+        self.browser_cache_dir = settings.news.browser_cache_dir
+        self.browser_cache_size = settings.news.browser_cache_size
+        self._browser_lock = asyncio.Lock()  # 여러 회사를 동시에 수집할 때 브라우저 중복 시작 방지
+        self._active_companies = 0  # crawl_many에서 수집 중인 회사 수 (브라우저 재시작 여부 판단)
+
+        # 기사 상세는 우선 HTTP로 받아 파싱 (브라우저는 실패 시에만 사용)
+        self._http = requests.Session()
+        self._http.headers.update({
+            'User-Agent': settings.crawler.user_agent,
+            'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+        })
 
     async def _get_browser(self):
         """브라우저 인스턴스 반환 (재사용)"""
-        if not self._browser:
-            self._browser = await nodriver.start(headless=self.headless)
-            self.logger.info(f"  → 새 브라우저 시작 (headless={self.headless})")
+        async with self._browser_lock:
+            if not self._browser:
+                # 프로필(쿠키 등)은 실행마다 새로 만들고 HTTP 디스크 캐시만 실행 간 유지
+                browser_args = []
+                if self.browser_cache_dir:
+                    browser_args += [
+                        f'--disk-cache-dir={self.browser_cache_dir}',
+                        f'--disk-cache-size={self.browser_cache_size}',
+                    ]
+                self._browser = await nodriver.start(headless=self.headless, browser_args=browser_args)
+                self.logger.info(f"  → 새 브라우저 시작 (headless={self.headless})")
         return self._browser
 
+    async def _restart_browser(self):
+        """브라우저만 종료 (HTTP 세션은 유지, 다음 _get_browser 호출 시 새로 시작)"""
+        async with self._browser_lock:
+            if self._browser:
+                try:
+                    self._browser.stop()
+                except Exception:
+                    pass
+                self._browser = None
+                self.logger.info("브라우저 종료됨")
+
     async def _scroll_to_bottom(self, page, delay: float = None):
         """페이지 하단까지 천천히 스크롤"""
         if delay is None:
             delay = self.scroll_delay
-        scroll_js = f'''
-            async function scrollToBottom() {{
-                const distance = {self.scroll_distance};
-                const delay = {self.scroll_interval};
-                while (document.documentElement.scrollTop + window.innerHeight < document.documentElement.scrollHeight) {{
-                    window.scrollBy(0, distance);
-                    await new Promise(r => setTimeout(r, delay));
-                }}
-            }}
-            scrollToBottom();
-        '''
-        await page.evaluate(scroll_js)
+        await page.evaluate(_js_call('__newsScroll', self.scroll_distance, self.scroll_interval))
         await asyncio.sleep(delay)
 
     def _clean_company_name(self, company_name: str) -> str:
@@ -73,28 +316,20 @@ class NewsCrawler:
             "ABC컴퍼니" -> "컴퍼니"
             "네이버 NAVER" -> "네이버"
         """
-        # 반각 소괄호 ()
-        cleaned = re.sub(r'\([^)]*\)', '', company_name)
-        # 전각 소괄호 （）
-        cleaned = re.sub(r'（[^）]*）', '', cleaned)
-        # 반각 대괄호 []
-        cleaned = re.sub(r'\[[^\]]*\]', '', cleaned)
-        # 전각 대괄호 【】
-        cleaned = re.sub(r'【[^】]*】', '', cleaned)
+        # 괄호 내용 제거 (반각/전각 소괄호, 반각 대괄호, 전각 대괄호를 한 번에)
+        cleaned = _BRACKETS_RE.sub('', company_name)
         # 슬래시 이후 제거 (예: "글루가/ohora" -> "글루가")
-        if '/' in cleaned:
-            cleaned = cleaned.split('/')[0]
+        cleaned = cleaned.split('/', 1)[0]
 
         # 한국어(한글), 숫자, 공백만 남기기
-        # 한글 범위: 가-힣 (완성형), ㄱ-ㅎ, ㅏ-ㅣ (자모)
-        cleaned = re.sub(r'[^가-힣ㄱ-ㅎㅏ-ㅣ0-9\s]', '', cleaned)
+        cleaned = _NON_KOREAN_RE.sub('', cleaned)
 
         # 연속 공백 제거 및 trim
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+        cleaned = _WHITESPACE_RE.sub(' ', cleaned).strip()
 
         return cleaned
 
-    async def search_news(self, company_name: str, existing_urls: set = None) -> List[Dict[str, Any]]:
+    async def search_news(self, company_name: str, existing_urls: frozenset = frozenset()) -> List[Dict[str, Any]]:
         """회사명으로 뉴스 검색 및 URL 목록 수집 (1단계)
 
         Args:
@@ -104,13 +339,21 @@ class NewsCrawler:
         Returns:
             뉴스 목록 [{news_url, title, published_at}, ...]
         """
-        if existing_urls is None:
-            existing_urls = set()
+        news_list, _ = await self._search_news(company_name, existing_urls)
+        return news_list
+
+    async def _search_news(self, company_name: str, existing_urls: frozenset) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """뉴스 URL 목록 수집, (뉴스 목록, 저장할 첫 페이지 지문) 반환
+
+        지문은 페이지 탐색을 끝까지 마쳤을 때만 반환하고 저장은 호출 측이 기사를 DB에 저장한 뒤 수행
+        (상세 수집/저장이 실패하면 다음 검색에서 이후 페이지를 다시 탐색)
+        """
         if not NODRIVER_AVAILABLE:
             self.logger.warning("nodriver not available")
-            return []
+            return [], None
 
         news_list = []
+        seen_urls = set()  # news_list에 담긴 URL (중복 체크용)
         total_article_count = 0
 
         # 회사명에서 괄호 제거 및 한국어만 추출
@@ -119,87 +362,101 @@ class NewsCrawler:
         # 한글이 없는 경우 (영문만 있는 회사명 등) 스킵
         if not search_name:
             self.logger.warning(f"    검색 스킵: 한글 회사명 없음 (원본: {company_name})")
-            return news_list
+            return news_list, None
 
         self.logger.info(f"    검색어: {search_name}" + (f" (원본: {company_name})" if search_name != company_name else ""))
 
-        encoded_name = quote(f'"{search_name}"')
-        base_url = f'https://www.yna.co.kr/search/index?query={encoded_name}&scope=title&ctype=A'
-
+        # 지난 검색의 첫 페이지 지문 (같으면 이후 페이지 탐색 생략)
+        try:
+            previous_fingerprint = self.db.get_news_search_fingerprint(company_name)
+        except Exception as e:
+            self.logger.debug(f"    검색 지문 조회 실패: {e}")
+            previous_fingerprint = None
+        fingerprint = None
+
+        # 검색 URL은 회사마다 한 번만 만들고 페이지 번호만 채워 사용
+        params = {'query': f'"{search_name}"', 'scope': 'title', 'ctype': 'A'}
+        if self.since_date:
+            # 기간 검색으로 서버에서 먼저 걸러 범위 밖 페이지를 받지 않음 (페이지 내 날짜 필터는 안전장치로 유지)
+            params.update({
+                'period': 'diy',
+                'from': self.since_date.replace('-', ''),
+                'to': datetime.now().strftime('%Y%m%d'),
+            })
+        query = urlencode(params, quote_via=quote)
+        page_url = f'{_SEARCH_URL}?{query}&page_no={{}}'.format
+
+        page = None
         try:
-            browser = await self._get_browser()
-
             # ========== 1단계: 첫 페이지 로드 및 총 기사 수 확인 ==========
+            # 검색 전용 탭을 한 번만 열고 페이지 이동은 같은 탭에서 처리 (기사 상세 탭과 분리)
             self.logger.info(f"    [1단계] 검색 결과 확인 중...")
-            page = await browser.get(f'{base_url}&page_no=1')
-            await asyncio.sleep(self.page_load_delay)
-
-            # 총 기사 수 확인
-            for wait_attempt in range(10):
-                count_js = r'''
-                    JSON.stringify((() => {
-                        const result = {
-                            readyState: document.readyState,
-                            count: -1,
-                            debug: {}
-                        };
-
-                        // 방법 1: header.title-con05 내의 txt-type011 em
-                        const header = document.querySelector('header.title-con05');
-                        if (header) {
-                            const countEl = header.querySelector('.txt-type011 em');
-                            if (countEl) {
-                                result.count = parseInt(countEl.innerText.trim()) || 0;
-                                result.debug.method = 'header.title-con05';
-                                return result;
-                            }
-                        }
+            page = await self._new_tab(isolated=True)
+            await page.send(cdp.page.add_script_to_evaluate_on_new_document(source=_SEARCH_HELPER_JS))
+            await self._navigate(page, page_url(1))
+
+            # 총 기사 수 확인 - 기사 수 요소나 기사 목록이 나타나는 즉시(MutationObserver) 한 번만 확인
+            await self._wait_for_selector(page, 'header.title-con05 .txt-type011 em, .item-box01', timeout=10)
+            count_js = r'''
+                (() => {
+                    const result = {
+                        readyState: document.readyState,
+                        count: -1,
+                        debug: {}
+                    };
 
-                        // 방법 2: .txt-type011 em (여러 개일 수 있음)
-                        const allCounts = document.querySelectorAll('.txt-type011 em');
-                        if (allCounts.length > 0) {
-                            result.count = parseInt(allCounts[0].innerText.trim()) || 0;
-                            result.debug.method = '.txt-type011 em (first)';
-                            result.debug.allCountsLength = allCounts.length;
+                    // 방법 1: header.title-con05 내의 txt-type011 em
+                    const header = document.querySelector('header.title-con05');
+                    if (header) {
+                        const countEl = header.querySelector('.txt-type011 em');
+                        if (countEl) {
+                            result.count = parseInt(countEl.innerText.trim()) || 0;
+                            result.debug.method = 'header.title-con05';
                             return result;
                         }
+                    }
 
-                        // 방법 3: "N건" 텍스트 패턴 검색
-                        const bodyText = document.body.innerText;
-                        const match = bodyText.match(/(\d+)\s*건/);
-                        if (match) {
-                            result.count = parseInt(match[1]) || 0;
-                            result.debug.method = 'text pattern';
-                            return result;
-                        }
+                    // 방법 2: .txt-type011 em (여러 개일 수 있음)
+                    const allCounts = document.querySelectorAll('.txt-type011 em');
+                    if (allCounts.length > 0) {
+                        result.count = parseInt(allCounts[0].innerText.trim()) || 0;
+                        result.debug.method = '.txt-type011 em (first)';
+                        result.debug.allCountsLength = allCounts.length;
+                        return result;
+                    }
 
-                        // 방법 4: 기사 개수 직접 카운트
-                        const articles = document.querySelectorAll('.item-box01');
-                        if (articles.length > 0) {
-                            result.count = articles.length;
-                            result.debug.method = 'direct count';
-                            return result;
-                        }
+                    // 방법 3: "N건" 텍스트 패턴 검색
+                    const bodyText = document.body.innerText;
+                    const match = bodyText.match(/(\d+)\s*건/);
+                    if (match) {
+                        result.count = parseInt(match[1]) || 0;
+                        result.debug.method = 'text pattern';
+                        return result;
+                    }
 
-                        result.debug.method = 'none found';
+                    // 방법 4: 기사 개수 직접 카운트
+                    const articles = document.querySelectorAll('.item-box01');
+                    if (articles.length > 0) {
+                        result.count = articles.length;
+                        result.debug.method = 'direct count';
                         return result;
-                    })())
-                '''
-                try:
-                    result = await page.evaluate(count_js)
-                    if isinstance(result, str):
-                        import json
-                        data = json.loads(result)
-                        self.logger.debug(f"    기사 수 확인: {data}")
-
-                        if data.get('readyState') == 'complete':
-                            total_article_count = data.get('count', -1)
-                            if total_article_count >= 0:
-                                self.logger.info(f"    총 기사 수: {total_article_count}건 (방법: {data.get('debug', {}).get('method', '?')})")
-                                break
-                except Exception as e:
-                    self.logger.debug(f"    기사 수 확인 오류: {e}")
-                await asyncio.sleep(1)
+                    }
+
+                    result.debug.method = 'none found';
+                    return result;
+                })()
+            '''
+            total_article_count = -1
+            try:
+                # 객체를 값으로 바로 받음 (JSON 문자열 변환 없음)
+                data = await page.evaluate(count_js, return_by_value=True)
+                if isinstance(data, dict):
+                    self.logger.debug(f"    기사 수 확인: {data}")
+                    total_article_count = data.get('count', -1)
+                    if total_article_count >= 0:
+                        self.logger.info(f"    총 기사 수: {total_article_count}건 (방법: {data.get('debug', {}).get('method', '?')})")
+            except Exception as e:
+                self.logger.debug(f"    기사 수 확인 오류: {e}")
 
             # 기사 수를 못 찾았으면 페이지에서 직접 확인
             if total_article_count < 0:
@@ -209,96 +466,27 @@ class NewsCrawler:
             # 기사가 0건이면 즉시 종료
             if total_article_count == 0:
                 self.logger.info(f"    검색 결과 없음, 종료")
-                return news_list
+                return news_list, None
 
             # ========== 2단계: 페이지별 기사 URL 수집 ==========
             self.logger.info(f"    [2단계] 기사 URL 수집 시작")
 
+            # 로딩 대기 + 스크롤 + 기사 목록 추출을 한 번의 evaluate로 처리
+            # (검색 결과 + 제목에 키워드 포함 + 날짜 필터, since_date는 YYYY-MM-DD 또는 null)
+            collect_js = _js_call('__newsCollect', search_name, self.since_date, 15000, self.scroll_interval)
+
             for page_num in range(1, self.max_pages + 1):
                 # 첫 페이지가 아니면 페이지 이동
                 if page_num > 1:
                     self.logger.info(f"    페이지 {page_num}로 이동...")
-                    await page.get(f'{base_url}&page_no={page_num}')
-                    await asyncio.sleep(self.page_load_delay)
-
-                # 동적 로딩 완료 대기
-                await self._wait_for_articles(page)
-
-                # 스크롤
-                await self._scroll_to_bottom(page)
-                await asyncio.sleep(1)
-
-                # 기사 목록 추출 (검색 결과 + 제목에 키워드 포함 + 날짜 필터)
-                since_date_js = f'"{self.since_date}"' if self.since_date else 'null'
-                articles_js = f'''
-                    JSON.stringify((function() {{
-                        const keyword = "{search_name}";
-                        const sinceDate = {since_date_js};  // YYYY-MM-DD 또는 null
-                        const articles = [];
-                        const seenUrls = new Set();
-
-                        // section=search 쿼리가 포함된 링크만 선택 (검색 결과 링크)
-                        const links = document.querySelectorAll('a[href*="section=search"]');
-
-                        links.forEach(function(link) {{
-                            const href = link.href || '';
-                            if (!href.includes('/view/')) return;
-
-                            // 부모 item-box01에서 제목 추출
-                            const item = link.closest('.item-box01');
-                            if (!item) return;
-
-                            const titleEl = item.querySelector('.title01');
-                            if (!titleEl) return;
-
-                            const title = titleEl.innerText.trim();
-
-                            // 제목에 검색 키워드가 포함되어 있는지 확인
-                            if (!title.includes(keyword)) return;
-
-                            // 날짜 추출 및 필터링
-                            const timeEl = item.querySelector('.txt-time');
-                            const publishedAt = timeEl ? timeEl.innerText.trim() : '';
-
-                            // 날짜 필터가 설정되어 있으면 적용
-                            if (sinceDate && publishedAt) {{
-                                // 날짜 형식: "2023-01-09 10:11" -> "2023-01-09"
-                                const articleDate = publishedAt.split(' ')[0];
-                                if (articleDate < sinceDate) {{
-                                    return;  // 지정 날짜보다 이전 기사는 스킵
-                                }}
-                            }}
-
-                            // URL 정리 (쿼리 파라미터 제거)
-                            let url = href;
-                            try {{
-                                const urlObj = new URL(href);
-                                url = urlObj.origin + urlObj.pathname;
-                            }} catch(e) {{}}
-
-                            // 중복 체크
-                            if (seenUrls.has(url)) return;
-                            seenUrls.add(url);
-
-                            articles.push({{
-                                news_url: url,
-                                title: title,
-                                published_at: publishedAt
-                            }});
-                        }});
-
-                        return articles;
-                    }})())
-                '''
+                    await self._navigate(page, page_url(page_num))
 
                 page_articles = []
                 try:
-                    result = await page.evaluate(articles_js)
-                    if isinstance(result, str):
-                        import json
-                        page_articles = json.loads(result)
-                    elif isinstance(result, list):
-                        page_articles = result
+                    data = await self._evaluate_promise(page, collect_js, timeout=30)
+                    if isinstance(data, dict):
+                        page_articles = data.get('articles') or []
+                        self.logger.debug(f"    페이지 {page_num} 로드된 기사 수: {data.get('count')}")
                 except Exception as e:
                     self.logger.warning(f"    페이지 {page_num} 추출 오류: {e}")
 
@@ -307,19 +495,25 @@ class NewsCrawler:
                 page_new_urls = []  # 이 페이지에서 새로 수집한 URL
                 for article in page_articles:
                     url = article.get('news_url')
-                    if url and url not in [n['news_url'] for n in news_list]:
+                    if url and url not in seen_urls:
+                        seen_urls.add(url)
                         news_list.append(article)
                         page_new_urls.append(url)
                         page_new_count += 1
 
                 self.logger.info(f"    페이지 {page_num}: {page_new_count}개 수집 (누적: {len(news_list)}/{total_article_count})")
 
-                # 첫 페이지에서 모든 URL이 이미 DB에 있으면 조기 종료
-                if page_num == 1 and page_new_count > 0 and existing_urls:
-                    new_urls_not_in_db = [url for url in page_new_urls if url not in existing_urls]
-                    if len(new_urls_not_in_db) == 0:
+                if page_num == 1:
+                    # 첫 페이지가 지난 검색과 같으면 결과 목록에 변화가 없으므로 이후 페이지 생략
+                    fingerprint = self._search_fingerprint(total_article_count, page_new_urls)
+                    if fingerprint == previous_fingerprint:
+                        self.logger.info(f"    첫 페이지 변화 없음 (지난 검색과 동일), 다음 회사로 이동")
+                        return news_list, None
+
+                    # 첫 페이지에서 모든 URL이 이미 DB에 있으면 조기 종료
+                    if page_new_count > 0 and existing_urls and existing_urls.issuperset(page_new_urls):
                         self.logger.info(f"    첫 페이지 URL 모두 기존 수집됨, 다음 회사로 이동")
-                        return news_list
+                        return news_list, fingerprint
 
                 # 모든 기사 수집 완료 확인
                 if len(news_list) >= total_article_count:
@@ -338,36 +532,142 @@ class NewsCrawler:
 
         except Exception as e:
             self.logger.error(f"뉴스 검색 오류: {e}")
+            # 페이지 탐색을 끝까지 마치지 못했으면 지문을 남기지 않음 (다음 검색에서 다시 탐색)
+            fingerprint = None
+        finally:
+            if page is not None:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
 
-        return news_list
+        return news_list, fingerprint
+
+    def _search_fingerprint(self, total_article_count: int, page_urls: List[str]) -> str:
+        """검색 결과 첫 페이지 지문 (총 기사 수 + 날짜 필터 + 기사 URL 목록의 해시)"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f'{total_article_count}|{self.since_date or ""}'.encode())
+        for url in sorted(page_urls):
+            digest.update(b'\n' + url.encode())
+        return digest.hexdigest()
+
+    def _save_search_fingerprint(self, company_name: str, fingerprint: str):
+        """검색 지문 저장 (실패해도 크롤링은 계속)"""
+        try:
+            self.db.save_news_search_fingerprint(company_name, fingerprint)
+        except Exception as e:
+            self.logger.debug(f"    검색 지문 저장 실패: {e}")
 
-    async def _wait_for_articles(self, page, timeout: int = 15):
-        """동적 로딩 완료 대기 (기사가 로드될 때까지)"""
-        last_count = 0
-        stable = 0
+    async def _wait_for_selector(self, page, selector: str, timeout: int = 10) -> bool:
+        """요소가 DOM에 나타날 때까지 대기 (MutationObserver로 나타나는 즉시 반환)"""
+        script = _js_call('__newsWaitFor', selector, timeout * 1000)
+        return await self._evaluate_promise(page, script, timeout) is True
 
-        for _ in range(timeout):
+    async def _evaluate_promise(self, page, script: str, timeout: int):
+        """Promise를 반환하는 스크립트를 실행하고 결과 반환
+
+        페이지 이동 중이라 실행 컨텍스트가 없으면 잠시 후 남은 시간 안에서 다시 시도
+        """
+        deadline = asyncio.get_running_loop().time() + timeout
+        while True:
             try:
-                count = await page.evaluate('document.querySelectorAll(".item-box01").length')
-                if count and count > 0:
-                    if count == last_count:
-                        stable += 1
-                        if stable >= 2:  # 2초 연속 같으면 로딩 완료
-                            return True
-                    else:
-                        stable = 0
-                        last_count = count
-            except:
-                pass
-            await asyncio.sleep(1)
+                return await page.evaluate(script, await_promise=True, return_by_value=True)
+            except Exception:
+                if asyncio.get_running_loop().time() + 0.25 >= deadline:
+                    return None
+                await asyncio.sleep(0.25)
+
+    def _fetch_article_http(self, news_url: str) -> Optional[Dict[str, Any]]:
+        """HTTP 요청 + HTML 파싱으로 기사 상세 수집 (본문을 못 얻으면 None - 브라우저로 재시도)"""
+        try:
+            response = self._http.get(news_url, timeout=settings.crawler.timeout)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            self.logger.debug(f"    HTTP 상세 수집 실패, 브라우저로 재시도: {e}")
+            return None
+
+        soup = BeautifulSoup(response.content, 'lxml')
+
+        def text_of(selector: str) -> Optional[str]:
+            elem = soup.select_one(selector)
+            return elem.get_text().strip() if elem else None
+
+        detail = {
+            'news_url': news_url,
+            'title': text_of('h1.tit01'),
+            'published_at': _parse_published_at(text_of('.txt-time01')),
+            'subtitle': text_of('.tit-sub h2.tit01'),
+            'reporter_name': text_of('.tit-name a'),
+            'content': None
+        }
 
-        return last_count > 0
+        content_area = soup.select_one('.story-news.article')
+        if content_area:
+            # 광고, 저작권 등 제외
+            detail['content'] = _join_content(
+                p.get_text().strip() for p in content_area.select('p')
+                if not _CONTENT_EXCLUDE_CLASSES.intersection(p.get('class') or ())
+            )
+
+        return detail if detail['content'] else None
+
+    async def _navigate(self, page, url: str):
+        """페이지 이동 후 load 이벤트까지 대기 (고정 대기 대신, 최대 page_load_delay초)"""
+        loaded = asyncio.get_running_loop().create_future()
+        loaded_ids = set()  # load 이벤트가 온 loader id (이동 응답보다 먼저 올 수 있음)
+        loader_id = None
+
+        def on_lifecycle(event):
+            if event.name != 'load':
+                return
+            loaded_ids.add(event.loader_id)
+            if event.loader_id == loader_id and not loaded.done():
+                loaded.set_result(True)
+
+        page.add_handler(cdp.page.LifecycleEvent, on_lifecycle)
+        try:
+            await page.send(cdp.page.enable())
+            await page.send(cdp.page.set_lifecycle_events_enabled(enabled=True))
+            await self._bucket.acquire()
+            _, loader_id, *_ = await page.send(cdp.page.navigate(url))
+
+            # loader id가 없으면 같은 문서 내 이동 - 기다릴 로드 없음
+            if loader_id is not None and loader_id not in loaded_ids:
+                await asyncio.wait_for(loaded, timeout=self.page_load_delay)
+        except asyncio.TimeoutError:
+            self.logger.debug(f"    로드 이벤트 대기 시간 초과: {url}")
+        finally:
+            page.remove_handler(cdp.page.LifecycleEvent, on_lifecycle)
+
+    async def _new_tab(self, isolated: bool = False):
+        """빈 탭 생성 (공통 페이지 함수 등록, 설정 시 이미지/폰트/미디어/광고 스크립트 요청 차단)
 
-    async def get_article_detail(self, news_url: str) -> Dict[str, Any]:
+        Args:
+            isolated: True면 별도 브라우저 컨텍스트(쿠키/캐시 분리)에 생성 - 동시 수집 중인 회사끼리 세션 충돌 방지
+        """
+        browser = await self._get_browser()
+        if isolated and hasattr(browser, 'create_context'):
+            tab = await browser.create_context('about:blank')
+        else:
+            tab = await browser.get('about:blank', new_tab=True)
+        await tab.send(cdp.page.add_script_to_evaluate_on_new_document(source=_PAGE_HELPER_JS))
+        if self.block_resources:
+            await tab.send(cdp.network.enable())
+            await tab.send(cdp.network.set_blocked_ur_ls(urls=list(_BLOCKED_URL_PATTERNS)))
+        return tab
+
+    async def _open_detail_tab(self):
+        """기사 상세 수집용 탭 생성 (추출 함수를 새 문서마다 자동 설치되도록 한 번만 등록)"""
+        tab = await self._new_tab()
+        await tab.send(cdp.page.add_script_to_evaluate_on_new_document(source=_DETAIL_HELPER_JS))
+        return tab
+
+    async def get_article_detail(self, news_url: str, page=None) -> Dict[str, Any]:
         """기사 상세 페이지에서 정보 수집
 
         Args:
             news_url: 기사 URL
+            page: 재사용할 상세 수집용 탭 (없으면 새 탭을 열고 수집 후 닫음)
 
         Returns:
             기사 상세 정보 {title, published_at, subtitle, reporter_name, content}
@@ -384,92 +684,36 @@ class NewsCrawler:
         if not NODRIVER_AVAILABLE:
             return detail
 
+        own_page = page is None
         try:
-            browser = await self._get_browser()
-            page = await browser.get(news_url)
-            await asyncio.sleep(self.page_load_delay)
+            if own_page:
+                page = await self._open_detail_tab()
+            await self._navigate(page, news_url)
 
             # 기사 제목 요소 로드 대기 (최대 10초)
-            for wait_attempt in range(10):
-                try:
-                    has_title = await page.evaluate('document.querySelector("h1.tit01") !== null')
-                    if has_title:
-                        break
-                except:
-                    pass
-                await asyncio.sleep(1)
+            await self._wait_for_selector(page, 'h1.tit01', timeout=10)
 
             # 페이지 하단까지 스크롤
             await self._scroll_to_bottom(page)
 
-            # 기사 상세 정보 추출
-            detail_js = r'''
-                JSON.stringify((() => {
-                    const data = {
-                        title: null,
-                        published_at: null,
-                        subtitle: null,
-                        reporter_name: null,
-                        content: null
-                    };
-
-                    // 제목: <h1 class="tit01">
-                    const titleEl = document.querySelector('h1.tit01');
-                    if (titleEl) data.title = titleEl.innerText.trim();
-
-                    // 게시일시: <p class="txt-time01">
-                    const timeEl = document.querySelector('.txt-time01');
-                    if (timeEl) {
-                        // "송고2026-01-29 17:16" 형태에서 날짜만 추출
-                        const timeText = timeEl.innerText.trim();
-                        const match = timeText.match(/(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2})/);
-                        if (match) data.published_at = match[1];
-                    }
-
-                    // 기자이름: <strong class="tit-name"> 내 <a>
-                    const reporterEl = document.querySelector('.tit-name a');
-                    if (reporterEl) data.reporter_name = reporterEl.innerText.trim();
-
-                    // 부제목: <div class="tit-sub"> 내 <h2 class="tit01">
-                    const subtitleEl = document.querySelector('.tit-sub h2.tit01');
-                    if (subtitleEl) data.subtitle = subtitleEl.innerText.trim();
-
-                    // 내용: <div class="story-news article"> 내 <p> 태그들
-                    const contentArea = document.querySelector('.story-news.article');
-                    if (contentArea) {
-                        const paragraphs = contentArea.querySelectorAll('p');
-                        const contentParts = [];
-
-                        paragraphs.forEach(p => {
-                            // 광고, 저작권 등 제외
-                            const text = p.innerText.trim();
-                            if (text &&
-                                !text.includes('저작권자') &&
-                                !text.includes('무단 전재') &&
-                                !text.includes('제보는 카카오톡') &&
-                                !p.classList.contains('txt-copyright') &&
-                                !p.classList.contains('txt-desc')) {
-                                contentParts.push(text);
-                            }
-                        });
-
-                        data.content = contentParts.join('\n\n');
-                    }
-
-                    return data;
-                })())
-            '''
+            # 기사 상세 정보 추출 (탭에 설치된 추출 함수 호출)
+            result = await page.evaluate(_DETAIL_CALL_JS, return_by_value=True)
 
-            result = await page.evaluate(detail_js)
-
-            if isinstance(result, str):
-                import json
-                detail.update(json.loads(result))
-            elif isinstance(result, dict):
+            if isinstance(result, dict):
+                content_parts = result.pop('content_parts', None)
+                detail['published_at'] = _parse_published_at(result.pop('raw_time', None))
                 detail.update(result)
+                if content_parts is not None:
+                    detail['content'] = _join_content(content_parts)
 
         except Exception as e:
             self.logger.error(f"기사 상세 수집 오류: {e}")
+        finally:
+            if own_page and page is not None:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
 
         return detail
 
@@ -504,7 +748,7 @@ class NewsCrawler:
         existing_urls = self.db.get_existing_news_urls(company_name)
 
         # ========== 1단계 & 2단계: 기사 URL 목록 수집 ==========
-        news_list = await self.search_news(company_name, existing_urls=existing_urls)
+        news_list, fingerprint = await self._search_news(company_name, existing_urls)
         result['total_found'] = len(news_list)
 
         if not news_list:
@@ -512,61 +756,100 @@ class NewsCrawler:
             return result
 
         # 기존 URL 필터링 (이미 DB에 있는 URL은 스킵) - existing_urls는 위에서 이미 조회됨
-        new_articles = [a for a in news_list if a.get('news_url') not in existing_urls]
-        skipped_count = len(news_list) - len(new_articles)
+        new_articles = [a for a in news_list if a['news_url'] not in existing_urls]
+        total = len(new_articles)
+        skipped_count = result['total_found'] - total
 
-        self.logger.info(f"  URL 수집 결과: 총 {len(news_list)}개, 신규 {len(new_articles)}개, 기존 {skipped_count}개")
+        self.logger.info(f"  URL 수집 결과: 총 {result['total_found']}개, 신규 {total}개, 기존 {skipped_count}개")
 
         if not new_articles:
             self.logger.info(f"  모든 기사 이미 수집됨, 다음 회사로 이동")
             result['duplicate_count'] = skipped_count
+            if fingerprint:
+                self._save_search_fingerprint(company_name, fingerprint)
             return result
 
         # ========== 3단계: 각 URL 방문하여 상세 내용 수집 ==========
-        self.logger.info(f"  [3단계] 기사 상세 내용 수집 시작 ({len(new_articles)}개)")
+        self.logger.info(f"  [3단계] 기사 상세 내용 수집 시작 ({total}개)")
 
+        # 탭 풀 크기만큼 동시 수집 - 슬롯마다 탭을 재사용하고 브라우저가 재시작되면 새로 생성
+        tab_pool = asyncio.Queue()
+        for _ in range(max(1, min(self.detail_concurrency, total))):
+            tab_pool.put_nowait([None, None])  # [탭을 연 브라우저, 탭]
+        error_lock = asyncio.Lock()
         consecutive_errors = 0
-        for i, article in enumerate(new_articles, 1):
-            try:
-                self.logger.info(f"    [{i}/{len(new_articles)}] {article.get('title', '')[:30]}...")
 
-                # 상세 정보 수집
-                detail = await self.get_article_detail(article['news_url'])
-
-                if detail.get('content'):
+        async def fetch(i: int, article: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            nonlocal consecutive_errors
+            slot = await tab_pool.get()
+            try:
+                self.logger.info(f"    [{i}/{total}] {article.get('title', '')[:30]}...")
+
+                # 상세 정보 수집 - 정적 HTML로 먼저 시도하고 본문이 없을 때만 브라우저 사용
+                # (요청 간격은 탭 수와 관계없이 크롤러 전체가 공유하는 토큰 버킷으로 조절)
+                await self._bucket.acquire()
+                detail = await asyncio.to_thread(self._fetch_article_http, article['news_url'])
+                if detail is None:
+                    if slot[1] is None or slot[0] is not self._browser:
+                        slot[1] = await self._open_detail_tab()
+                        slot[0] = self._browser
+                    detail = await self.get_article_detail(article['news_url'], page=slot[1])
+
+                content = detail.get('content')
+                if content:
                     # 목록 정보와 상세 정보 병합
-                    article.update({
-                        'subtitle': detail.get('subtitle'),
-                        'reporter_name': detail.get('reporter_name'),
-                        'content': detail.get('content')
-                    })
-                    if detail.get('title'):
-                        article['title'] = detail['title']
-                    if detail.get('published_at'):
-                        article['published_at'] = detail['published_at']
-
-                    result['articles'].append(article)
-                    consecutive_errors = 0
-                    self.logger.info(f"    [{i}/{len(new_articles)}] 수집 완료 (내용 {len(detail.get('content', ''))}자)")
-                else:
-                    self.logger.warning(f"    [{i}/{len(new_articles)}] 내용 없음")
-
-                # 다음 기사 전 대기 (가이드: 1초)
-                await asyncio.sleep(self.article_delay)
+                    article['subtitle'] = detail.get('subtitle')
+                    article['reporter_name'] = detail.get('reporter_name')
+                    article['content'] = content
+                    title = detail.get('title')
+                    if title:
+                        article['title'] = title
+                    published_at = detail.get('published_at')
+                    if published_at:
+                        article['published_at'] = published_at
+
+                    async with error_lock:
+                        consecutive_errors = 0
+                    self.logger.info(f"    [{i}/{total}] 수집 완료 (내용 {len(content)}자)")
+                    return article
+
+                self.logger.warning(f"    [{i}/{total}] 내용 없음")
+                return None
 
             except Exception as e:
-                self.logger.warning(f"    [{i}/{len(new_articles)}] 수집 실패: {e}")
-                consecutive_errors += 1
-
-                if consecutive_errors >= 3:
-                    self.logger.warning("    연속 에러 발생, 브라우저 재시작")
-                    self.close()
-                    await asyncio.sleep(3)
-                    consecutive_errors = 0
+                self.logger.warning(f"    [{i}/{total}] 수집 실패: {e}")
+                async with error_lock:
+                    consecutive_errors += 1
+                    if consecutive_errors >= 3:
+                        consecutive_errors = 0
+                        if self._active_companies > 1:
+                            # 다른 회사의 검색/상세 탭도 같은 브라우저를 쓰므로 동시 수집 중에는 재시작하지 않음
+                            self.logger.warning("    연속 에러 발생 (다른 회사 수집 중이라 브라우저 재시작 생략)")
+                        else:
+                            self.logger.warning("    연속 에러 발생, 브라우저 재시작")
+                            await self._restart_browser()
+                            await asyncio.sleep(3)
+                return None
+
+            finally:
+                tab_pool.put_nowait(slot)
+
+        collected = await asyncio.gather(*(fetch(i, article) for i, article in enumerate(new_articles, 1)))
+        result['articles'] = [article for article in collected if article is not None]
+
+        # 상세 수집용 탭 정리
+        while not tab_pool.empty():
+            owner, tab = tab_pool.get_nowait()
+            if tab is not None and owner is self._browser:
+                try:
+                    await tab.close()
+                except Exception:
+                    pass
 
-        self.logger.info(f"  [3단계 완료] {len(result['articles'])}/{len(new_articles)}개 상세 수집 완료")
+        self.logger.info(f"  [3단계 완료] {len(result['articles'])}/{total}개 상세 수집 완료")
 
         # ========== 4단계: DB 저장 ==========
+        saved = False
         if result['articles']:
             try:
                 save_result = self.db.add_company_news(company_name, result['articles'], company_id)
@@ -574,29 +857,65 @@ class NewsCrawler:
                 result['duplicate_count'] = save_result.get('duplicate_count', 0) + skipped_count
                 result['updated_count'] = save_result['updated_count']
                 self.logger.info(f"  [DB 저장] 신규 {save_result['new_count']}건, 업데이트 {save_result['updated_count']}건")
+                saved = True
             except Exception as e:
                 self.logger.error(f"  [DB 저장 실패] {e}")
         else:
             result['duplicate_count'] = skipped_count
 
+        # 신규 기사를 모두 수집/저장한 경우에만 지문 저장 (누락분은 다음 검색에서 이후 페이지까지 다시 탐색)
+        if fingerprint and saved and len(result['articles']) == total:
+            self._save_search_fingerprint(company_name, fingerprint)
+
         self.logger.info(f"  ========== {company_name} 완료 ==========\n")
         return result
 
+    async def crawl_many(self, companies: List[str], concurrency: int = None) -> List[Dict[str, Any]]:
+        """여러 회사의 뉴스를 동시에 수집
+
+        Args:
+            companies: 회사명 목록 (company_id는 회사별로 조회)
+            concurrency: 동시에 수집할 회사 수 (기본: 설정값)
+
+        Returns:
+            회사 순서대로의 수집 결과 목록 (회사별 소요 시간은 elapsed 키, 실패한 회사는 error 키 포함)
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency or self.company_concurrency))
+
+        async def bounded(company_name: str) -> Dict[str, Any]:
+            async with semaphore:
+                self._active_companies += 1
+                start_time = time.time()
+                try:
+                    company_id = self.db.get_company_id_by_name(company_name)
+                    result = await self.crawl_company_news(company_name, company_id)
+                except Exception as e:
+                    self.logger.error(f"  {company_name} 뉴스 수집 실패: {e}")
+                    result = {'company_name': company_name, 'total_found': 0, 'error': str(e)}
+                finally:
+                    self._active_companies -= 1
+                result['elapsed'] = time.time() - start_time
+                return result
+
+        return await asyncio.gather(*(bounded(company_name) for company_name in companies))
+
+    def crawl_many_sync(self, companies: List[str], concurrency: int = None) -> List[Dict[str, Any]]:
+        """동기 방식으로 여러 회사 뉴스 동시 수집 (main.py에서 호출용)"""
+        return self._get_loop().run_until_complete(self.crawl_many(companies, concurrency))
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """크롤러 전용 이벤트 루프 반환 (최초 호출 시 생성, close()까지 유지)"""
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop
+
     def crawl_company_news_sync(self, company_name: str, company_id: Optional[int] = None) -> Dict[str, Any]:
         """동기 방식으로 회사 뉴스 크롤링 (main.py에서 호출용)"""
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_closed():
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-        return loop.run_until_complete(self.crawl_company_news(company_name, company_id))
+        return self._get_loop().run_until_complete(self.crawl_company_news(company_name, company_id))
 
     def close(self):
-        """브라우저 종료"""
+        """브라우저 종료 (HTTP 세션 연결도 정리, 수집 중이 아니면 이벤트 루프도 종료)"""
+        self._http.close()
         if self._browser:
             try:
                 self._browser.stop()
@@ -604,3 +923,7 @@ class NewsCrawler:
                 pass
             self._browser = None
             self.logger.info("브라우저 종료됨")
+
+        if self._loop is not None and not self._loop.is_running():
+            self._loop.close()
+            self._loop = None
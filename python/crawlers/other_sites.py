@@ -2,12 +2,25 @@
 잡코리아, 점핏, 프로그래머스 크롤러
 """
 import re
-from typing import List, Optional, Dict
+from typing import Iterator, Optional, Dict
 from urllib.parse import urlencode
-from bs4 import BeautifulSoup
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
 
 from .base import BaseCrawler, JobPosting
 
+# 경력 조건 ("신입" 또는 "3년 이상"의 연수) - 한 번의 스캔으로 두 조건 모두 확인
+_EXPERIENCE_RE = re.compile(r'신입|(\d+)\s*년')
+
+# 검색 결과 목록 아이템만 트리로 생성 (헤더/광고/푸터 등은 파싱 생략)
+_JOBKOREA_LIST_STRAINER = SoupStrainer(class_=["list-post", "recruit-info"])
+
+# 목록 아이템 선택자 (아이템마다 다시 파싱하지 않도록 미리 컴파일)
+_JOBKOREA_TITLE_SEL = sv.compile(".post-list-info a, .title a")
+_JOBKOREA_COMPANY_SEL = sv.compile(".post-list-corp a, .name a")
+_JOBKOREA_OPTION_SEL = sv.compile(".post-list-info .option, .etc")
+_JOBKOREA_SPAN_SEL = sv.compile("span")
+
 
 class JobKoreaCrawler(BaseCrawler):
     """잡코리아 크롤러"""
@@ -18,25 +31,24 @@ class JobKoreaCrawler(BaseCrawler):
     def __init__(self):
         super().__init__("jobkorea")
     
-    def search(self, keyword: str, max_pages: int = None) -> List[JobPosting]:
-        """키워드로 채용 공고 검색"""
+    def search(self, keyword: str, max_pages: int = None) -> Iterator[JobPosting]:
+        """키워드로 채용 공고 검색 (파싱되는 대로 yield)"""
         max_pages = max_pages or self.config.max_pages
-        jobs = []
         
-        for page in range(1, max_pages + 1):
+        def fetch(page: int) -> Optional[bytes]:
             params = {
                 "stext": keyword,
                 "tabType": "recruit",
                 "Page_No": page,
             }
-            
-            url = f"{self.SEARCH_URL}?{urlencode(params)}"
-            html = self._get_page(url)
-            
+            return self._get_page(f"{self.SEARCH_URL}?{urlencode(params)}")
+        
+        # 다음 페이지는 현재 페이지를 파싱하는 동안 미리 요청
+        for page, html in self._iter_pages(fetch, max_pages):
             if not html:
                 break
             
-            soup = BeautifulSoup(html, "html.parser")
+            soup = BeautifulSoup(html, "lxml", parse_only=_JOBKOREA_LIST_STRAINER)
             job_items = soup.select(".list-post")
             
             if not job_items:
@@ -49,17 +61,15 @@ class JobKoreaCrawler(BaseCrawler):
             for item in job_items:
                 job = self._parse_list_item(item)
                 if job:
-                    jobs.append(job)
+                    yield job
             
             self.logger.debug(f"페이지 {page} 완료: {len(job_items)}개")
-        
-        return jobs
     
     def _parse_list_item(self, item) -> Optional[JobPosting]:
         """목록 아이템 파싱"""
         try:
             # 제목 및 URL
-            title_elem = item.select_one(".post-list-info a, .title a")
+            title_elem = _JOBKOREA_TITLE_SEL.select_one(item)
             if not title_elem:
                 return None
             
@@ -68,19 +78,16 @@ class JobKoreaCrawler(BaseCrawler):
             job_url = f"{self.BASE_URL}{href}" if href.startswith("/") else href
             
             # 회사명
-            company_elem = item.select_one(".post-list-corp a, .name a")
+            company_elem = _JOBKOREA_COMPANY_SEL.select_one(item)
             company = company_elem.get_text(strip=True) if company_elem else ""
             
             # 조건 정보
-            option_elem = item.select_one(".post-list-info .option, .etc")
-            conditions = []
-            if option_elem:
-                conditions = [span.get_text(strip=True) 
-                            for span in option_elem.select("span")]
-            
-            location = conditions[0] if len(conditions) > 0 else ""
-            experience = conditions[1] if len(conditions) > 1 else ""
-            education = conditions[2] if len(conditions) > 2 else ""
+            option_elem = _JOBKOREA_OPTION_SEL.select_one(item)
+            # 앞의 세 span만 사용 (지역, 경력, 학력)
+            spans = _JOBKOREA_SPAN_SEL.select(option_elem, limit=3) if option_elem else ()
+            location = spans[0].get_text(strip=True) if len(spans) > 0 else ""
+            experience = spans[1].get_text(strip=True) if len(spans) > 1 else ""
+            education = spans[2].get_text(strip=True) if len(spans) > 2 else ""
             
             exp_min, exp_max = self._parse_experience(experience)
             
@@ -110,11 +117,15 @@ class JobKoreaCrawler(BaseCrawler):
     def _parse_experience(self, text: str) -> tuple:
         if not text:
             return 0, 0
-        if "신입" in text:
-            return 0, 0
-        match = re.search(r'(\d+)\s*년', text)
-        if match:
-            return int(match.group(1)), 99
+        min_years = None
+        for match in _EXPERIENCE_RE.finditer(text):
+            years = match.group(1)
+            if years is None:
+                return 0, 0  # 신입이 포함되면 연수와 관계없이 신입
+            if min_years is None:
+                min_years = int(years)
+        if min_years is not None:
+            return min_years, 99
         return 0, 0
 
 
@@ -123,25 +134,28 @@ class JumpitCrawler(BaseCrawler):
     
     BASE_URL = "https://www.jumpit.co.kr"
     API_URL = "https://api.jumpit.co.kr/api"
+    POSITION_URL = f"{BASE_URL}/position/"  # + 공고 ID
     
     def __init__(self):
         super().__init__("jumpit")
+        # JSON API만 사용 (HTML 응답/파싱 경로 없음)
+        self.session.headers["Accept"] = "application/json"
     
-    def search(self, keyword: str, max_pages: int = None) -> List[JobPosting]:
-        """키워드로 채용 공고 검색"""
+    def search(self, keyword: str, max_pages: int = None) -> Iterator[JobPosting]:
+        """키워드로 채용 공고 검색 (파싱되는 대로 yield)"""
         max_pages = max_pages or self.config.max_pages
-        jobs = []
+        url = f"{self.API_URL}/positions"
         
-        for page in range(1, max_pages + 1):
-            url = f"{self.API_URL}/positions"
+        def fetch(page: int) -> Optional[Dict]:
             params = {
                 "page": page,
                 "sort": "rsp_rate",
                 "keyword": keyword,
             }
-            
-            data = self._get_json(url, params=params)
-            
+            return self._get_json(url, params=params)
+        
+        # 다음 페이지는 현재 페이지를 파싱하는 동안 미리 요청
+        for page, data in self._iter_pages(fetch, max_pages):
             if not data or "result" not in data:
                 break
             
@@ -153,32 +167,33 @@ class JumpitCrawler(BaseCrawler):
             for item in positions:
                 job = self._parse_list_item(item)
                 if job:
-                    jobs.append(job)
+                    yield job
             
             self.logger.debug(f"페이지 {page} 완료: {len(positions)}개")
-        
-        return jobs
     
     def _parse_list_item(self, item: Dict) -> Optional[JobPosting]:
         """목록 아이템 파싱"""
         try:
-            job_id = item.get("id")
-            company_info = item.get("company", {})
+            get = item.get
+            job_id = get("id")
+            company_info = get("company", {})
             
             # 기술 스택
-            tech_stacks = item.get("techStacks", [])
+            tech_stacks = get("techStacks", [])
             skills = [tech.get("stack", "") for tech in tech_stacks]
             
             # 경력
-            min_career = item.get("minCareer", 0) or 0
-            max_career = item.get("maxCareer", 0) or 99
+            min_career = get("minCareer", 0) or 0
+            max_career = get("maxCareer", 0) or 99
+            
+            locations = get("locations")
             
             return JobPosting(
-                title=item.get("title", ""),
+                title=get("title", ""),
                 company=company_info.get("name", ""),
-                url=f"{self.BASE_URL}/position/{job_id}",
+                url=self.POSITION_URL + str(job_id),
                 source=self.site_name,
-                location=item.get("locations", [""])[0] if item.get("locations") else "",
+                location=locations[0] if locations else "",
                 experience_min=min_career,
                 experience_max=max_career,
                 required_skills=skills,
@@ -191,7 +206,7 @@ class JumpitCrawler(BaseCrawler):
     def get_job_detail(self, job_id: str) -> Optional[JobPosting]:
         """상세 정보 가져오기"""
         url = f"{self.API_URL}/position/{job_id}"
-        data = self._get_json(url)
+        data = self._get_detail_json(url)
         
         if not data or "result" not in data:
             return None
@@ -210,7 +225,7 @@ class JumpitCrawler(BaseCrawler):
         return JobPosting(
             title=result.get("title", ""),
             company=company.get("name", ""),
-            url=f"{self.BASE_URL}/position/{job_id}",
+            url=self.POSITION_URL + str(job_id),
             source=self.site_name,
             location=result.get("location", ""),
             experience_min=result.get("minCareer", 0) or 0,
@@ -229,24 +244,27 @@ class ProgrammersCrawler(BaseCrawler):
     
     BASE_URL = "https://career.programmers.co.kr"
     API_URL = f"{BASE_URL}/api/job_positions"
+    POSITION_URL = f"{BASE_URL}/job_positions/"  # + 공고 ID
     
     def __init__(self):
         super().__init__("programmers")
+        # JSON API만 사용 (HTML 응답/파싱 경로 없음)
+        self.session.headers["Accept"] = "application/json"
     
-    def search(self, keyword: str, max_pages: int = None) -> List[JobPosting]:
-        """키워드로 채용 공고 검색"""
+    def search(self, keyword: str, max_pages: int = None) -> Iterator[JobPosting]:
+        """키워드로 채용 공고 검색 (파싱되는 대로 yield)"""
         max_pages = max_pages or self.config.max_pages
-        jobs = []
         
-        for page in range(1, max_pages + 1):
+        def fetch(page: int) -> Optional[Dict]:
             params = {
                 "page": page,
                 "query": keyword,
                 "order": "recent",
             }
-            
-            data = self._get_json(self.API_URL, params=params)
-            
+            return self._get_json(self.API_URL, params=params)
+        
+        # 다음 페이지는 현재 페이지를 파싱하는 동안 미리 요청
+        for page, data in self._iter_pages(fetch, max_pages):
             if not data or "jobPositions" not in data:
                 break
             
@@ -258,37 +276,33 @@ class ProgrammersCrawler(BaseCrawler):
             for item in positions:
                 job = self._parse_list_item(item)
                 if job:
-                    jobs.append(job)
+                    yield job
             
             self.logger.debug(f"페이지 {page} 완료: {len(positions)}개")
+    
+    def _to_job_posting(self, data: Dict, job_id, **details) -> JobPosting:
+        """목록/상세 API 공통 필드로 JobPosting 생성 (상세 전용 필드는 details로 전달)"""
+        get = data.get
+        company = get("company") or {}
+        skills = [tech.get("name", "") for tech in get("technicalTags", [])]
         
-        return jobs
+        return JobPosting(
+            title=get("title", ""),
+            company=company.get("name", ""),
+            url=self.POSITION_URL + str(job_id),
+            source=self.site_name,
+            location=get("address", ""),
+            experience_min=get("minCareer") or 0,
+            experience_max=get("maxCareer") or 99,
+            required_skills=skills,
+            industry=company.get("industryName", ""),
+            **details,
+        )
     
     def _parse_list_item(self, item: Dict) -> Optional[JobPosting]:
         """목록 아이템 파싱"""
         try:
-            job_id = item.get("id")
-            company = item.get("company", {})
-            
-            # 기술 스택
-            tech_stacks = item.get("technicalTags", [])
-            skills = [tech.get("name", "") for tech in tech_stacks]
-            
-            # 경력
-            min_career = item.get("minCareer")
-            max_career = item.get("maxCareer")
-            
-            return JobPosting(
-                title=item.get("title", ""),
-                company=company.get("name", ""),
-                url=f"{self.BASE_URL}/job_positions/{job_id}",
-                source=self.site_name,
-                location=item.get("address", ""),
-                experience_min=min_career if min_career else 0,
-                experience_max=max_career if max_career else 99,
-                required_skills=skills,
-                industry=company.get("industryName", ""),
-            )
+            return self._to_job_posting(item, item.get("id"))
         except Exception as e:
             self.logger.error(f"아이템 파싱 실패: {e}")
             return None
@@ -296,27 +310,14 @@ class ProgrammersCrawler(BaseCrawler):
     def get_job_detail(self, job_id: str) -> Optional[JobPosting]:
         """상세 정보 가져오기"""
         url = f"{self.API_URL}/{job_id}"
-        data = self._get_json(url)
+        data = self._get_detail_json(url)
         
         if not data:
             return None
         
-        company = data.get("company", {})
-        
-        tech_stacks = data.get("technicalTags", [])
-        skills = [tech.get("name", "") for tech in tech_stacks]
-        
-        return JobPosting(
-            title=data.get("title", ""),
-            company=company.get("name", ""),
-            url=f"{self.BASE_URL}/job_positions/{job_id}",
-            source=self.site_name,
-            location=data.get("address", ""),
-            experience_min=data.get("minCareer") or 0,
-            experience_max=data.get("maxCareer") or 99,
-            required_skills=skills,
+        return self._to_job_posting(
+            data, job_id,
             description=data.get("description", ""),
             requirements=data.get("requirement", ""),
             benefits=data.get("preference", ""),
-            industry=company.get("industryName", ""),
         )
@@ -6,10 +6,36 @@ https://career.programmers.co.kr
 from typing import Generator, Dict, Any, Optional
 import re
 from datetime import datetime
+import soupsieve as sv
+from bs4 import SoupStrainer
 from .base_crawler import BaseCrawler
 from utils.helpers import clean_text
 
 
+# 공고 링크에서 ID 추출
+_JOB_ID_RE = re.compile(r'/job_positions/(\d+)')
+
+# HTML 검색 결과에서 공고 아이템만 트리로 생성
+_LISTING_STRAINER = SoupStrainer(class_=['job-position-item', 'list-position-item'])
+# 상세 페이지에서 본문 섹션과 기술 스택 태그만 트리로 생성
+_DETAIL_STRAINER = SoupStrainer(class_=['job-content-section', 'section', 'tech-stack-tag', 'skill-tag'])
+
+# HTML 파싱 선택자 (공고/섹션마다 다시 파싱하지 않도록 미리 컴파일)
+_LISTING_SEL = sv.compile('.job-position-item, .list-position-item')
+_LINK_SEL = sv.compile('a')
+_TITLE_SEL = sv.compile('.position-title, .job-title')
+_COMPANY_SEL = sv.compile('.company-name, .company')
+_TAG_SEL = sv.compile('.tag, .skill-tag, .tech-tag')
+_SECTION_SEL = sv.compile('.job-content-section, .section')
+_SECTION_HEADER_SEL = sv.compile('h3, .section-title')
+_SECTION_CONTENT_SEL = sv.compile('.content, .section-content')
+_DETAIL_TECH_SEL = sv.compile('.tech-stack-tag, .skill-tag')
+
+# 상세 섹션 제목 키워드 → 분류 (0: 소개/업무, 1: 자격요건, 2: 우대사항, 숫자가 작을수록 우선)
+_SECTION_BUCKETS = {'소개': 0, '담당': 0, '업무': 0, '자격': 1, '필수': 1, '우대': 2}
+_SECTION_CLASSIFIER = re.compile('|'.join(_SECTION_BUCKETS))
+
+
 class ProgrammersCrawler(BaseCrawler):
     """프로그래머스 채용공고 크롤러"""
     
@@ -18,6 +44,7 @@ class ProgrammersCrawler(BaseCrawler):
         self.site_name = "programmers"
         self.base_url = "https://career.programmers.co.kr"
         self.api_url = "https://career.programmers.co.kr/api"
+        self.position_url = f"{self.base_url}/job_positions/"  # + 공고 ID
         
         # 프로그래머스 특화 헤더
         self.session.headers.update({
@@ -30,48 +57,49 @@ class ProgrammersCrawler(BaseCrawler):
         프로그래머스 API를 통한 채용공고 검색
         """
         total_count = 0
+        # 검색 한 번에 수집한 공고는 같은 수집 시각을 공유
+        crawled_at = datetime.now()
+        # 프로그래머스 검색 API
+        search_url = f"{self.api_url}/job_positions"
         
-        for page in range(1, max_pages + 1):
+        def fetch(page: int) -> Optional[Dict]:
+            params = {
+                'page': page,
+                'per_page': 20,
+                'query': keyword,
+                'order': 'recent',
+            }
             try:
-                # 프로그래머스 검색 API
-                search_url = f"{self.api_url}/job_positions"
-                params = {
-                    'page': page,
-                    'per_page': 20,
-                    'query': keyword,
-                    'order': 'recent',
-                }
-                
-                data = self.get_json(search_url, params)
-                
-                if not data or 'jobPositions' not in data:
-                    # HTML 파싱 fallback
-                    yield from self._search_jobs_html(keyword, page)
-                    continue
-                
-                jobs = data.get('jobPositions', [])
-                
-                if not jobs:
-                    break
-                
-                for job in jobs:
-                    job_data = self._parse_job_listing(job)
-                    if job_data:
-                        yield job_data
-                        total_count += 1
-                
-                # 다음 페이지 확인
-                if len(jobs) < 20:
-                    break
-                    
+                return self.get_json(search_url, params)
             except Exception as e:
                 self.logger.error(f"Error searching page {page}: {e}")
+                return None
+        
+        # 다음 페이지는 현재 페이지를 처리하는 동안 미리 요청 (같은 세션의 keep-alive 연결 재사용)
+        for page, data in self.iter_pages(fetch, max_pages):
+            if not data or 'jobPositions' not in data:
                 # HTML 파싱 fallback
-                yield from self._search_jobs_html(keyword, page)
+                yield from self._search_jobs_html(keyword, page, crawled_at)
+                continue
+            
+            jobs = data.get('jobPositions', [])
+            
+            if not jobs:
+                break
+            
+            for job in jobs:
+                job_data = self._parse_job_listing(job, crawled_at)
+                if job_data:
+                    yield job_data
+                    total_count += 1
+            
+            # 다음 페이지 확인
+            if len(jobs) < 20:
+                break
         
         self.logger.info(f"Found {total_count} jobs for keyword: {keyword}")
     
-    def _search_jobs_html(self, keyword: str, page: int) -> Generator[Dict[str, Any], None, None]:
+    def _search_jobs_html(self, keyword: str, page: int, crawled_at: datetime) -> Generator[Dict[str, Any], None, None]:
         """HTML 파싱 방식 검색 (fallback)"""
         try:
             search_url = f"{self.base_url}/job_positions"
@@ -80,22 +108,22 @@ class ProgrammersCrawler(BaseCrawler):
                 'query': keyword,
             }
             
-            soup = self.get_page(search_url, params)
+            soup = self.get_page(search_url, params, parse_only=_LISTING_STRAINER)
             
             if not soup:
                 return
             
-            job_list = soup.select('.job-position-item, .list-position-item')
+            job_list = _LISTING_SEL.select(soup)
             
             for job_elem in job_list:
-                job_data = self._parse_job_listing_html(job_elem)
+                job_data = self._parse_job_listing_html(job_elem, crawled_at)
                 if job_data:
                     yield job_data
                     
         except Exception as e:
             self.logger.error(f"Error in HTML search: {e}")
     
-    def _parse_job_listing(self, job: Dict) -> Optional[Dict[str, Any]]:
+    def _parse_job_listing(self, job: Dict, crawled_at: datetime) -> Optional[Dict[str, Any]]:
         """API 응답에서 채용공고 정보 파싱"""
         try:
             job_id = str(job.get('id', ''))
@@ -116,8 +144,8 @@ class ProgrammersCrawler(BaseCrawler):
                 'location': job.get('address', ''),
                 'employment_type': job.get('employmentType', {}).get('name', '정규직'),
                 'required_skills': tech_stacks,
-                'url': f"{self.base_url}/job_positions/{job_id}",
-                'crawled_at': datetime.now(),
+                'url': self.position_url + job_id,
+                'crawled_at': crawled_at,
                 'min_career': job.get('minCareer'),
                 'max_career': job.get('maxCareer'),
             }
@@ -125,31 +153,31 @@ class ProgrammersCrawler(BaseCrawler):
             self.logger.error(f"Error parsing job listing: {e}")
             return None
     
-    def _parse_job_listing_html(self, elem) -> Optional[Dict[str, Any]]:
+    def _parse_job_listing_html(self, elem, crawled_at: datetime) -> Optional[Dict[str, Any]]:
         """HTML 요소에서 채용공고 정보 파싱"""
         try:
             # 링크 및 ID 추출
-            link_elem = elem.select_one('a')
+            link_elem = _LINK_SEL.select_one(elem)
             if not link_elem:
                 return None
             
             href = link_elem.get('href', '')
-            job_id_match = re.search(r'/job_positions/(\d+)', href)
+            job_id_match = _JOB_ID_RE.search(href)
             job_id = job_id_match.group(1) if job_id_match else ""
             
             if not job_id:
                 return None
             
             # 제목
-            title_elem = elem.select_one('.position-title, .job-title')
+            title_elem = _TITLE_SEL.select_one(elem)
             title = clean_text(title_elem.text) if title_elem else ""
             
             # 회사명
-            company_elem = elem.select_one('.company-name, .company')
+            company_elem = _COMPANY_SEL.select_one(elem)
             company_name = clean_text(company_elem.text) if company_elem else ""
             
             # 기술 스택
-            tech_elems = elem.select('.tag, .skill-tag, .tech-tag')
+            tech_elems = _TAG_SEL.select(elem)
             tech_stacks = [clean_text(t.text) for t in tech_elems]
             
             return {
@@ -158,8 +186,8 @@ class ProgrammersCrawler(BaseCrawler):
                 'title': title,
                 'company_name': company_name,
                 'required_skills': tech_stacks,
-                'url': f"{self.base_url}/job_positions/{job_id}",
-                'crawled_at': datetime.now(),
+                'url': self.position_url + job_id,
+                'crawled_at': crawled_at,
             }
         except Exception as e:
             self.logger.error(f"Error parsing HTML job listing: {e}")
@@ -184,7 +212,7 @@ class ProgrammersCrawler(BaseCrawler):
         try:
             # API 시도
             detail_url = f"{self.api_url}/job_positions/{job_id}"
-            data = self.get_json(detail_url)
+            data = self.get_detail_json(detail_url, job_id)
             
             if data and 'jobPosition' in data:
                 job = data['jobPosition']
@@ -208,35 +236,35 @@ class ProgrammersCrawler(BaseCrawler):
     def _get_job_detail_html(self, job_id: str) -> Optional[Dict[str, Any]]:
         """HTML 파싱으로 상세 정보 가져오기"""
         try:
-            detail_url = f"{self.base_url}/job_positions/{job_id}"
-            soup = self.get_page(detail_url)
+            detail_url = self.position_url + str(job_id)
+            soup = self.get_page(detail_url, parse_only=_DETAIL_STRAINER)
             
             if not soup:
                 return None
             
-            description = ""
-            requirements = ""
-            preferred = ""
+            # 분류별 본문 (description, requirements, preferred)
+            texts = ["", "", ""]
             
-            # 섹션별 파싱
-            sections = soup.select('.job-content-section, .section')
+            # 섹션별 파싱 - 제목을 한 번만 스캔해 분류하고, 분류된 섹션만 본문 추출
+            sections = _SECTION_SEL.select(soup)
             for section in sections:
-                header = section.select_one('h3, .section-title')
-                content = section.select_one('.content, .section-content')
+                header = _SECTION_HEADER_SEL.select_one(section)
+                if not header:
+                    continue
                 
-                if header and content:
-                    header_text = clean_text(header.text).lower()
-                    content_text = clean_text(content.get_text())
-                    
-                    if any(word in header_text for word in ['소개', '담당', '업무']):
-                        description = content_text
-                    elif any(word in header_text for word in ['자격', '필수']):
-                        requirements = content_text
-                    elif any(word in header_text for word in ['우대']):
-                        preferred = content_text
+                keywords = _SECTION_CLASSIFIER.findall(clean_text(header.text).lower())
+                if not keywords:
+                    continue
+                
+                content = _SECTION_CONTENT_SEL.select_one(section)
+                if content:
+                    bucket = min(_SECTION_BUCKETS[word] for word in keywords)
+                    texts[bucket] = clean_text(content.get_text())
+            
+            description, requirements, preferred = texts
             
             # 기술 스택
-            tech_elems = soup.select('.tech-stack-tag, .skill-tag')
+            tech_elems = _DETAIL_TECH_SEL.select(soup)
             tech_stacks = [clean_text(t.text) for t in tech_elems]
             
             return {
@@ -8,16 +8,69 @@ API와 HTML 파싱 방식 모두 지원
 """
 
 import re
-import json
 import time
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Generator
 from urllib.parse import urlencode, quote
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
 
 from .base_crawler import BaseCrawler
 from config.settings import settings
 from utils.helpers import clean_text, extract_skills_from_text, categorize_job_level
 
 
+# 공고 링크에서 ID 추출
+_JOB_ID_RE = re.compile(r'/jobs/(\d+)')
+
+# 재게시/교차 게시 공고 비교용 - 공백/기호 차이는 무시
+_SIGNATURE_STRIP_RE = re.compile(r'[\W_]+')
+_SIGNATURE_FIELDS = ('title', 'company_name', 'location')
+
+# 상세 정보 병합 시 제외할 키 (같은 공고의 재게시분과 상세 정보를 공유해도 자기 ID/URL 유지)
+_DETAIL_IDENTITY_KEYS = frozenset({'job_id', 'url'})
+
+# 상세 정보 테이블 라벨 키워드 → 필드 (앞에서부터 처음 포함된 키워드 사용, '근무지'도 '근무'로 분류)
+_INFO_LABEL_FIELDS = (
+    ('경력', 'career'),
+    ('학력', 'education'),
+    ('고용', 'employment_type'),
+    ('근무', 'employment_type'),
+    ('연봉', 'salary'),
+    ('급여', 'salary'),
+    ('위치', 'location'),
+)
+
+# HTML 검색 결과에서 클래스로 구분되는 공고 카드만 트리로 생성
+_JOB_CARD_STRAINER = SoupStrainer(class_=['job-item', 'company-job-item', 'job-card', 'job-list-item'])
+
+# HTML 파싱 선택자 (카드/상세 페이지마다 다시 파싱하지 않도록 미리 컴파일)
+_JOB_CARD_SEL = sv.compile('.job-item, .company-job-item, [data-job-id]')
+_JOB_CARD_FALLBACK_SEL = sv.compile('.job-card, .job-list-item')
+_CARD_LINK_SEL = sv.compile('a[href*="/jobs/"]')
+_CARD_TITLE_SEL = sv.compile('.job-title, .title, h4, h3 a')
+_CARD_COMPANY_SEL = sv.compile('.company-name, .company, .job-company a')
+_CARD_LOCATION_SEL = sv.compile('.location, .job-location')
+_CARD_TECH_SEL = sv.compile('.tech-stack, .skill-tag, .tag')
+_CARD_CAREER_SEL = sv.compile('.career, .experience')
+_DETAIL_TITLE_SEL = sv.compile('h1.title, .job-title, h1')
+_DETAIL_COMPANY_SEL = sv.compile('.company-name a, .company-info .name')
+_DETAIL_DESC_SEL = sv.compile('.job-description, .description, .content')
+_DETAIL_REQ_SEL = sv.compile('.job-requirement, .requirement')
+_DETAIL_PREF_SEL = sv.compile('.job-preference, .preferred')
+_DETAIL_BENEFIT_SEL = sv.compile('.job-benefit, .benefit, .welfare')
+_DETAIL_TECH_SEL = sv.compile('.tech-stack .tag, .skill-tags .tag, .tech-stacks span')
+_INFO_ITEM_SEL = sv.compile('.job-info-item, .info-row, tr')
+_INFO_LABEL_SEL = sv.compile('.label, th, dt')
+_INFO_VALUE_SEL = sv.compile('.value, td, dd')
+
+
+def _api_summary(item: Dict) -> str:
+    """API 공고의 소개 문구 (intro → summary → description 순서로 처음 값이 있는 필드)"""
+    get = item.get
+    return get('intro') or get('summary') or get('description') or ''
+
+
 class RocketPunchCrawler(BaseCrawler):
     """RocketPunch 채용공고 크롤러"""
     
@@ -27,6 +80,7 @@ class RocketPunchCrawler(BaseCrawler):
         self.base_url = 'https://www.rocketpunch.com'
         self.api_url = 'https://www.rocketpunch.com/api/jobs'
         self.search_url = 'https://www.rocketpunch.com/jobs'
+        self.job_url = f'{self.base_url}/jobs/'  # 공고 URL 접두사 (공고마다 포맷하지 않도록)
         
         # 추가 헤더
         self.session.headers.update({
@@ -35,7 +89,7 @@ class RocketPunchCrawler(BaseCrawler):
             'Referer': 'https://www.rocketpunch.com/jobs',
         })
     
-    def search_jobs(self, keyword: str, max_pages: int = 10) -> List[Dict]:
+    def search_jobs(self, keyword: str, max_pages: int = 10) -> Generator[Dict, None, None]:
         """
         RocketPunch 채용공고 검색
         
@@ -43,41 +97,33 @@ class RocketPunchCrawler(BaseCrawler):
             keyword: 검색 키워드
             max_pages: 최대 페이지 수
             
-        Returns:
-            채용공고 목록
+        Yields:
+            채용공고 정보 (페이지를 받는 대로 반환)
         """
-        jobs = []
         
-        for page in range(1, max_pages + 1):
+        def fetch(page: int):
+            """페이지 결과와 수집 방식 반환 (API 우선, 실패 시 HTML 파싱 fallback)"""
             try:
-                # API 방식 시도
                 api_jobs = self._search_via_api(keyword, page)
-                
                 if api_jobs:
-                    jobs.extend(api_jobs)
-                    self.logger.info(f"페이지 {page}: {len(api_jobs)}개 수집 (API)")
-                    
-                    if len(api_jobs) < 20:  # 페이지당 20개 미만이면 마지막
-                        break
-                else:
-                    # HTML 파싱 방식 fallback
-                    html_jobs = self._search_via_html(keyword, page)
-                    
-                    if html_jobs:
-                        jobs.extend(html_jobs)
-                        self.logger.info(f"페이지 {page}: {len(html_jobs)}개 수집 (HTML)")
-                        
-                        if len(html_jobs) < 20:
-                            break
-                    else:
-                        self.logger.info(f"페이지 {page}: 더 이상 결과 없음")
-                        break
-                        
+                    return api_jobs, 'API'
+                return self._search_via_html(keyword, page), 'HTML'
             except Exception as e:
                 self.logger.error(f"검색 실패 (페이지 {page}): {e}")
-                break
+                return None, None
         
-        return jobs
+        # 다음 페이지는 현재 페이지를 처리하는 동안 미리 요청 (마지막 페이지에서 멈추면 남은 요청은 취소)
+        for page, (page_jobs, method) in self.iter_pages(fetch, max_pages):
+            if not page_jobs:
+                if method:
+                    self.logger.info(f"페이지 {page}: 더 이상 결과 없음")
+                break
+            
+            yield from page_jobs
+            self.logger.info(f"페이지 {page}: {len(page_jobs)}개 수집 ({method})")
+            
+            if len(page_jobs) < 20:  # 페이지당 20개 미만이면 마지막
+                break
     
     def _search_via_api(self, keyword: str, page: int) -> Optional[List[Dict]]:
         """API를 통한 검색"""
@@ -95,18 +141,12 @@ class RocketPunchCrawler(BaseCrawler):
             if not data:
                 return None
             
-            jobs = []
             job_list = data.get('data', {}).get('jobs', [])
             
             if not job_list:
                 job_list = data.get('jobs', [])
             
-            for item in job_list:
-                job = self._parse_api_job(item)
-                if job:
-                    jobs.append(job)
-            
-            return jobs
+            return [job for job in map(self._parse_api_job, job_list) if job]
             
         except Exception as e:
             self.logger.debug(f"API 검색 실패: {e}")
@@ -115,19 +155,22 @@ class RocketPunchCrawler(BaseCrawler):
     def _parse_api_job(self, item: Dict) -> Optional[Dict]:
         """API 응답 파싱"""
         
-        job_id = str(item.get('id', ''))
+        # 공고마다 호출되므로 조회 메서드를 한 번만 바인딩
+        get = item.get
+        
+        job_id = str(get('id', ''))
         if not job_id:
             return None
         
         # 회사 정보
-        company = item.get('company', {})
+        company = get('company', {})
         if isinstance(company, dict):
             company_name = company.get('name', '')
         else:
             company_name = str(company) if company else ''
         
         # 기술 스택
-        tech_stacks = item.get('tech_stacks', [])
+        tech_stacks = get('tech_stacks', [])
         if isinstance(tech_stacks, list):
             skills = [t.get('name', t) if isinstance(t, dict) else str(t) for t in tech_stacks]
         else:
@@ -136,17 +179,20 @@ class RocketPunchCrawler(BaseCrawler):
         return {
             'source_site': self.site_name,
             'job_id': job_id,
-            'title': item.get('title', ''),
+            'title': get('title', ''),
             'company_name': company_name,
-            'job_category': item.get('job_category', ''),
-            'location': item.get('location', item.get('address', '')),
-            'career_min': item.get('career_min', 0),
-            'career_max': item.get('career_max', 0),
-            'salary_min': item.get('salary_min'),
-            'salary_max': item.get('salary_max'),
-            'employment_type': item.get('employment_type', ''),
+            'job_category': get('job_category', ''),
+            # location이 없을 때만 address 조회
+            'location': get('location') if 'location' in item else get('address', ''),
+            'career_min': get('career_min', 0),
+            'career_max': get('career_max', 0),
+            'salary_min': get('salary_min'),
+            'salary_max': get('salary_max'),
+            'employment_type': get('employment_type', ''),
+            # 목록 응답의 짧은 소개 문구 (상세 본문이 아니므로 상세 조회는 그대로 수행)
+            'summary': _api_summary(item),
             'required_skills': skills,
-            'url': f"{self.base_url}/jobs/{job_id}"
+            'url': self.job_url + job_id
         }
     
     def _search_via_html(self, keyword: str, page: int) -> Optional[List[Dict]]:
@@ -155,19 +201,24 @@ class RocketPunchCrawler(BaseCrawler):
         url = f"{self.search_url}?keywords={quote(keyword)}&page={page}"
         
         try:
-            soup = self.get_page(url)
+            body = self._fetch_body(url)
             
-            if not soup:
+            if not body:
                 return None
             
             jobs = []
             
-            # 채용공고 카드 선택
-            job_cards = soup.select('.job-item, .company-job-item, [data-job-id]')
+            # 채용공고 카드 선택 (카드 부분만 파싱)
+            soup = BeautifulSoup(body, 'lxml', parse_only=_JOB_CARD_STRAINER)
+            job_cards = _JOB_CARD_SEL.select(soup)
             
             if not job_cards:
                 # 대체 셀렉터
-                job_cards = soup.select('.job-card, .job-list-item')
+                job_cards = _JOB_CARD_FALLBACK_SEL.select(soup)
+            
+            if not job_cards:
+                # data-job-id 속성으로만 구분되는 카드는 클래스 필터에 걸리지 않으므로 전체 파싱
+                job_cards = _JOB_CARD_SEL.select(BeautifulSoup(body, 'lxml'))
             
             for card in job_cards:
                 job = self._parse_html_job(card)
@@ -187,10 +238,10 @@ class RocketPunchCrawler(BaseCrawler):
         job_id = card.get('data-job-id', '')
         
         if not job_id:
-            link = card.select_one('a[href*="/jobs/"]')
+            link = _CARD_LINK_SEL.select_one(card)
             if link:
                 href = link.get('href', '')
-                match = re.search(r'/jobs/(\d+)', href)
+                match = _JOB_ID_RE.search(href)
                 if match:
                     job_id = match.group(1)
         
@@ -198,26 +249,26 @@ class RocketPunchCrawler(BaseCrawler):
             return None
         
         # 제목
-        title_elem = card.select_one('.job-title, .title, h4, h3 a')
+        title_elem = _CARD_TITLE_SEL.select_one(card)
         title = clean_text(title_elem.get_text()) if title_elem else ''
         
         if not title:
             return None
         
         # 회사명
-        company_elem = card.select_one('.company-name, .company, .job-company a')
+        company_elem = _CARD_COMPANY_SEL.select_one(card)
         company_name = clean_text(company_elem.get_text()) if company_elem else ''
         
         # 위치
-        location_elem = card.select_one('.location, .job-location')
+        location_elem = _CARD_LOCATION_SEL.select_one(card)
         location = clean_text(location_elem.get_text()) if location_elem else ''
         
         # 기술 스택
-        tech_elems = card.select('.tech-stack, .skill-tag, .tag')
+        tech_elems = _CARD_TECH_SEL.select(card)
         skills = [clean_text(t.get_text()) for t in tech_elems if t.get_text().strip()]
         
         # 경력
-        career_elem = card.select_one('.career, .experience')
+        career_elem = _CARD_CAREER_SEL.select_one(card)
         career_text = clean_text(career_elem.get_text()) if career_elem else ''
         
         return {
@@ -228,16 +279,16 @@ class RocketPunchCrawler(BaseCrawler):
             'location': location,
             'career_text': career_text,
             'required_skills': skills,
-            'url': f"{self.base_url}/jobs/{job_id}"
+            'url': self.job_url + job_id
         }
     
     def get_job_detail(self, job_id: str) -> Optional[Dict]:
         """채용공고 상세 정보 조회"""
         
-        url = f"{self.base_url}/jobs/{job_id}"
+        url = self.job_url + str(job_id)
         
         try:
-            soup = self.get_page(url)
+            soup = self.get_detail_page(url, job_id)
             
             if not soup:
                 return None
@@ -248,60 +299,54 @@ class RocketPunchCrawler(BaseCrawler):
             }
             
             # 제목
-            title_elem = soup.select_one('h1.title, .job-title, h1')
+            title_elem = _DETAIL_TITLE_SEL.select_one(soup)
             if title_elem:
                 detail['title'] = clean_text(title_elem.get_text())
             
             # 회사명
-            company_elem = soup.select_one('.company-name a, .company-info .name')
+            company_elem = _DETAIL_COMPANY_SEL.select_one(soup)
             if company_elem:
                 detail['company_name'] = clean_text(company_elem.get_text())
             
             # 상세 설명
-            desc_elem = soup.select_one('.job-description, .description, .content')
+            desc_elem = _DETAIL_DESC_SEL.select_one(soup)
             if desc_elem:
                 detail['description'] = clean_text(desc_elem.get_text())
             
             # 자격요건
-            req_elem = soup.select_one('.job-requirement, .requirement')
+            req_elem = _DETAIL_REQ_SEL.select_one(soup)
             if req_elem:
                 detail['requirements'] = clean_text(req_elem.get_text())
             
             # 우대사항
-            pref_elem = soup.select_one('.job-preference, .preferred')
+            pref_elem = _DETAIL_PREF_SEL.select_one(soup)
             if pref_elem:
                 detail['preferred'] = clean_text(pref_elem.get_text())
             
             # 복리후생
-            benefit_elem = soup.select_one('.job-benefit, .benefit, .welfare')
+            benefit_elem = _DETAIL_BENEFIT_SEL.select_one(soup)
             if benefit_elem:
                 detail['benefits'] = clean_text(benefit_elem.get_text())
             
             # 기술 스택
-            tech_elems = soup.select('.tech-stack .tag, .skill-tags .tag, .tech-stacks span')
+            tech_elems = _DETAIL_TECH_SEL.select(soup)
             if tech_elems:
                 detail['tech_stacks'] = [clean_text(t.get_text()) for t in tech_elems]
             
             # 정보 테이블 파싱
-            info_items = soup.select('.job-info-item, .info-row, tr')
+            info_items = _INFO_ITEM_SEL.select(soup)
             for item in info_items:
-                label_elem = item.select_one('.label, th, dt')
-                value_elem = item.select_one('.value, td, dd')
+                label_elem = _INFO_LABEL_SEL.select_one(item)
+                value_elem = _INFO_VALUE_SEL.select_one(item)
                 
                 if label_elem and value_elem:
                     label = clean_text(label_elem.get_text())
-                    value = clean_text(value_elem.get_text())
                     
-                    if '경력' in label:
-                        detail['career'] = value
-                    elif '학력' in label:
-                        detail['education'] = value
-                    elif '고용' in label or '근무' in label:
-                        detail['employment_type'] = value
-                    elif '연봉' in label or '급여' in label:
-                        detail['salary'] = value
-                    elif '위치' in label or '근무지' in label:
-                        detail['location'] = value
+                    # 라벨에 처음 포함된 키워드의 필드로 저장 (해당 없는 행은 값 추출 생략)
+                    for keyword, field in _INFO_LABEL_FIELDS:
+                        if keyword in label:
+                            detail[field] = clean_text(value_elem.get_text())
+                            break
             
             # 스킬 추출
             text_content = f"{detail.get('description', '')} {detail.get('requirements', '')}"
@@ -316,6 +361,14 @@ class RocketPunchCrawler(BaseCrawler):
             self.logger.error(f"상세 조회 실패 ({job_id}): {e}")
             return None
     
+    @staticmethod
+    def _job_signature(job: Dict) -> Optional[str]:
+        """재게시 공고 판별용 시그니처 (제목/회사/위치를 소문자화하고 공백/기호 제거, 제목/회사가 없으면 None)"""
+        parts = [_SIGNATURE_STRIP_RE.sub('', (job.get(f) or '').lower()) for f in _SIGNATURE_FIELDS]
+        if not parts[0] or not parts[1]:
+            return None
+        return '\n'.join(parts)
+    
     def crawl_keyword(self, keyword: str, max_pages: int = None) -> List[Dict]:
         """키워드로 전체 크롤링 실행"""
         
@@ -324,37 +377,60 @@ class RocketPunchCrawler(BaseCrawler):
         
         self.logger.info(f"RocketPunch 크롤링 시작: {keyword}")
         
-        # 검색 결과 수집
-        jobs = self.search_jobs(keyword, max_pages)
-        
-        # 상세 정보 수집 (선택적)
+        # 상세 정보 수집 (선택적) - 검색 결과가 나오는 대로 상세 정보가 없는 공고만 스레드 풀에 제출
+        # (요청 간격은 rate_limiter가 유지하고, 같은 세션의 keep-alive 연결을 재사용)
         detailed_jobs = []
+        pending = []  # (검색 결과, 상세 조회 future 또는 None)
+        submitted = {}  # 공고 ID → 상세 조회 future (여러 페이지에 걸친 같은 공고는 한 번만 요청)
+        by_signature = {}  # 제목/회사/위치 시그니처 → 상세 조회 future (재게시 공고는 상세 요청 생략)
         
-        for i, job in enumerate(jobs):
+        with ThreadPoolExecutor(max_workers=settings.crawler.detail_workers) as executor:
             try:
-                # 상세 정보가 없는 경우에만 조회
-                if not job.get('description'):
-                    detail = self.get_job_detail(job['job_id'])
+                for job in self.search_jobs(keyword, max_pages):
+                    future = None
+                    if not job.get('description'):
+                        job_id = job['job_id']
+                        signature = self._job_signature(job)
+                        future = submitted.get(job_id) or by_signature.get(signature)
+                        if future is None:
+                            future = submitted[job_id] = executor.submit(self.get_job_detail_cached, job_id)
+                        if signature:
+                            by_signature.setdefault(signature, future)
+                    pending.append((job, future))
+            except Exception as e:
+                self.logger.error(f"검색 실패: {e}")
+            
+            for i, (job, future) in enumerate(pending):
+                try:
+                    if future is not None:
+                        detail = future.result()
+                        
+                        if detail:
+                            # 기존 정보와 병합
+                            job.update({
+                                k: v for k, v in detail.items()
+                                if v and k not in _DETAIL_IDENTITY_KEYS
+                            })
                     
-                    if detail:
-                        # 기존 정보와 병합
-                        job.update({k: v for k, v in detail.items() if v})
-                
-                # 경력 수준 분류
-                job['position_level'] = categorize_job_level(
-                    job.get('title', ''),
-                    job.get('career_text', '')
-                )
-                
-                detailed_jobs.append(job)
-                
-                # 진행 상황 로깅
-                if (i + 1) % 10 == 0:
-                    self.logger.info(f"상세 수집 진행: {i + 1}/{len(jobs)}")
+                    # 상세 본문을 얻지 못하면 목록의 소개 문구로 대체
+                    if not job.get('description') and job.get('summary'):
+                        job['description'] = job['summary']
                     
-            except Exception as e:
-                self.logger.debug(f"상세 수집 실패 ({job.get('job_id')}): {e}")
-                detailed_jobs.append(job)
+                    # 경력 수준 분류
+                    job['position_level'] = categorize_job_level(
+                        job.get('title', ''),
+                        job.get('career_text', '')
+                    )
+                    
+                    detailed_jobs.append(job)
+                    
+                    # 진행 상황 로깅
+                    if (i + 1) % 10 == 0:
+                        self.logger.info(f"상세 수집 진행: {i + 1}/{len(pending)}")
+                        
+                except Exception as e:
+                    self.logger.debug(f"상세 수집 실패 ({job.get('job_id')}): {e}")
+                    detailed_jobs.append(job)
         
         self.logger.info(f"RocketPunch 크롤링 완료: {len(detailed_jobs)}개 수집")
         
@@ -3,12 +3,57 @@
 HTML 파싱 기반
 """
 import re
-from typing import List, Optional
+from typing import Iterator, Optional, Dict
 from urllib.parse import urlencode, quote
-from bs4 import BeautifulSoup
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
 
 from .base import BaseCrawler, JobPosting
 
+# 경력 조건 토큰 - 한 번의 스캔으로 모든 조건을 찾고 _parse_experience에서 우선순위대로 판정
+# (무관: "신입·경력"/"경력무관", min: "경력 N년↑", career: "경력", newbie: "신입", lo/hi: "N~M년")
+_EXPERIENCE_RE = re.compile(
+    r'(?P<any>신입·경력|경력무관)'
+    r'|경력\s*(?P<min>\d+)년'
+    r'|(?P<career>경력)'
+    r'|(?P<newbie>신입)'
+    r'|(?P<lo>\d+)\s*[~-]\s*(?P<hi>\d+)\s*년'
+)
+
+# 검색 결과 목록 아이템만 트리로 생성 (헤더/광고/푸터 등은 파싱 생략)
+_LIST_STRAINER = SoupStrainer(class_="item_recruit")
+
+# 목록/상세 선택자 (아이템마다 다시 파싱하지 않도록 미리 컴파일)
+_LIST_ITEM_SEL = sv.compile(".item_recruit")
+_DETAIL_TITLE_SEL = sv.compile(".job_tit")
+_DETAIL_COMPANY_SEL = sv.compile(".company_name")
+_DETAIL_SECTION_SEL = sv.compile(".jv_cont")
+_DETAIL_HEADER_SEL = sv.compile(".jv_header")
+_DETAIL_CONTENT_SEL = sv.compile(".jv_detail")
+_DETAIL_SUMMARY_SEL = sv.compile(".jv_summary dt, .jv_summary dd")
+
+# 목록 아이템의 필드 컨테이너 클래스 (아이템을 한 번만 순회하며 수집)
+_CARD_FIELD_CLASSES = frozenset({"job_tit", "corp_name", "job_condition", "job_sector", "job_date"})
+
+
+def _collect_card_fields(item) -> Dict[str, list]:
+    """아이템 하위 요소를 한 번 순회하며 필드 클래스별 컨테이너를 문서 순서대로 수집"""
+    found = {name: [] for name in _CARD_FIELD_CLASSES}
+    for tag in item.find_all(True):
+        for name in tag.get("class") or ():
+            if name in _CARD_FIELD_CLASSES:
+                found[name].append(tag)
+    return found
+
+
+def _find_in(containers: list, *args, **kwargs):
+    """컨테이너들 안에서 조건에 맞는 첫 하위 요소 (없으면 None)"""
+    for container in containers:
+        elem = container.find(*args, **kwargs)
+        if elem is not None:
+            return elem
+    return None
+
 
 class SaraminCrawler(BaseCrawler):
     """사람인 크롤러"""
@@ -19,12 +64,11 @@ class SaraminCrawler(BaseCrawler):
     def __init__(self):
         super().__init__("saramin")
     
-    def search(self, keyword: str, max_pages: int = None) -> List[JobPosting]:
-        """키워드로 채용 공고 검색"""
+    def search(self, keyword: str, max_pages: int = None) -> Iterator[JobPosting]:
+        """키워드로 채용 공고 검색 (파싱되는 대로 yield)"""
         max_pages = max_pages or self.config.max_pages
-        jobs = []
         
-        for page in range(1, max_pages + 1):
+        def fetch(page: int) -> Optional[bytes]:
             params = {
                 "searchType": "search",
                 "searchword": keyword,
@@ -32,15 +76,15 @@ class SaraminCrawler(BaseCrawler):
                 "recruitSort": "relation",
                 "recruitPageCount": 40,
             }
-            
-            url = f"{self.SEARCH_URL}?{urlencode(params)}"
-            html = self._get_page(url)
-            
+            return self._get_page(f"{self.SEARCH_URL}?{urlencode(params)}")
+        
+        # 다음 페이지는 현재 페이지를 파싱하는 동안 미리 요청
+        for page, html in self._iter_pages(fetch, max_pages):
             if not html:
                 break
             
-            soup = BeautifulSoup(html, "html.parser")
-            job_items = soup.select(".item_recruit")
+            soup = BeautifulSoup(html, "lxml", parse_only=_LIST_STRAINER)
+            job_items = _LIST_ITEM_SEL.select(soup)
             
             if not job_items:
                 break
@@ -48,17 +92,17 @@ class SaraminCrawler(BaseCrawler):
             for item in job_items:
                 job = self._parse_list_item(item)
                 if job:
-                    jobs.append(job)
+                    yield job
             
             self.logger.debug(f"페이지 {page} 완료: {len(job_items)}개")
-        
-        return jobs
     
     def _parse_list_item(self, item) -> Optional[JobPosting]:
         """목록 아이템 파싱"""
         try:
+            fields = _collect_card_fields(item)
+            
             # 제목 및 URL
-            title_elem = item.select_one(".job_tit a")
+            title_elem = _find_in(fields["job_tit"], "a")
             if not title_elem:
                 return None
             
@@ -67,11 +111,11 @@ class SaraminCrawler(BaseCrawler):
             job_url = f"{self.BASE_URL}{href}" if href.startswith("/") else href
             
             # 회사명
-            company_elem = item.select_one(".corp_name a")
+            company_elem = _find_in(fields["corp_name"], "a")
             company = company_elem.get_text(strip=True) if company_elem else ""
             
             # 조건 정보
-            conditions = item.select(".job_condition span")
+            conditions = [span for cond in fields["job_condition"] for span in cond.find_all("span")]
             location = ""
             experience = ""
             education = ""
@@ -92,14 +136,14 @@ class SaraminCrawler(BaseCrawler):
             exp_min, exp_max = self._parse_experience(experience)
             
             # 직무 섹터
-            sector_elem = item.select_one(".job_sector")
+            sector_elem = fields["job_sector"][0] if fields["job_sector"] else None
             sector_text = sector_elem.get_text(" ", strip=True) if sector_elem else ""
             
             # 스킬 추출
             skills = self._extract_skills(f"{title} {sector_text}")
             
             # 마감일
-            deadline_elem = item.select_one(".job_date .date")
+            deadline_elem = _find_in(fields["job_date"], class_="date")
             deadline = deadline_elem.get_text(strip=True) if deadline_elem else ""
             
             return JobPosting(
@@ -121,20 +165,20 @@ class SaraminCrawler(BaseCrawler):
     
     def get_job_detail(self, job_url: str) -> Optional[JobPosting]:
         """채용 공고 상세 정보"""
-        html = self._get_page(job_url)
+        html = self._get_detail_page(job_url)
         
         if not html:
             return None
         
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         
         try:
             # 제목
-            title_elem = soup.select_one(".job_tit")
+            title_elem = _DETAIL_TITLE_SEL.select_one(soup)
             title = title_elem.get_text(strip=True) if title_elem else ""
             
             # 회사명
-            company_elem = soup.select_one(".company_name")
+            company_elem = _DETAIL_COMPANY_SEL.select_one(soup)
             company = company_elem.get_text(strip=True) if company_elem else ""
             
             # 상세 정보 섹션
@@ -142,14 +186,14 @@ class SaraminCrawler(BaseCrawler):
             requirements = ""
             benefits = ""
             
-            detail_sections = soup.select(".jv_cont")
+            detail_sections = _DETAIL_SECTION_SEL.select(soup)
             for section in detail_sections:
-                header = section.select_one(".jv_header")
+                header = _DETAIL_HEADER_SEL.select_one(section)
                 if not header:
                     continue
                 
                 header_text = header.get_text(strip=True)
-                content = section.select_one(".jv_detail")
+                content = _DETAIL_CONTENT_SEL.select_one(section)
                 content_text = content.get_text("\n", strip=True) if content else ""
                 
                 if "주요업무" in header_text or "담당업무" in header_text:
@@ -162,7 +206,7 @@ class SaraminCrawler(BaseCrawler):
                     benefits = content_text
             
             # 조건 정보
-            condition_items = soup.select(".jv_summary dt, .jv_summary dd")
+            condition_items = _DETAIL_SUMMARY_SEL.select(soup)
             conditions = {}
             current_key = ""
             for item in condition_items:
@@ -206,21 +250,32 @@ class SaraminCrawler(BaseCrawler):
         if not text:
             return 0, 0
         
-        if "신입" in text and "경력" not in text:
-            return 0, 0
+        has_newbie = has_career = False
+        min_exp = exp_range = None
         
-        if "신입·경력" in text or "경력무관" in text:
-            return 0, 99
+        for match in _EXPERIENCE_RE.finditer(text):
+            if match['any']:
+                return 0, 99
+            if match['min']:
+                has_career = True
+                if min_exp is None:
+                    min_exp = int(match['min'])
+            elif match['career']:
+                has_career = True
+            elif match['newbie']:
+                has_newbie = True
+            elif exp_range is None:
+                exp_range = (int(match['lo']), int(match['hi']))
+        
+        if has_newbie and not has_career:
+            return 0, 0
         
         # "경력 N년↑" 패턴
-        match = re.search(r'경력\s*(\d+)년', text)
-        if match:
-            min_exp = int(match.group(1))
+        if min_exp is not None:
             return min_exp, 99
         
         # "N~M년" 패턴
-        match = re.search(r'(\d+)\s*[~-]\s*(\d+)\s*년', text)
-        if match:
-            return int(match.group(1)), int(match.group(2))
+        if exp_range:
+            return exp_range
         
         return 0, 0
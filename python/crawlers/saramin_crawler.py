@@ -7,10 +7,35 @@ from typing import Generator, Dict, Any, Optional
 import re
 from datetime import datetime
 from urllib.parse import urlencode, quote
+import soupsieve as sv
+from bs4 import SoupStrainer
 from .base_crawler import BaseCrawler
 from utils.helpers import clean_text, parse_date_korean
 
 
+# 공고 링크에서 ID 추출 (rec_idx 파라미터 우선, 없으면 경로의 숫자)
+_REC_IDX_RE = re.compile(r'rec_idx=(\d+)')
+_PATH_ID_RE = re.compile(r'/(\d+)\?')
+
+# 검색 결과에서 공고 아이템만 트리로 생성 (사이드바/스크립트/내비게이션은 파싱 생략)
+_LISTING_STRAINER = SoupStrainer(class_=['item_recruit', 'list_item'])
+
+# HTML 파싱 선택자 (공고/섹션마다 다시 파싱하지 않도록 미리 컴파일)
+_LISTING_SEL = sv.compile('.item_recruit')
+_LISTING_FALLBACK_SEL = sv.compile('.list_item')
+_COMPANY_SEL = sv.compile('.corp_name a, .company_name a')
+_TITLE_SEL = sv.compile('.job_tit a, .title a')
+_CONDITION_SEL = sv.compile('.job_condition span, .conditions span')
+_DEADLINE_SEL = sv.compile('.job_date .date, .deadline')
+_SECTOR_SEL = sv.compile('.job_sector, .sector')
+_DETAIL_DESC_SEL = sv.compile('.user_content, .job_content, .wrap_jv_cont')
+_SECTION_SEL = sv.compile('.jv_cont, .recruit_view_sec')
+_SECTION_HEADER_SEL = sv.compile('h3, .tit_cont')
+_SKILL_TAG_SEL = sv.compile('.skill_tag, .tag_item, .chip_keyword')
+_SALARY_SEL = sv.compile('.salary, .pay_info')
+_BENEFITS_SEL = sv.compile('.welfare, .benefit_cont')
+
+
 class SaraminCrawler(BaseCrawler):
     """사람인 채용공고 크롤러"""
     
@@ -30,30 +55,35 @@ class SaraminCrawler(BaseCrawler):
         HTML 파싱 방식
         """
         total_count = 0
+        # 사람인 검색 URL
+        search_url = f"{self.base_url}/zf_user/search/recruit"
         
-        for page in range(1, max_pages + 1):
+        def fetch(page: int):
+            params = {
+                'searchType': 'search',
+                'searchword': keyword,
+                'recruitPage': page,
+                'recruitSort': 'relation',
+                'recruitPageCount': 40,
+            }
+            try:
+                return self.get_page(search_url, params, parse_only=_LISTING_STRAINER)
+            except Exception as e:
+                self.logger.error(f"Error searching page {page}: {e}")
+                return None
+        
+        # 다음 페이지는 현재 페이지를 파싱하는 동안 미리 요청 (같은 세션의 keep-alive 연결 재사용)
+        for page, soup in self.iter_pages(fetch, max_pages):
+            if not soup:
+                break
+            
             try:
-                # 사람인 검색 URL
-                search_url = f"{self.base_url}/zf_user/search/recruit"
-                params = {
-                    'searchType': 'search',
-                    'searchword': keyword,
-                    'recruitPage': page,
-                    'recruitSort': 'relation',
-                    'recruitPageCount': 40,
-                }
-                
-                soup = self.get_page(search_url, params)
-                
-                if not soup:
-                    break
-                
                 # 채용공고 목록 찾기
-                job_list = soup.select('.item_recruit')
+                job_list = _LISTING_SEL.select(soup)
                 
                 if not job_list:
                     # 다른 셀렉터 시도
-                    job_list = soup.select('.list_item')
+                    job_list = _LISTING_FALLBACK_SEL.select(soup)
                 
                 if not job_list:
                     self.logger.warning(f"No jobs found on page {page}")
@@ -79,11 +109,11 @@ class SaraminCrawler(BaseCrawler):
         """HTML 요소에서 채용공고 정보 파싱"""
         try:
             # 회사명
-            company_elem = elem.select_one('.corp_name a, .company_name a')
+            company_elem = _COMPANY_SEL.select_one(elem)
             company_name = clean_text(company_elem.text) if company_elem else ""
             
             # 채용공고 제목 및 링크
-            title_elem = elem.select_one('.job_tit a, .title a')
+            title_elem = _TITLE_SEL.select_one(elem)
             if not title_elem:
                 return None
             
@@ -91,41 +121,28 @@ class SaraminCrawler(BaseCrawler):
             href = title_elem.get('href', '')
             
             # job_id 추출
-            job_id_match = re.search(r'rec_idx=(\d+)', href)
+            job_id_match = _REC_IDX_RE.search(href)
             job_id = job_id_match.group(1) if job_id_match else ""
             
             if not job_id:
                 # 다른 패턴 시도
-                job_id_match = re.search(r'/(\d+)\?', href)
+                job_id_match = _PATH_ID_RE.search(href)
                 job_id = job_id_match.group(1) if job_id_match else ""
             
             if not job_id:
                 return None
             
-            # 조건 정보
-            conditions = elem.select('.job_condition span, .conditions span')
-            location = ""
-            experience = ""
-            education = ""
-            employment_type = ""
-            
-            for i, cond in enumerate(conditions):
-                text = clean_text(cond.text)
-                if i == 0:
-                    location = text
-                elif i == 1:
-                    experience = text
-                elif i == 2:
-                    education = text
-                elif i == 3:
-                    employment_type = text
+            # 조건 정보 - 앞의 네 span만 사용 (지역, 경력, 학력, 고용형태)
+            conditions = [clean_text(cond.text) for cond in _CONDITION_SEL.select(elem, limit=4)]
+            conditions += [""] * (4 - len(conditions))
+            location, experience, education, employment_type = conditions
             
             # 마감일
-            deadline_elem = elem.select_one('.job_date .date, .deadline')
+            deadline_elem = _DEADLINE_SEL.select_one(elem)
             deadline = clean_text(deadline_elem.text) if deadline_elem else ""
             
             # 직무 분야
-            sector_elem = elem.select_one('.job_sector, .sector')
+            sector_elem = _SECTOR_SEL.select_one(elem)
             job_category = clean_text(sector_elem.text) if sector_elem else ""
             
             return {
@@ -152,14 +169,14 @@ class SaraminCrawler(BaseCrawler):
             detail_url = f"{self.base_url}/zf_user/jobs/relay/view"
             params = {'rec_idx': job_id, 'view_type': 'search'}
             
-            soup = self.get_page(detail_url, params)
+            soup = self.get_detail_page(detail_url, job_id, params)
             
             if not soup:
                 return None
             
             # 상세 설명
             description = ""
-            desc_elem = soup.select_one('.user_content, .job_content, .wrap_jv_cont')
+            desc_elem = _DETAIL_DESC_SEL.select_one(soup)
             if desc_elem:
                 description = clean_text(desc_elem.get_text())
             
@@ -168,9 +185,9 @@ class SaraminCrawler(BaseCrawler):
             preferred = ""
             
             # 섹션별 파싱
-            sections = soup.select('.jv_cont, .recruit_view_sec')
+            sections = _SECTION_SEL.select(soup)
             for section in sections:
-                header = section.select_one('h3, .tit_cont')
+                header = _SECTION_HEADER_SEL.select_one(section)
                 if header:
                     header_text = clean_text(header.text).lower()
                     content = clean_text(section.get_text())
@@ -182,7 +199,7 @@ class SaraminCrawler(BaseCrawler):
             
             # 스킬 태그
             skill_tags = []
-            skill_elems = soup.select('.skill_tag, .tag_item, .chip_keyword')
+            skill_elems = _SKILL_TAG_SEL.select(soup)
             for skill_elem in skill_elems:
                 skill = clean_text(skill_elem.text)
                 if skill:
@@ -190,13 +207,13 @@ class SaraminCrawler(BaseCrawler):
             
             # 급여 정보
             salary_info = ""
-            salary_elem = soup.select_one('.salary, .pay_info')
+            salary_elem = _SALARY_SEL.select_one(soup)
             if salary_elem:
                 salary_info = clean_text(salary_elem.text)
             
             # 복리후생
             benefits = ""
-            benefits_elem = soup.select_one('.welfare, .benefit_cont')
+            benefits_elem = _BENEFITS_SEL.select_one(soup)
             if benefits_elem:
                 benefits = clean_text(benefits_elem.get_text())
             
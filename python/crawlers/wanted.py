@@ -3,11 +3,16 @@
 API 기반 크롤링
 """
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict
 from bs4 import BeautifulSoup
 
 from .base import BaseCrawler, JobPosting
 
+# 경력 조건 패턴 ("N년 이상", "N~M년")
+_EXPERIENCE_MIN_RE = re.compile(r'(\d+)\s*년\s*이상')
+_EXPERIENCE_RANGE_RE = re.compile(r'(\d+)\s*[~-]\s*(\d+)\s*년')
+
 
 class WantedCrawler(BaseCrawler):
     """원티드 크롤러"""
@@ -35,18 +40,17 @@ class WantedCrawler(BaseCrawler):
         """키워드로 채용 공고 검색"""
         max_pages = max_pages or self.config.max_pages
         jobs = []
-        offset = 0
         limit = 20
+        url = f"{self.API_URL}/jobs"
         
-        for page in range(max_pages):
-            url = f"{self.API_URL}/jobs"
+        def fetch(page: int) -> Optional[Dict]:
             params = {
                 "country": "kr",
                 "tag_type_ids": "518",  # 개발 전체
                 "locations": "all",
                 "years": "-1",
                 "limit": limit,
-                "offset": offset,
+                "offset": (page - 1) * limit,
                 "job_sort": "job.latest_order"
             }
             
@@ -54,8 +58,10 @@ class WantedCrawler(BaseCrawler):
             if keyword:
                 params["search"] = keyword
             
-            data = self._get_json(url, params=params)
-            
+            return self._get_json(url, params=params)
+        
+        # 다음 offset 페이지는 현재 페이지를 파싱하는 동안 미리 요청
+        for page, data in self._iter_pages(fetch, max_pages):
             if not data or "data" not in data:
                 break
             
@@ -68,17 +74,17 @@ class WantedCrawler(BaseCrawler):
                 if job:
                     jobs.append(job)
             
-            offset += limit
-            self.logger.debug(f"페이지 {page + 1} 완료: {len(job_list)}개")
+            self.logger.debug(f"페이지 {page} 완료: {len(job_list)}개")
+            
+            # 마지막 페이지면 미리 요청한 나머지는 취소
+            if len(job_list) < limit:
+                break
         
-        # 상세 정보 가져오기 (선택적)
-        detailed_jobs = []
-        for job in jobs[:50]:  # 최대 50개만 상세 정보
-            detailed = self.get_job_detail(job.url.split("/")[-1])
-            if detailed:
-                detailed_jobs.append(detailed)
-            else:
-                detailed_jobs.append(job)
+        # 상세 정보 가져오기 (선택적) - 최대 50개만, 스레드 풀에서 동시에 조회 (요청 간격은 rate_limiter가 유지)
+        targets = jobs[:50]
+        with ThreadPoolExecutor(max_workers=self.config.detail_workers) as executor:
+            details = executor.map(self.get_job_detail, [job.url.split("/")[-1] for job in targets])
+            detailed_jobs = [detailed or job for job, detailed in zip(targets, details)]
         
         return detailed_jobs if detailed_jobs else jobs
     
@@ -103,42 +109,44 @@ class WantedCrawler(BaseCrawler):
     def get_job_detail(self, job_id: str) -> Optional[JobPosting]:
         """채용 공고 상세 정보"""
         url = f"{self.API_URL}/jobs/{job_id}"
-        data = self._get_json(url)
+        data = self._get_detail_json(url)
         
         if not data or "job" not in data:
             return None
         
         job_data = data["job"]
-        company_data = job_data.get("company", {})
+        company_data = job_data.get("company") or {}
+        detail = job_data.get("detail") or {}
         
         # 스킬 태그 추출
         skill_tags = job_data.get("skill_tags", [])
         skills = [tag.get("title", "") for tag in skill_tags if tag.get("title")]
         
         # 상세 설명에서 추가 스킬 추출
-        description = job_data.get("detail", {}).get("main_tasks", "")
-        requirements = job_data.get("detail", {}).get("requirements", "")
-        preferred = job_data.get("detail", {}).get("preferred_points", "")
-        benefits = job_data.get("detail", {}).get("benefits", "")
+        description = detail.get("main_tasks", "")
+        requirements = detail.get("requirements", "")
+        preferred = detail.get("preferred_points", "")
+        benefits = detail.get("benefits", "")
         
-        all_text = f"{description} {requirements} {preferred}"
-        extracted_skills = self._extract_skills(all_text)
+        # 필드를 이어 붙이지 않고 필드별로 스캔해 합침 (빈 필드는 건너뜀)
+        extracted_skills = set()
+        for text in (description, requirements, preferred):
+            if text:
+                extracted_skills.update(self._extract_skills(text))
         
         # 경력 파싱
-        exp_min, exp_max = self._parse_experience(
-            job_data.get("detail", {}).get("position", "")
-        )
+        exp_min, exp_max = self._parse_experience(detail.get("position", ""))
         
         return JobPosting(
             title=job_data.get("position", ""),
             company=company_data.get("name", ""),
             url=f"{self.BASE_URL}/wd/{job_id}",
             source=self.site_name,
-            location=job_data.get("address", {}).get("full_location", ""),
+            location=(job_data.get("address") or {}).get("full_location", ""),
             experience_min=exp_min,
             experience_max=exp_max,
             required_skills=skills,
-            preferred_skills=extracted_skills,
+            preferred_skills=list(extracted_skills),
             description=description,
             requirements=requirements,
             benefits=benefits,
@@ -157,13 +165,13 @@ class WantedCrawler(BaseCrawler):
             return 0, 0
         
         # "N년 이상" 패턴
-        match = re.search(r'(\d+)\s*년\s*이상', text)
+        match = _EXPERIENCE_MIN_RE.search(text)
         if match:
             min_exp = int(match.group(1))
             return min_exp, 99
         
         # "N~M년" 패턴
-        match = re.search(r'(\d+)\s*[~-]\s*(\d+)\s*년', text)
+        match = _EXPERIENCE_RANGE_RE.search(text)
         if match:
             return int(match.group(1)), int(match.group(2))
         
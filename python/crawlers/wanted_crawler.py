@@ -32,26 +32,30 @@ class WantedCrawler(BaseCrawler):
         
         원티드는 무한 스크롤 방식이므로 offset 사용
         """
-        offset = 0
         limit = 20  # 원티드 기본 limit
         total_count = 0
+        # 원티드 검색 API
+        url = f"{self.api_url}/jobs"
         
-        while offset < max_pages * limit:
+        def fetch(page: int):
+            params = {
+                'country': 'kr',
+                'job_sort': 'job.latest_order',
+                'locations': 'all',
+                'years': -1,
+                'limit': limit,
+                'offset': (page - 1) * limit,
+                'search': keyword
+            }
+            try:
+                return self.get_json(url, params)
+            except Exception as e:
+                self.logger.error(f"Error searching page {page}: {e}")
+                return None
+        
+        # 다음 offset 페이지는 현재 페이지를 파싱하는 동안 미리 요청 (같은 세션의 keep-alive 연결 재사용)
+        for page, data in self.iter_pages(fetch, max_pages):
             try:
-                # 원티드 검색 API
-                url = f"{self.api_url}/jobs"
-                params = {
-                    'country': 'kr',
-                    'job_sort': 'job.latest_order',
-                    'locations': 'all',
-                    'years': -1,
-                    'limit': limit,
-                    'offset': offset,
-                    'search': keyword
-                }
-                
-                data = self.get_json(url, params)
-                
                 if not data or 'data' not in data:
                     break
                 
@@ -66,14 +70,12 @@ class WantedCrawler(BaseCrawler):
                         yield job_data
                         total_count += 1
                 
-                offset += limit
-                
                 # 다음 페이지가 없으면 종료
                 if len(jobs) < limit:
                     break
                     
             except Exception as e:
-                self.logger.error(f"Error searching jobs: {e}")
+                self.logger.error(f"Error searching page {page}: {e}")
                 break
         
         self.logger.info(f"Found {total_count} jobs for keyword: {keyword}")
@@ -119,18 +121,19 @@ class WantedCrawler(BaseCrawler):
         """채용공고 상세 정보 가져오기"""
         try:
             url = f"{self.api_url}/jobs/{job_id}"
-            data = self.get_json(url)
+            data = self.get_detail_json(url, job_id)
             
             if not data or 'job' not in data:
                 return None
             
             job = data['job']
+            detail = job.get('detail') or {}
             
             return {
-                'description': clean_text(job.get('detail', {}).get('intro', '')),
-                'requirements': clean_text(job.get('detail', {}).get('requirements', '')),
-                'preferred': clean_text(job.get('detail', {}).get('preferred', '')),
-                'benefits': clean_text(job.get('detail', {}).get('benefits', '')),
+                'description': clean_text(detail.get('intro', '')),
+                'requirements': clean_text(detail.get('requirements', '')),
+                'preferred': clean_text(detail.get('preferred', '')),
+                'benefits': clean_text(detail.get('benefits', '')),
                 'required_skills': job.get('skill_tags', []),
                 'salary_info': self._parse_salary(job),
                 'employment_type': self._parse_employment_type(job),
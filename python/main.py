@@ -384,34 +384,51 @@ def run_news_crawling(settings: Settings, db: Database, logger, max_companies: i
         'total_articles': 0
     }
 
-    try:
-        for i, company_name in enumerate(companies, 1):
-            start_time = time.time()
+    def record_result(result: dict, duration: float):
+        if result.get('error'):
+            logger.error(f"  → {result['company_name']} 뉴스 수집 실패: {result['error']}")
+            stats['failed'] += 1
+        elif result.get('total_found', 0) > 0:
+            new_count = result.get('new_count', 0)
+            dup_count = result.get('duplicate_count', 0)
+            logger.info(f"  → 완료: {result['total_found']}개 발견, 신규 {new_count}개 저장, 중복 {dup_count}개 (소요: {duration:.1f}초)")
+            stats['success'] += 1
+            stats['total_articles'] += new_count
+        else:
+            logger.info(f"  → 검색된 뉴스 없음 (소요: {duration:.1f}초)")
+            stats['success'] += 1  # 뉴스 없어도 성공으로 처리
 
+    try:
+        if settings.news.company_concurrency > 1:
+            # 여러 회사를 동시에 수집 (회사별 로그가 섞일 수 있으므로 결과는 끝난 뒤 회사 순서대로 출력)
+            logger.info(f"동시 수집: {settings.news.company_concurrency}개 회사씩")
             try:
-                logger.info(f"\n[{i}/{total_target}] {company_name} 뉴스 수집 중...")
-
-                # 회사 ID 조회
-                company_id = db.get_company_id_by_name(company_name)
+                results = crawler.crawl_many_sync(companies, settings.news.company_concurrency)
+            except Exception as e:
+                # 브라우저 등 전체 수집이 중단된 경우 모든 회사를 실패로 집계
+                logger.error(f"  → 동시 뉴스 수집 실패: {e}")
+                results = [{'company_name': company_name, 'error': str(e)} for company_name in companies]
+
+            for i, result in enumerate(results, 1):
+                logger.info(f"[{i}/{total_target}] {result['company_name']}")
+                record_result(result, result.get('elapsed', 0.0))
+        else:
+            for i, company_name in enumerate(companies, 1):
+                start_time = time.time()
 
-                # 뉴스 크롤링
-                result = crawler.crawl_company_news_sync(company_name, company_id)
+                try:
+                    logger.info(f"\n[{i}/{total_target}] {company_name} 뉴스 수집 중...")
 
-                duration = time.time() - start_time
+                    # 회사 ID 조회
+                    company_id = db.get_company_id_by_name(company_name)
 
-                if result.get('total_found', 0) > 0:
-                    new_count = result.get('new_count', 0)
-                    dup_count = result.get('duplicate_count', 0)
-                    logger.info(f"  → 완료: {result['total_found']}개 발견, 신규 {new_count}개 저장, 중복 {dup_count}개 (소요: {duration:.1f}초)")
-                    stats['success'] += 1
-                    stats['total_articles'] += new_count
-                else:
-                    logger.info(f"  → 검색된 뉴스 없음 (소요: {duration:.1f}초)")
-                    stats['success'] += 1  # 뉴스 없어도 성공으로 처리
+                    # 뉴스 크롤링
+                    result = crawler.crawl_company_news_sync(company_name, company_id)
+                    record_result(result, time.time() - start_time)
 
-            except Exception as e:
-                logger.error(f"  → 뉴스 수집 실패: {e}")
-                stats['failed'] += 1
+                except Exception as e:
+                    logger.error(f"  → 뉴스 수집 실패: {e}")
+                    stats['failed'] += 1
 
     finally:
         crawler.close()
@@ -353,6 +353,20 @@ class CompanyNews(Base):
     crawled_at = Column(DateTime, default=get_kst_now)
 
 
+class NewsSearchState(Base):
+    """회사별 뉴스 검색 상태 테이블 (증분 크롤링용)"""
+    __tablename__ = 'news_search_state'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    company_name = Column(String(200), nullable=False, unique=True)
+
+    # 검색 결과 첫 페이지 기사 URL 목록의 해시
+    first_page_fingerprint = Column(String(64))
+
+    # 메타
+    updated_at = Column(DateTime, default=get_kst_now)
+
+
 class CompanyReport(Base):
     """기업 분석 보고서 테이블"""
     __tablename__ = 'company_reports'
@@ -1120,21 +1134,47 @@ class Database:
         finally:
             session.close()
 
-    def get_existing_news_urls(self, company_name: str) -> set:
+    def get_existing_news_urls(self, company_name: str) -> frozenset:
         """회사의 기존 뉴스 URL 목록 조회
 
         Args:
             company_name: 회사명
 
         Returns:
-            기존 뉴스 URL 세트
+            기존 뉴스 URL 세트 (읽기 전용)
         """
         session = self.get_session()
         try:
             urls = session.query(CompanyNews.news_url).filter(
                 CompanyNews.company_name == company_name
             ).all()
-            return {url[0] for url in urls}
+            return frozenset(url for (url,) in urls)
+        finally:
+            session.close()
+
+    def get_news_search_fingerprint(self, company_name: str) -> Optional[str]:
+        """회사의 지난 뉴스 검색 첫 페이지 지문 조회 (없으면 None)"""
+        session = self.get_session()
+        try:
+            state = session.query(NewsSearchState).filter_by(company_name=company_name).first()
+            return state.first_page_fingerprint if state else None
+        finally:
+            session.close()
+
+    def save_news_search_fingerprint(self, company_name: str, fingerprint: str):
+        """회사의 뉴스 검색 첫 페이지 지문 저장"""
+        session = self.get_session()
+        try:
+            state = session.query(NewsSearchState).filter_by(company_name=company_name).first()
+            if state:
+                state.first_page_fingerprint = fingerprint
+                state.updated_at = get_kst_now()
+            else:
+                session.add(NewsSearchState(company_name=company_name, first_page_fingerprint=fingerprint))
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            raise e
         finally:
             session.close()
 
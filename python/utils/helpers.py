@@ -4,8 +4,11 @@
 
 import re
 import time
+import asyncio
 import logging
+import threading
 from datetime import datetime
+from email.utils import parsedate_to_datetime
 from typing import List, Dict, Any, Optional
 from functools import wraps
 import hashlib
@@ -60,20 +63,35 @@ def retry_on_failure(max_retries: int = 3, delay: float = 1.0):
     return decorator
 
 
+# 텍스트 정리용 패턴 (import 시 한 번만 컴파일)
+_BR_RE = re.compile(r'<br\s*/?>', re.IGNORECASE)
+_BLOCK_TAG_RE = re.compile(r'</?(p|div|li|h[1-6]|tr|section|article)[^>]*>', re.IGNORECASE)
+_TAG_RE = re.compile(r'<[^>]+>')
+_HSPACE_RE = re.compile(r'[ \t]+')
+_LINE_EDGE_RE = re.compile(r'[^\S\n]*\n[^\S\n]*')  # 줄바꿈 앞뒤 공백
+_MULTI_NEWLINE_RE = re.compile(r'\n{3,}')
+
+
+def _normalize_lines(text: str) -> str:
+    """각 줄의 연속 공백을 하나로 줄이고 줄 앞뒤 공백 제거, 연속 빈 줄은 하나로"""
+    text = _HSPACE_RE.sub(' ', text)
+    text = _LINE_EDGE_RE.sub('\n', text)
+    return _MULTI_NEWLINE_RE.sub('\n\n', text)
+
+
 def html_to_text(html: str) -> str:
     """HTML을 줄바꿈이 유지된 텍스트로 변환"""
     if not html:
         return ""
 
     # <br>, <br/>, <br /> 태그를 줄바꿈으로 변환
-    text = re.sub(r'<br\s*/?>', '\n', html, flags=re.IGNORECASE)
+    text = _BR_RE.sub('\n', html)
 
     # 블록 요소 뒤에 줄바꿈 추가
-    block_tags = r'</?(p|div|li|h[1-6]|tr|section|article)[^>]*>'
-    text = re.sub(block_tags, '\n', text, flags=re.IGNORECASE)
+    text = _BLOCK_TAG_RE.sub('\n', text)
 
     # 나머지 HTML 태그 제거
-    text = re.sub(r'<[^>]+>', '', text)
+    text = _TAG_RE.sub('', text)
 
     # HTML 엔티티 디코딩
     text = text.replace('&nbsp;', ' ')
@@ -83,15 +101,8 @@ def html_to_text(html: str) -> str:
     text = text.replace('&quot;', '"')
     text = text.replace('&#39;', "'")
 
-    # 각 줄 정리
-    lines = text.split('\n')
-    cleaned_lines = [re.sub(r'[ \t]+', ' ', line).strip() for line in lines]
-
-    # 연속 빈 줄을 하나로
-    text = '\n'.join(cleaned_lines)
-    text = re.sub(r'\n{3,}', '\n\n', text)
-
-    return text.strip()
+    # 각 줄 정리 및 연속 빈 줄을 하나로
+    return _normalize_lines(text).strip()
 
 
 def clean_text(text: str, preserve_newlines: bool = True) -> str:
@@ -104,111 +115,143 @@ def clean_text(text: str, preserve_newlines: bool = True) -> str:
     if not text:
         return ""
 
-    # HTML 태그 제거
-    text = re.sub(r'<[^>]+>', '', text)
-
-    if preserve_newlines:
-        # 줄바꿈은 유지하면서 각 줄의 연속 공백만 제거
-        lines = text.split('\n')
-        cleaned_lines = []
-        for line in lines:
-            # 각 줄에서 연속 공백을 단일 공백으로
-            cleaned_line = re.sub(r'[ \t]+', ' ', line).strip()
-            cleaned_lines.append(cleaned_line)
-        # 연속된 빈 줄은 하나로 줄임
-        text = '\n'.join(cleaned_lines)
-        text = re.sub(r'\n{3,}', '\n\n', text)
-    else:
-        # 기존 동작: 모든 공백을 단일 스페이스로
-        text = re.sub(r'\s+', ' ', text)
+    # HTML 태그 제거 (태그가 없으면 스캔 생략)
+    if '<' in text:
+        text = _TAG_RE.sub('', text)
+
+    if not preserve_newlines:
+        # 기존 동작: 모든 공백을 단일 스페이스로 (str.split은 \s와 같은 공백 정의 사용)
+        return ' '.join(text.split())
+
+    if '\n' not in text:
+        # 한 줄짜리(제목, 태그 등) 빠른 경로 - 연속 공백/탭이 없으면 앞뒤 공백만 제거
+        if '  ' in text or '\t' in text:
+            text = _HSPACE_RE.sub(' ', text)
+        return text.strip()
+
+    # 줄바꿈은 유지하면서 각 줄의 연속 공백만 제거, 연속된 빈 줄은 하나로 줄임
+    return _normalize_lines(text).strip()
+
+
+# 하드 스킬 패턴 (카테고리별)
+_HARD_SKILL_PATTERNS = {
+    'programming_languages': [
+        r'\bPython\b', r'\bJava\b', r'\bJavaScript\b', r'\bTypeScript\b',
+        r'\bC\+\+\b', r'\bC#\b', r'\bGo\b', r'\bRust\b', r'\bKotlin\b',
+        r'\bSwift\b', r'\bRuby\b', r'\bPHP\b', r'\bScala\b', r'\bR\b'
+    ],
+    'frameworks': [
+        r'\bReact\b', r'\bVue\b', r'\bAngular\b', r'\bDjango\b', r'\bFlask\b',
+        r'\bFastAPI\b', r'\bSpring\b', r'\bNode\.js\b', r'\bExpress\b',
+        r'\bNext\.js\b', r'\bNuxt\b', r'\bNestJS\b', r'\bRails\b'
+    ],
+    'databases': [
+        r'\bMySQL\b', r'\bPostgreSQL\b', r'\bMongoDB\b', r'\bRedis\b',
+        r'\bElasticsearch\b', r'\bCassandra\b', r'\bOracle\b', r'\bSQLite\b',
+        r'\bDynamoDB\b', r'\bFirebase\b', r'\bBigQuery\b', r'\bSnowflake\b'
+    ],
+    'cloud': [
+        r'\bAWS\b', r'\bGCP\b', r'\bAzure\b', r'\bKubernetes\b', r'\bDocker\b',
+        r'\bTerraform\b', r'\bAnsible\b', r'\bJenkins\b', r'\bGitHub Actions\b',
+        r'\bCI/CD\b', r'\bEC2\b', r'\bS3\b', r'\bLambda\b'
+    ],
+    'data_tools': [
+        r'\bPandas\b', r'\bNumPy\b', r'\bScikit-learn\b', r'\bTensorFlow\b',
+        r'\bPyTorch\b', r'\bKeras\b', r'\bSpark\b', r'\bHadoop\b',
+        r'\bAirflow\b', r'\bKafka\b', r'\bTableau\b', r'\bPower BI\b',
+        r'\bLooker\b', r'\bDbt\b', r'\bMLflow\b'
+    ],
+    'ml_ai': [
+        r'\bLLM\b', r'\bNLP\b', r'\b딥러닝\b', r'\b머신러닝\b',
+        r'\bRAG\b', r'\bLangChain\b', r'\bOpenAI\b', r'\bGPT\b',
+        r'\bTransformer\b', r'\bBERT\b', r'\bComputer Vision\b'
+    ]
+}
+
+# 소프트 스킬 패턴 (한국어/영어)
+_SOFT_SKILL_PATTERNS = [
+    r'\b커뮤니케이션\b', r'\bcommunication\b',
+    r'\b문제\s*해결\b', r'\bproblem.solving\b',
+    r'\b협업\b', r'\b팀워크\b', r'\bteamwork\b', r'\bcollaboration\b',
+    r'\b리더십\b', r'\bleadership\b',
+    r'\b자기\s*주도\b', r'\bself.driven\b', r'\bself.motivated\b',
+    r'\b분석력\b', r'\banalytical\b',
+    r'\b창의\b', r'\bcreativ\w*\b',
+    r'\b꼼꼼\b', r'\b세심\b', r'\battention.to.detail\b',
+    r'\b적응\b', r'\bflexibl\w*\b', r'\badaptab\w*\b',
+    r'\b주도\s*적\b', r'\bproactive\b',
+    r'\b발표\b', r'\bpresentation\b',
+    r'\b기획\b', r'\bplanning\b'
+]
+
+# 정규식 앞부분의 고정 문자열을 끊는 메타 문자
+_PATTERN_META_CHARS = frozenset('.*+?[](){}|^$')
+
+# IGNORECASE 매칭과 casefold 결과가 어긋나는 문자 (터키어 İ/ı) - 있으면 고정 문자열 사전 확인 생략
+_CASEFOLD_UNSAFE_CHARS = ('\u0130', '\u0131')
+
+
+def _literal_prefix(pattern: str) -> str:
+    """\\b 뒤에 오는 고정 문자열 (casefold) - 본문에 없으면 해당 패턴은 매칭될 수 없음"""
+    body = pattern[2:] if pattern.startswith(r'\b') else pattern
+    chars = []
+    i = 0
+    while i < len(body):
+        char = body[i]
+        if char == '\\':
+            # 이스케이프된 문자 그대로인 경우만 포함 (\s, \w 등 문자 클래스에서 중단)
+            if i + 1 < len(body) and body[i + 1] in '+.#/-':
+                chars.append(body[i + 1])
+                i += 2
+                continue
+            break
+        if char in _PATTERN_META_CHARS:
+            break
+        if i + 1 < len(body) and body[i + 1] in '*?{':
+            break  # 생략 가능한 문자는 고정 문자열에서 제외
+        chars.append(char)
+        i += 1
+    return ''.join(chars).casefold()
 
-    # 앞뒤 공백 제거
-    text = text.strip()
 
-    return text
+def _compile_skill_patterns(patterns) -> tuple:
+    """(고정 문자열, 컴파일된 패턴) 목록 - import 시 한 번만 컴파일 (패턴 순서 유지)"""
+    return tuple((_literal_prefix(pattern), re.compile(pattern, re.IGNORECASE)) for pattern in patterns)
+
+
+_HARD_SKILL_REGEXES = _compile_skill_patterns(
+    pattern for patterns in _HARD_SKILL_PATTERNS.values() for pattern in patterns
+)
+_SOFT_SKILL_REGEXES = _compile_skill_patterns(_SOFT_SKILL_PATTERNS)
+
+
+def _collect_matches(regexes, text: str, folded: Optional[str]) -> List[str]:
+    """
+    패턴 순서대로 매칭 결과 수집 (중복 제거, 첫 등장 순서 유지)
+
+    folded(casefold한 본문)가 주어지면 고정 문자열이 없는 패턴은 본문 스캔을 생략
+    """
+    found = {}
+    for literal, regex in regexes:
+        if folded is not None and literal not in folded:
+            continue
+        for match in regex.findall(text):
+            skill = match.strip()
+            if skill:
+                found.setdefault(skill, None)
+    return list(found)
 
 
 def extract_skills_from_text(text: str) -> Dict[str, List[str]]:
     """텍스트에서 스킬 추출"""
-    
-    # 하드 스킬 패턴
-    hard_skills_patterns = {
-        'programming_languages': [
-            r'\bPython\b', r'\bJava\b', r'\bJavaScript\b', r'\bTypeScript\b',
-            r'\bC\+\+\b', r'\bC#\b', r'\bGo\b', r'\bRust\b', r'\bKotlin\b',
-            r'\bSwift\b', r'\bRuby\b', r'\bPHP\b', r'\bScala\b', r'\bR\b'
-        ],
-        'frameworks': [
-            r'\bReact\b', r'\bVue\b', r'\bAngular\b', r'\bDjango\b', r'\bFlask\b',
-            r'\bFastAPI\b', r'\bSpring\b', r'\bNode\.js\b', r'\bExpress\b',
-            r'\bNext\.js\b', r'\bNuxt\b', r'\bNestJS\b', r'\bRails\b'
-        ],
-        'databases': [
-            r'\bMySQL\b', r'\bPostgreSQL\b', r'\bMongoDB\b', r'\bRedis\b',
-            r'\bElasticsearch\b', r'\bCassandra\b', r'\bOracle\b', r'\bSQLite\b',
-            r'\bDynamoDB\b', r'\bFirebase\b', r'\bBigQuery\b', r'\bSnowflake\b'
-        ],
-        'cloud': [
-            r'\bAWS\b', r'\bGCP\b', r'\bAzure\b', r'\bKubernetes\b', r'\bDocker\b',
-            r'\bTerraform\b', r'\bAnsible\b', r'\bJenkins\b', r'\bGitHub Actions\b',
-            r'\bCI/CD\b', r'\bEC2\b', r'\bS3\b', r'\bLambda\b'
-        ],
-        'data_tools': [
-            r'\bPandas\b', r'\bNumPy\b', r'\bScikit-learn\b', r'\bTensorFlow\b',
-            r'\bPyTorch\b', r'\bKeras\b', r'\bSpark\b', r'\bHadoop\b',
-            r'\bAirflow\b', r'\bKafka\b', r'\bTableau\b', r'\bPower BI\b',
-            r'\bLooker\b', r'\bDbt\b', r'\bMLflow\b'
-        ],
-        'ml_ai': [
-            r'\bLLM\b', r'\bNLP\b', r'\b딥러닝\b', r'\b머신러닝\b',
-            r'\bRAG\b', r'\bLangChain\b', r'\bOpenAI\b', r'\bGPT\b',
-            r'\bTransformer\b', r'\bBERT\b', r'\bComputer Vision\b'
-        ]
-    }
-    
-    # 소프트 스킬 패턴 (한국어/영어)
-    soft_skills_patterns = [
-        r'\b커뮤니케이션\b', r'\bcommunication\b',
-        r'\b문제\s*해결\b', r'\bproblem.solving\b',
-        r'\b협업\b', r'\b팀워크\b', r'\bteamwork\b', r'\bcollaboration\b',
-        r'\b리더십\b', r'\bleadership\b',
-        r'\b자기\s*주도\b', r'\bself.driven\b', r'\bself.motivated\b',
-        r'\b분석력\b', r'\banalytical\b',
-        r'\b창의\b', r'\bcreativ\w*\b',
-        r'\b꼼꼼\b', r'\b세심\b', r'\battention.to.detail\b',
-        r'\b적응\b', r'\bflexibl\w*\b', r'\badaptab\w*\b',
-        r'\b주도\s*적\b', r'\bproactive\b',
-        r'\b발표\b', r'\bpresentation\b',
-        r'\b기획\b', r'\bplanning\b'
-    ]
-    
-    text_lower = text.lower()
-    text_original = text
-    
-    extracted = {
-        'hard_skills': [],
-        'soft_skills': [],
+    folded = text.casefold()
+    if any(char in text for char in _CASEFOLD_UNSAFE_CHARS):
+        folded = None
+    return {
+        'hard_skills': _collect_matches(_HARD_SKILL_REGEXES, text, folded),
+        'soft_skills': _collect_matches(_SOFT_SKILL_REGEXES, text, folded),
         'tools': []
     }
-    
-    # 하드 스킬 추출
-    for category, patterns in hard_skills_patterns.items():
-        for pattern in patterns:
-            matches = re.findall(pattern, text_original, re.IGNORECASE)
-            for match in matches:
-                skill = match.strip()
-                if skill and skill not in extracted['hard_skills']:
-                    extracted['hard_skills'].append(skill)
-    
-    # 소프트 스킬 추출
-    for pattern in soft_skills_patterns:
-        matches = re.findall(pattern, text_original, re.IGNORECASE)
-        for match in matches:
-            skill = match.strip()
-            if skill and skill not in extracted['soft_skills']:
-                extracted['soft_skills'].append(skill)
-    
-    return extracted
 
 
 def parse_salary(salary_text: str) -> Dict[str, Any]:
@@ -320,21 +363,124 @@ def categorize_employment_type(text: str) -> str:
 
 
 class RateLimiter:
-    """요청 속도 제한기"""
+    """
+    요청 속도 제한기 (스레드 안전)
+    
+    기본은 최소 간격(min_interval) 유지, 서버가 X-RateLimit-* 헤더로 남은 요청 수를
+    알려주면 그 한도 안에서는 대기 없이 요청하고 소진 시 리셋 시각까지 대기
+    """
     
-    def __init__(self, calls_per_second: float = 1.0):
-        self.min_interval = 1.0 / calls_per_second
+    def __init__(self, calls_per_second: float = 1.0, min_interval: Optional[float] = None):
+        """
+        Args:
+            calls_per_second: 초당 요청 수
+            min_interval: 요청 간 최소 간격(초) - 지정하면 calls_per_second 대신 사용 (0이면 간격 없음)
+        """
+        self.min_interval = 1.0 / calls_per_second if min_interval is None else min_interval
         self.last_call_time = 0
+        self.remaining: Optional[int] = None  # 서버가 알려준 남은 요청 수 (None이면 모름)
+        self.reset_at = 0.0  # 요청 한도가 다시 채워지는 시각 (epoch 초)
+        self._lock = threading.Lock()
+    
+    def acquire(self, n: int = 1):
+        """요청 n개만큼 허용될 때까지 대기"""
+        with self._lock:
+            current_time = time.time()
+            
+            # 서버가 한도를 알려주었고 리셋 전이면 남은 한도 안에서 바로 통과
+            if self.remaining is not None and current_time < self.reset_at:
+                if self.remaining >= n:
+                    self.remaining -= n
+                    self.last_call_time = current_time
+                    return
+                time.sleep(self.reset_at - current_time)
+                self.remaining = None
+                self.last_call_time = time.time()
+                return
+            
+            self.remaining = None
+            elapsed = current_time - self.last_call_time
+            
+            if elapsed < self.min_interval:
+                time.sleep(self.min_interval - elapsed)
+            
+            self.last_call_time = time.time()
     
     def wait(self):
         """필요한 만큼 대기"""
+        self.acquire()
+    
+    def update_from_headers(self, headers):
+        """응답 헤더(X-RateLimit-Remaining/Reset, Retry-After)로 요청 한도 갱신"""
         current_time = time.time()
-        elapsed = current_time - self.last_call_time
         
-        if elapsed < self.min_interval:
-            time.sleep(self.min_interval - elapsed)
+        retry_after = _parse_retry_after(headers.get('Retry-After'), current_time)
+        if retry_after is not None:
+            with self._lock:
+                self.remaining = 0
+                self.reset_at = current_time + retry_after
+            return
         
-        self.last_call_time = time.time()
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+        if remaining is None or reset is None:
+            return
+        
+        try:
+            remaining = int(remaining)
+            reset = float(reset)
+        except ValueError:
+            return
+        
+        # 리셋 값은 epoch 초 또는 남은 초 두 형식이 모두 쓰임
+        with self._lock:
+            self.remaining = max(remaining, 0)
+            self.reset_at = reset if reset > 1e9 else current_time + reset
+
+
+def _parse_retry_after(value: Optional[str], current_time: float) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 초로 변환"""
+    if not value:
+        return None
+    
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - current_time, 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    비동기 토큰 버킷 요청 속도 제한기
+    
+    초당 rate개씩 토큰이 채워지고 최대 capacity개까지 모아 둘 수 있어,
+    동시에 요청하는 작업 수와 관계없이 전체 요청 속도를 rate 이하로 유지
+    """
+    
+    def __init__(self, rate: float = 2.0, capacity: int = 4):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self, n: int = 1):
+        """토큰 n개를 얻을 때까지 대기 (대기 중인 작업은 도착 순서대로 통과)"""
+        async with self._lock:
+            while True:
+                current_time = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (current_time - self.updated_at) * self.rate)
+                self.updated_at = current_time
+                
+                if self.tokens >= n:
+                    self.tokens -= n
+                    return
+                await asyncio.sleep((n - self.tokens) / self.rate)
 
 
 def chunk_list(lst: List, chunk_size: int) -> List[List]:
@@ -0,0 +1,78 @@
+"""
+HTTP 응답 디스크 캐시
+상세 페이지 본문을 (사이트, 공고 ID) 키로 SQLite에 저장해 재크롤링 시 요청을 생략
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+
+class ResponseCache:
+    """TTL 기반 응답 본문 캐시 (스레드 안전)"""
+
+    def __init__(self, db_path: Path, ttl: float = 86400):
+        """
+        Args:
+            db_path: 캐시 DB 파일 경로
+            ttl: 캐시 유효 시간 (초)
+        """
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                expires_at REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+        # 오래된 항목 정리 (만료 후 TTL 동안은 요청 실패 대비용으로 보관)
+        self.purge_expired(max_age=ttl)
+
+    def get(self, key: str, allow_stale: bool = False) -> Optional[bytes]:
+        """
+        캐시된 본문 조회
+
+        Args:
+            key: 캐시 키
+            allow_stale: True면 만료된 항목도 반환 (요청 실패 시 대체용)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+        body, expires_at = row
+        if not allow_stale and expires_at < time.time():
+            return None
+        return body
+
+    def set(self, key: str, body: bytes):
+        """본문 저장 (기존 항목은 덮어씀)"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                (key, body, time.time() + self.ttl)
+            )
+
+    def purge_expired(self, max_age: float = 0) -> int:
+        """만료 후 max_age초가 지난 항목 삭제, 삭제 개수 반환"""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM responses WHERE expires_at < ?", (time.time() - max_age,)
+            )
+        return cursor.rowcount
+
+    def close(self):
+        """DB 연결 종료"""
+        with self._lock:
+            self._conn.close()
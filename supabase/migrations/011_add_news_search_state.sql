@@ -0,0 +1,32 @@
+-- 011: news_search_state 테이블 추가
+-- 3차 크롤링: 회사별 뉴스 검색 첫 페이지 지문 (변화 없으면 다음 페이지 탐색 생략)
+
+-- 1. news_search_state 테이블 생성
+CREATE TABLE IF NOT EXISTS news_search_state (
+    id SERIAL PRIMARY KEY,
+    company_name VARCHAR(200) NOT NULL UNIQUE,
+
+    -- 첫 페이지 기사 URL 목록의 해시 (blake2b, hex)
+    first_page_fingerprint VARCHAR(64),
+
+    -- 메타
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- 2. RLS 정책 (Supabase)
+ALTER TABLE news_search_state ENABLE ROW LEVEL SECURITY;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_policies
+        WHERE tablename = 'news_search_state' AND policyname = 'Allow service role full access on news_search_state'
+    ) THEN
+        CREATE POLICY "Allow service role full access on news_search_state"
+        ON news_search_state FOR ALL USING (true) WITH CHECK (true);
+    END IF;
+END $$;
+
+-- 3. 코멘트
+COMMENT ON TABLE news_search_state IS '회사별 뉴스 검색 상태 (증분 크롤링용)';
+COMMENT ON COLUMN news_search_state.first_page_fingerprint IS '검색 결과 첫 페이지 기사 URL 목록의 해시';